@@ -8,16 +8,173 @@ Creator:    Fidel Quezada Guzman
 Cr. Date:   10/30/2014
 -------------------------------------------------------------------------------
 """
+# asyncio, http.client, zipfile & send2trash are imported where used (keeps App start-up fast)
+import ast
 import glob
+import importlib
 import json
 import shutil
 import time
 import os
 import logging
 import re
+import hashlib
+import copy
+import threading
+import weakref
+import types
+import queue
+import socket
+import zlib
+from fnmatch import fnmatch
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
 from datetime import datetime
-import send2trash
-from constants import Flags, Paths, FwConstants, TestCases, ResultCounters, InstrumentInfo
+from constants import Flags, Paths, FwConstants, TestCases, InstrumentInfo, InstrumentPool
+
+
+class TestCancelled(Exception):
+    """ Raised at a cancellation point once the Test Run has been stopped """
+
+
+class CancellationToken(threading.Event):
+    """
+    Cancellation Token used as the stop_event of a Test Run (still a threading.Event: wait/is_set/clear work)
+    Class in Charge of:
+        - Running cancel callbacks (Ex: kill a child process, drop a socket) the moment the token is set
+        - Holding bound method callbacks weakly, so objects that registered one can still be collected
+    """
+    def __init__(self):
+        super().__init__()
+        self.callbacks = {}                                                 # Local Variables (handle: callback)
+        self.callback_lock = threading.Lock()
+        self.next_handle = 0
+
+    def set(self):
+        """ Sets the token & runs every registered cancel callback (on the calling thread) """
+        with self.callback_lock:
+            super().set()
+            callbacks = list(self.callbacks.values())
+        for callback in callbacks:
+            self.call(callback)
+
+    @staticmethod
+    def call(callback):
+        """ Runs one cancel callback, a failing callback does not stop the others """
+        if isinstance(callback, weakref.WeakMethod):
+            callback = callback()
+            if callback is None:                                            # Owner already collected
+                return
+        try:
+            callback()
+        except Exception as e:
+            print(f"Cancel callback error: {e}")
+
+    def register(self, callback):
+        """
+        Registers a callback run every time the token is set (also right away if it already is)
+        The callback stays registered across clear(), until unregister
+        :param callback: Callable w/o arguments, must be safe to call from any thread
+        :return: Handle for unregister
+        """
+        if isinstance(callback, types.MethodType):
+            callback = weakref.WeakMethod(callback)
+        with self.callback_lock:
+            for dead in [handle for handle, ref in self.callbacks.items()         # Drop collected owners
+                         if isinstance(ref, weakref.WeakMethod) and ref() is None]:
+                del self.callbacks[dead]
+            self.next_handle += 1
+            self.callbacks[self.next_handle] = callback
+            handle, already_set = self.next_handle, self.is_set()
+        if already_set:
+            self.call(callback)
+        return handle
+
+    def unregister(self, handle):
+        """ Removes a cancel callback (no-op if handle is None or already removed) """
+        with self.callback_lock:
+            self.callbacks.pop(handle, None)
+
+
+class ResultRecord(NamedTuple):
+    """ Pass/Fail counts & time spent for 1 test (summed over its runs) """
+    passed: int
+    failed: int
+    seconds: float
+
+
+class ResultStore:
+    """
+    Result Store Class holding the Pass/Fail counts of a Test Run
+    Class in Charge of:
+        - Atomic increments (safe w/ suites running in parallel)
+        - Partitioning results per instrument (partition shares the run's records & lock)
+        - Keeping the time spent per test
+        - Summarizing only the tests selected for the run
+        - Holding the test case names batch generated for the run (shared by its partitions)
+    """
+    default_store = None                                        # Store used outside of a Test Run
+
+    def __init__(self, run_id=None):
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")     # Local Variables
+        self.instrument = None                                                  # Partition of this view
+        self.records = {}                                                       # (instrument, name): [pass, fail, s]
+        self.lock = threading.Lock()
+        self.test_case_names = {}                                               # QtExecutionPrefix: test case name
+
+    @classmethod
+    def default(cls):                                           # Shared store for objects created outside a run
+        if cls.default_store is None:
+            cls.default_store = cls()
+        return cls.default_store
+
+    @staticmethod
+    def result_name(test_case):                                 # Results name of a TestCases member
+        return test_case.value[7] or test_case.name.lower()
+
+    def partition(self, instrument):
+        """ Returns a view of this store that records results under instrument """
+        view = copy.copy(self)
+        view.instrument = instrument
+        return view
+
+    def add(self, name, passed=0, failed=0, seconds=0.0):
+        """ Adds Pass/Fail counts & time spent to a test (of this partition) """
+        with self.lock:
+            record = self.records.setdefault((self.instrument, name), [0, 0, 0.0])
+            record[0] += passed
+            record[1] += failed
+            record[2] += seconds
+
+    def get(self, name, instrument=None):
+        """
+        Returns the ResultRecord of a test
+        :param name: Results name of the test
+        :param instrument: Instrument partition, None for this view's partition (all instruments on the run store)
+        """
+        instrument = instrument or self.instrument
+        with self.lock:
+            records = [record for (record_instrument, record_name), record in self.records.items()
+                       if record_name == name and instrument in (None, record_instrument)]
+        return ResultRecord(sum(r[0] for r in records), sum(r[1] for r in records), sum(r[2] for r in records))
+
+    def instruments(self):                                      # Instruments w/ results in this run
+        with self.lock:
+            return sorted({instrument for instrument, _ in self.records if instrument is not None})
+
+    def summary(self, test_cases):
+        """
+        Returns the results of the tests that ran (1 line per test)
+        :param test_cases: TestCases members selected for the run
+        """
+        lines = []
+        for test_case in test_cases:
+            record = self.get(self.result_name(test_case))
+            if record.passed != 0 or record.failed != 0:                    # Print only if the test ran
+                lines.append(f"{test_case.value[1]}\t\t\t\t -  Pass: {record.passed}"
+                             f"\t\t -  Fail: {record.failed}\t\t -  Time: {record.seconds:.1f}s")
+        return "\n".join(lines)
 
 
 class AutoTestFramework:
@@ -28,12 +185,25 @@ class AutoTestFramework:
             self.paths = Paths
             self.const = FwConstants
             self.tests = TestCases
-            self.results = ResultCounters
+            self.results = ResultStore.default()                   # Rebound to the run's store by the runner
             self.inst_info = InstrumentInfo
         except Exception as e:
             print(f"Initialization error: {e}")
             raise  # Re-raise the exception to signal initialization failure
 
+    def check_cancelled(self):                                      # Cancellation point
+        if self.stop_event.is_set():
+            raise TestCancelled(f"{type(self).__name__} cancelled")
+
+    def on_cancel(self, callback):                                  # Run callback as soon as stop_event is set
+        register = getattr(self.stop_event, "register", None)      # Plain threading.Event: polled instead
+        return register(callback) if register is not None else None
+
+    def cancel_callback_remove(self, handle):                       # Undo on_cancel
+        unregister = getattr(self.stop_event, "unregister", None)
+        if unregister is not None:
+            unregister(handle)
+
 
 class TestSuiteInit(AutoTestFramework):
     """
@@ -130,15 +300,51 @@ class TestSuiteQtDependencies(AutoTestFramework):
         return str(ver_string)
 
     def generate_test_case(self):                                           # Generate version dependent test case(s)
+        if self.tc_name in self.results.test_case_names:                    # Already generated by run's batch
+            return
         ver_string = self.report_build_version()
         self.test_gen.generate_test_file(self.template_name, self.tc_name, ver_string)
 
     def get_test_case(self):
-        ver_string = self.report_build_version()
-        test_case = f"{self.tc_name}{ver_string}"
+        test_case = self.results.test_case_names.get(self.tc_name)          # Precomputed by run's batch
+        if test_case is None:
+            ver_string = self.report_build_version()
+            test_case = f"{self.tc_name}{ver_string}"
         return str(test_case)
 
 
+class TestSuiteBatchGeneration(AutoTestFramework):
+    """
+    Batch Class used to generate the test files of a whole TestCases selection before its Test Suites run
+    Class in Charge of:
+        - Resolving the build version once for the whole selection
+        - Rendering every needed .tst file in one pass (worker pool for large selections)
+        - Publishing the generated test case names on the run's ResultStore, looked up by TestSuiteQtDependencies
+    """
+    def __init__(self, stop_event):
+        super().__init__(stop_event)
+        self.builds = Builds(self.stop_event)                                       # Class Instances
+        self.test_gen = TestGeneration(self.stop_event)
+
+    def run(self, test_cases, run_results):                                 # Execute batch generation
+        """
+        Generates the .tst files of test_cases & publishes their names on run_results (the run's ResultStore)
+        Suites of test cases left out (or all of them if generation failed) fall back to their own generation
+        """
+        run_results.test_case_names.clear()
+        if not self.test_gen.qt_templates(test_cases):                      # No Qt test case: no build needed
+            return True
+        try:
+            ver_string = str(self.builds.get_win_build_ver())
+            test_case_names = self.test_gen.generate_test_files(test_cases, ver_string)
+            run_results.test_case_names.update(test_case_names)
+            print(f"Generated {len(test_case_names)} test case(s) for build version {ver_string}")
+            return True
+        except Exception as e:
+            print(f"An error occurred during TestSuiteBatchGeneration run function: {e}")
+            return False
+
+
 class TestSuiteQtExecution(AutoTestFramework):
     """
     Execution Class used to Generate & Run the Qt test automatically
@@ -157,6 +363,7 @@ class TestSuiteQtExecution(AutoTestFramework):
         self.jira_num = jira_num
         self.seconds = seconds
         self.results_prefix = results_prefix
+        self.run_seconds = 0.0
         self.test_gen = TestGeneration(self.stop_event)                         # Class Instances
         self.logging = Logging(self.stop_event)
         self.post_run = TestSuitePostRun(self.stop_event)
@@ -164,19 +371,16 @@ class TestSuiteQtExecution(AutoTestFramework):
 
     def run_qt_headless(self):                                              # Run QtTest App on PC in headless mode
         test_case = self.qt_dep.get_test_case()
-        self.test_gen.run_qt_test_suite(test_case)
-        time.sleep(5)
+        start_time = time.time()
+        result = self.test_gen.run_qt_test_suite(test_case)
+        self.logging.wait_for_log(test_case, start_time)                   # Wait until its log is written
+        self.run_seconds = time.time() - start_time
+        return result
 
     def update_results(self):                                                               # Get Pass/Fail Count & Log
         test_case = self.qt_dep.get_test_case()
-        pass_counter = getattr(self.results, f"{self.results_prefix}_pass")                 # Dynamically get counters
-        fail_counter = getattr(self.results, f"{self.results_prefix}_fail")
-
-        pass_counter, fail_counter, test_log = self.logging.get_test_result(test_case)      # Update values (locally)
-
-        setattr(self.results, f"{self.results_prefix}_pass", pass_counter)                 # Update counters dynamically
-        setattr(self.results, f"{self.results_prefix}_fail", fail_counter)
-
+        pass_counter, fail_counter, test_log = self.logging.get_test_result(test_case)
+        self.results.add(self.results_prefix, pass_counter, fail_counter, self.run_seconds)   # Atomic, per instrument
         return test_log
 
     def update_xray(self):                                                  # Update Xray/Jira Test Case
@@ -185,9 +389,9 @@ class TestSuiteQtExecution(AutoTestFramework):
             self.logging.report_to_jira(test_log, self.jira_name, self.jira_num)
 
     def get_exec_results(self):                                             # Return Perfect or Failed Execution
-        if self.results.basic_fail > 0:
+        if self.results.get(self.results_prefix).failed > 0:
             print(f"{self.jira_name} Failed!")
-            time.sleep(5)
+            self.post_run.delay(self.const.FAIL_DELAY)                     # Continues once instrument is up
             return False
         else:
             self.post_run.delay(self.seconds)
@@ -198,8 +402,12 @@ class TestSuiteQtExecution(AutoTestFramework):
         try:
             self.qt_dep.generate_test_case()
             self.run_qt_headless()
+            self.check_cancelled()
             self.update_xray()
-            self.get_exec_results()
+            return self.get_exec_results()
+        except TestCancelled as e:
+            print(f"TestSuiteQtExecution run stopped: {e}")
+            return False
         except Exception as e:
             print(f"An error occurred during TestSuiteQtExecution run function: {e}")
             return False
@@ -245,8 +453,12 @@ class TestSuiteFwUpdateExecution(AutoTestFramework):
         try:
             self.generate_fw_update_test_case()
             self.test_exec.run_qt_headless()
+            self.check_cancelled()
             self.test_exec.update_xray()
-            self.test_exec.get_exec_results()
+            return self.test_exec.get_exec_results()
+        except TestCancelled as e:
+            print(f"TestSuiteFwUpdateExecution run stopped: {e}")
+            return False
         except Exception as e:
             print(f"An error occurred during TestSuiteFwUpdateDependencies run function: {e}")
             return False
@@ -256,17 +468,126 @@ class TestSuitePostRun(AutoTestFramework):
     """
     Post Run Class used to run dependencies for instrument needed after specific runs
     Class in Charge of:
-        - Adding extra Delays
-        - Running TestApp on Instrument (requires BOOT_TIME_DELAY delay right after)
+        - Adding extra Delays (ended early once the instrument is ready)
+        - Running TestApp on Instrument (waits for it to go down, then up to BOOT_TIME_DELAY in total to be ready)
+    Both raise TestCancelled once stop_event is set, so no further commands reach the instrument.
     """
-    @staticmethod
-    def delay(seconds):
-        time.sleep(seconds)
+    def __init__(self, stop_event, instrument_control=None):
+        super().__init__(stop_event)
+        self.instrument_control = instrument_control                            # Local Variables
+        self.readiness = InstrumentReadiness(self.stop_event, self.instrument_control)     # Class Instances
+
+    def delay(self, seconds):
+        self.readiness.wait_ready(seconds)
+        self.check_cancelled()
 
     def run_testapp_on_instrument(self, run):                               # Run TestApp on Instrument
         if run:
+            self.check_cancelled()
             self.instrument_control.run_testapp_on_instrument()
-            time.sleep(self.const.BOOT_TIME_DELAY)
+            start_time = time.time()
+            self.readiness.wait_down(self.const.RESTART_DOWN_TIMEOUT)          # Old app may still answer probes
+            self.readiness.wait_ready(self.const.BOOT_TIME_DELAY - (time.time() - start_time))
+            self.check_cancelled()
+
+
+class InstrumentReadiness(AutoTestFramework):
+    """
+    Readiness Class used to wait for the instrument to be up instead of sleeping a fixed delay
+    Class in Charge of:
+        - Polling the instrument (TestApp port open, ping command, log marker) w/ exponential backoff
+        - Giving up at a ceiling (Ex: BOOT_TIME_DELAY)
+        - Waiting for the instrument to go down first when it restarts (Ex: switching to TestApp)
+        - Returning as soon as stop_event is set
+    Probes are used when configured: TESTAPP_PORT (& a known instrument IP), instrument_control, READY_LOG_MARKER.
+    With none configured, the wait falls back to the full ceiling (still interruptible).
+    """
+    def __init__(self, stop_event, instrument_control=None):
+        super().__init__(stop_event)
+        self.instrument_control = instrument_control                            # Local Variables (ping probe)
+
+    def port_open(self):
+        """ Returns True if the TestApp port of the instrument accepts connections """
+        with socket.create_connection((str(self.inst_info.ip), self.const.TESTAPP_PORT), timeout=1):
+            return True
+
+    def ping(self):
+        """ Returns True if the instrument answers a command """
+        return bool(self.instrument_control.read_server_ip_address())
+
+    def log_marker(self):
+        """ Returns True if the ready marker has been written to the instrument log """
+        log_file, marker = self.const.READY_LOG_MARKER
+        with open(log_file, "rb") as file:
+            file.seek(max(os.path.getsize(log_file) - 64 * 1024, 0))          # Only the tail of the log
+            return marker.encode() in file.read()
+
+    def get_probes(self):
+        """ Returns the readiness probes available w/ the current configuration """
+        probes = []
+        if self.const.TESTAPP_PORT and self.inst_info.ip:
+            probes.append(self.port_open)
+        if self.instrument_control is not None:
+            probes.append(self.ping)
+        if self.const.READY_LOG_MARKER:
+            probes.append(self.log_marker)
+        return probes
+
+    def is_ready(self, probes):
+        """ Returns True if every probe passes """
+        for probe in probes:
+            try:
+                if not probe():
+                    return False
+            except Exception as e:
+                if self.flags.DEBUG_MODE:
+                    print(f"Readiness probe {probe.__name__}: {e}")
+                return False
+        return True
+
+    def wait_down(self, ceiling):
+        """
+        Waits until the instrument stops answering (restart begun), at most ceiling seconds
+        :param ceiling: Seconds to wait at most, also the delay used when no probe is configured
+        :return: True if seen down, False if ceiling reached or stop_event set
+        """
+        probes = self.get_probes()
+        deadline = time.time() + ceiling
+        while self.is_ready(probes):                                        # No probes: ready, plain delay
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                if probes and self.flags.DEBUG_MODE:
+                    print(f"Instrument not seen going down within {ceiling}s")
+                return False
+            if self.stop_event.wait(min(self.const.READY_POLL_MIN, remaining)):
+                return False
+        return True
+
+    def wait_ready(self, ceiling):
+        """
+        Waits until the instrument is ready, at most ceiling seconds
+        :param ceiling: Seconds to wait at most
+        :return: True if ready, False if ceiling reached or stop_event set
+        """
+        if ceiling <= 0:
+            return True
+        probes = self.get_probes()
+        if not probes:                                                      # Nothing to poll: plain delay
+            return not self.stop_event.wait(ceiling)
+
+        deadline = time.time() + ceiling
+        backoff = self.const.READY_POLL_MIN
+        while not self.is_ready(probes):
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                print(f"Instrument not ready after {ceiling}s")
+                return False
+            if self.stop_event.wait(min(backoff, remaining)):
+                return False
+            backoff = min(backoff * 2, self.const.READY_POLL_MAX)
+        if self.flags.DEBUG_MODE:
+            print(f"Instrument ready after {ceiling - max(deadline - time.time(), 0):.1f}s")
+        return True
 
 
 class TestSuiteMiscellaneous(AutoTestFramework):
@@ -301,10 +622,469 @@ class TestSuiteMiscellaneous(AutoTestFramework):
 
     def get_fw_versions(self):                          # Gets Instrument FW vers & sets to GUI variables
         test_case = self.qt_dep.get_test_case()
-        self.logging.get_fw_versions(test_case)
+        for field, version in self.logging.get_fw_versions(test_case).items():
+            setattr(self.inst_info, field, version)                 # This suite's (bound) instrument state
+
+
+class TemplateEngine(AutoTestFramework):
+    """
+    Template Class used to render .tst test files from 1template/config templates
+    Class in Charge of:
+        - Compiling each template once into literal segments & placeholders (cached until the template mtime changes)
+        - Rendering all placeholders in a single pass
+        - Skipping the output write when the rendered content matches the file already on disk
+    """
+    compiled = {}                                   # (template_file, placeholders): (mtime_ns, size, segments)
+    lock = threading.Lock()
+
+    def compile(self, template_file, placeholders):
+        """
+        Returns the compiled template: [literal, placeholder, literal, ..., literal]
+        :param template_file: Template to compile
+        :param placeholders: Strings of the template to be replaced when rendering
+        """
+        placeholders = tuple(sorted(set(placeholders), key=len, reverse=True))    # Longest match first
+        stat = os.stat(template_file)
+        key = (template_file, placeholders)
+        with self.lock:
+            cached = self.compiled.get(key)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        with open(template_file, "r") as file:
+            content = file.read()
+        pattern = "(" + "|".join(re.escape(placeholder) for placeholder in placeholders) + ")"
+        segments = re.split(pattern, content) if placeholders else [content]
+        with self.lock:
+            self.compiled[key] = (stat.st_mtime_ns, stat.st_size, segments)
+        if self.flags.DEBUG_MODE:
+            print(f"Compiled template {template_file}: {len(segments) // 2} placeholder(s)")
+        return segments
+
+    def render(self, template_file, replacements):
+        """
+        Returns the template content w/ every placeholder replaced, in one pass
+        :param template_file: Template to render
+        :param replacements: Dict of placeholder: replacement
+        """
+        segments = list(self.compile(template_file, replacements))
+        segments[1::2] = [replacements[placeholder] for placeholder in segments[1::2]]
+        return "".join(segments)
+
+    @staticmethod
+    def write_if_changed(output_file, content):
+        """
+        Writes content to output_file unless the file already holds the same content (same hash)
+        :return: True if written, False if unchanged
+        """
+        try:
+            with open(output_file, "r") as file:
+                if hashlib.sha1(file.read().encode()).digest() == hashlib.sha1(content.encode()).digest():
+                    return False
+        except OSError:
+            pass
+        with open(output_file, "w") as file:
+            file.write(content)
+        return True
+
+
+class FwBinRecord(NamedTuple):
+    """
+    Firmware binary name parsed once into its parts, Ex: Instr_MainBoard_FW_1_2_345_abc.bin
+        - prefix: Tokens before the version (Instr_MainBoard_FW)
+        - board: Board token (MainBoard)
+        - version: Major_Minor_Build (1_2_345), "" if the name has no version
+        - suffix: Tokens from the version on (1_2_345_abc)
+    """
+    file_name: str
+    tokens: tuple
+    prefix: str
+    board: str
+    version: str
+    suffix: str
+
+
+class FwBinIndex(AutoTestFramework):
+    """
+    Index Class of the firmware binaries (.bin) found in the deploy dir
+    Class in Charge of:
+        - Scanning the deploy dir once (again only when the dir changes) instead of one glob per binary
+        - Parsing every .bin name once into a FwBinRecord
+        - Answering lookups by prefix/board & version, or by glob pattern
+    """
+    def __init__(self, stop_event, bin_dir=None):
+        super().__init__(stop_event)
+        self.bin_dir = bin_dir or str(self.paths.DEPLOY.value)              # Local Variables
+        self.dir_mtime = None
+        self.records = []
+        self.by_prefix = {}
+
+    @staticmethod
+    def parse(file_name):
+        """ Returns the FwBinRecord of a .bin file name """
+        tokens = tuple(file_name.split('.')[0].split('_'))
+        start = next((i for i in range(1, len(tokens) - 2)
+                      if all(token.isdigit() for token in tokens[i:i + 3])), len(tokens))
+        return FwBinRecord(file_name, tokens, '_'.join(tokens[:start]), tokens[1] if len(tokens) > 1 else "",
+                           '_'.join(tokens[start:start + 3]), '_'.join(tokens[start:]))
+
+    def scan(self):
+        """ (Re)scans the bin dir if it changed since the last scan """
+        try:
+            dir_mtime = os.stat(self.bin_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and dir_mtime == self.dir_mtime:
+            return
+
+        with os.scandir(self.bin_dir) as entries:
+            self.records = [self.parse(entry.name) for entry in entries
+                            if entry.is_file() and entry.name.endswith(self.const.FW_FILE_TYPE)]
+        self.by_prefix = {}
+        for record in self.records:
+            self.by_prefix.setdefault(record.prefix, []).append(record)
+        self.dir_mtime = dir_mtime
+        if self.flags.DEBUG_MODE:
+            print(f"Indexed {len(self.records)} firmware binaries in {self.bin_dir}")
+
+    def find(self, prefix=None, version=None, board=None):
+        """
+        Returns the records matching every given criteria
+        :param prefix: Tokens before the version, Ex: Instr_MainBoard_FW
+        :param version: Major_Minor_Build, Ex: 1_2_345
+        :param board: Board token, Ex: MainBoard
+        """
+        self.scan()
+        records = self.by_prefix.get(prefix, []) if prefix is not None else self.records
+        return [record for record in records
+                if (version is None or record.version == version) and (board is None or record.board == board)]
+
+    def match(self, pattern):
+        """ Returns the records whose file name matches a glob pattern, Ex: Instr_MainBoard_FW_1_2_3_*.bin """
+        self.scan()
+        return [record for record in self.records if fnmatch(record.file_name, pattern)]
+
+
+class QtRunner(AutoTestFramework):
+    """
+    Runner Class used to execute the Qt TestApp (or any command) as a child process
+    Class in Charge of:
+        - Running the child w/ cwd= its dir (no process-wide chdir)
+        - Streaming stdout/stderr into the log as lines arrive
+        - Enforcing a timeout & killing the child as soon as stop_event is set
+    """
+    POLL_INTERVAL = 0.1                                                 # Seconds between stop_event checks
+                                                                        # (only w/o a CancellationToken)
+    DRAIN_TIMEOUT = 5                                                   # Seconds to drain output after exit
+
+    async def pump(self, stream, stream_name, name):
+        """ Logs every line of a child stream as it arrives """
+        async for line in stream:
+            text = line.decode(errors="replace").rstrip()
+            logging.info(f"{name} {stream_name}: {text}")
+            if self.flags.DEBUG_MODE:
+                print(f"{name} {stream_name}: {text}")
+
+    async def watch_stop(self):
+        """ Returns once stop_event is set (woken by its cancel callback, polled for a plain Event) """
+        import asyncio
+        loop = asyncio.get_running_loop()
+        stopped = asyncio.Event()
+
+        def wake():                                                     # Runs on the thread that set the token
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(stopped.set)
+
+        handle = self.on_cancel(wake)
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    await asyncio.wait_for(stopped.wait(), None if handle else self.POLL_INTERVAL)
+                except asyncio.TimeoutError:                         # Not TimeoutError before 3.11
+                    pass
+        finally:
+            self.cancel_callback_remove(handle)
+
+    async def execute(self, args, cwd, timeout, name):
+        """ Runs args until exit, timeout or stop, returns (exit code, status) """
+        import asyncio
+        process = await asyncio.create_subprocess_exec(*args, cwd=cwd, stdout=asyncio.subprocess.PIPE,
+                                                       stderr=asyncio.subprocess.PIPE)
+        pumps = asyncio.gather(self.pump(process.stdout, "stdout", name), self.pump(process.stderr, "stderr", name))
+        wait_task = asyncio.create_task(process.wait())
+        stop_task = asyncio.create_task(self.watch_stop())
+        done, _ = await asyncio.wait({wait_task, stop_task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        stop_task.cancel()
+
+        if wait_task in done:
+            status = "completed"
+        else:                                                                   # Timed out or stopped: kill child
+            status = "stopped" if stop_task in done else "timeout"
+            process.kill()
+            await wait_task
+        _, pending = await asyncio.wait({pumps}, timeout=self.DRAIN_TIMEOUT)     # Grandchild may hold the pipes
+        for task in pending:
+            task.cancel()
+        return process.returncode, status
+
+    def run(self, args, cwd=None, timeout=None, name=""):
+        """
+        Runs a child process to completion (blocking the calling thread only)
+        :param args: Executable & arguments
+        :param cwd: Dir the child runs in
+        :param timeout: Seconds before the child is killed, None for no timeout
+        :param name: Name used to tag log lines
+        :return: (exit code, "completed" | "timeout" | "stopped")
+        """
+        import asyncio
+        return asyncio.run(self.execute(args, cwd, timeout, name or os.path.basename(args[0])))
+
+
+class SuiteRun(NamedTuple):
+    """ Outcome of one Test Suite run on one instrument """
+    endpoint: str
+    suite_name: str
+    passed: bool
+    duration: float
+
+
+class TestScheduler(AutoTestFramework):
+    """
+    Scheduler Class used to spread the selected Test Suites across a pool of instruments
+    Class in Charge of:
+        - Running 1 worker per instrument endpoint, each pulling the next Test Suite from a shared queue
+        - Giving every worker its own instrument state (InstrumentInfo) & result partition (ResultStore)
+        - Combining the runs of every worker into one report
+    A worker stops pulling Test Suites once one fails on its instrument, the other workers carry on.
+    Qt Test Suites only target the worker's instrument once FwConstants.QT_INSTRUMENT_ARG is set to the real
+    per-instrument FwTestApp option (None by default: every worker's Qt TestApp finds the instrument itself).
+    Workers share the deploy, config & log dirs: each Test Suite runs once per run & its .tst & log files are
+    named after its test case.
+    """
+    def __init__(self, stop_event, endpoints=None):
+        super().__init__(stop_event)
+        self.endpoints = list(endpoints if endpoints is not None else InstrumentPool.ENDPOINTS)    # Local Variables
+        self.worker_state = {}                                  # endpoint: (InstrumentInfo, ResultStore partition)
+
+    @staticmethod
+    def bind_instrument(suite, inst_info, results):
+        """ Points a Test Suite & every framework object it holds at a worker's own state """
+        pending, seen = [suite], set()
+        while pending:
+            obj = pending.pop()
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            obj.inst_info = inst_info
+            obj.results = results
+            pending.extend(value for value in vars(obj).values() if isinstance(value, AutoTestFramework))
+        return suite
+
+    def worker(self, endpoint, jobs, runs, lock, run_results):
+        """ Runs Test Suites from jobs on one instrument until jobs is empty, a suite fails or stop is set """
+        inst_info = InstrumentInfo()                                    # Instance attrs shadow global class
+        inst_info.ip = endpoint
+        results = run_results.partition(endpoint)
+        self.worker_state[endpoint] = (inst_info, results)
+
+        while not self.stop_event.is_set():
+            try:
+                suite_class = jobs.get_nowait()
+            except queue.Empty:
+                break
+            suite = self.bind_instrument(suite_class(self.stop_event), inst_info, results)
+            start_time = time.time()
+            try:
+                passed = bool(suite.run())
+            except Exception as e:
+                print(f"{suite_class.__name__} on {endpoint} raised: {e}")
+                passed = False
+            with lock:
+                runs.append(SuiteRun(endpoint, suite_class.__name__, passed, time.time() - start_time))
+            if not passed:
+                print(f"{suite_class.__name__} failed on {endpoint}, worker stopping")
+                break
+
+    def run(self, suite_classes, run_results=None):
+        """
+        Runs the Test Suites across every instrument endpoint
+        :param suite_classes: Test Suite classes to run, in order
+        :param run_results: ResultStore of the run (partitioned per endpoint), None for a new one
+        :return: List of SuiteRun
+        """
+        run_results = run_results or ResultStore()
+        jobs = queue.Queue()
+        for suite_class in suite_classes:
+            jobs.put(suite_class)
+        runs, lock = [], threading.Lock()
+        self.worker_state = {}
+
+        threads = [threading.Thread(target=self.worker, args=(endpoint, jobs, runs, lock, run_results),
+                                    name=f"instr-{endpoint}")
+                   for endpoint in self.endpoints]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return runs
+
+    @staticmethod
+    def format_report(runs):
+        """ Returns the combined report of a scheduler run (per instrument & totals) """
+        lines = []
+        for endpoint in sorted({run.endpoint for run in runs}):
+            endpoint_runs = [run for run in runs if run.endpoint == endpoint]
+            passed = sum(run.passed for run in endpoint_runs)
+            lines.append(f"{endpoint}\t\t -  Pass: {passed}\t\t -  Fail: {len(endpoint_runs) - passed}")
+            lines.extend(f"\t{run.suite_name}: {'Pass' if run.passed else 'Fail'} ({run.duration:.1f}s)"
+                         for run in endpoint_runs)
+        passed = sum(run.passed for run in runs)
+        lines.append(f"Total\t\t -  Pass: {passed}\t\t -  Fail: {len(runs) - passed}")
+        return "\n".join(lines)
+
+
+class SuiteRegistry(AutoTestFramework):
+    """
+    Registry of the Test Suites found in test_suites (cached in auto-test/suite_registry.json)
+    Class in Charge of:
+        - Finding the AutoTestFramework subclasses of every module by parsing it (ast), w/o importing it
+          (also through base classes of sibling modules, whatever is imported already)
+        - Re-parsing only the modules whose mtime/size changed since the cached scan
+        - Resolving a TestCases name to its suite class (case-insensitive, "_" ignored: connect -> Connect)
+        - Importing a suite module only when one of its suites is first resolved
+    The registry is loaded once & shared by every instance
+    """
+    registry = None                                 # {"version", "files": {file: {mtime, size, classes}}}
+    VERSION = 2                                     # Cached entries: classes = [[class name, [base names]]]
+    lock = threading.RLock()
+
+    def __init__(self, stop_event, suite_dir=None):
+        super().__init__(stop_event)
+        self.suite_dir = suite_dir or str(self.paths.TEST_SUITES.value)     # Local Variables
+
+    def load(self):
+        """ Returns the registry, reading it from disk on first use (an older format is discarded) """
+        with self.lock:
+            if SuiteRegistry.registry is None:
+                try:
+                    with open(self.paths.SUITE_REGISTRY.value, "r") as file:
+                        SuiteRegistry.registry = json.load(file)
+                except (OSError, ValueError):
+                    SuiteRegistry.registry = None
+                registry = SuiteRegistry.registry
+                if not isinstance(registry, dict) or registry.get("version") != self.VERSION:
+                    SuiteRegistry.registry = {"version": self.VERSION, "files": {}}
+            return SuiteRegistry.registry
+
+    def save(self):
+        """ Writes the registry to disk (atomically, via a temp file) """
+        with self.lock:
+            registry_file = self.paths.SUITE_REGISTRY.value
+            try:
+                os.makedirs(os.path.dirname(registry_file) or ".", exist_ok=True)
+                with open(registry_file + ".tmp", "w") as file:
+                    json.dump(self.load(), file)
+                os.replace(registry_file + ".tmp", registry_file)
+            except OSError as e:
+                print(f"SuiteRegistry: Error saving {registry_file}: {e}")
+
+    @staticmethod
+    def framework_class_names():                # Names of AutoTestFramework & its subclasses defined in this module
+        names, pending = set(), [AutoTestFramework]
+        while pending:
+            framework_class = pending.pop()
+            if framework_class.__module__ == AutoTestFramework.__module__:
+                names.add(framework_class.__name__)
+                pending.extend(framework_class.__subclasses__())
+        return names
+
+    @staticmethod
+    def parse(file_path):
+        """ Returns [[class name, [base names]]] of every top level class of a module (depends on its content only) """
+        with open(file_path, "r", encoding="utf-8") as file:
+            tree = ast.parse(file.read(), file_path)
+        return [[node.name, [base.id if isinstance(base, ast.Name) else base.attr
+                             for base in node.bases if isinstance(base, (ast.Name, ast.Attribute))]]
+                for node in tree.body if isinstance(node, ast.ClassDef)]
+
+    def scan(self):
+        """ Returns {module file: {mtime, size, classes}}, re-parsing only new or changed modules """
+        with self.lock:
+            registry = self.load()
+            files = {}
+            with os.scandir(self.suite_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".py") or entry.name.startswith("__") or not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                    cached = registry["files"].get(entry.name)
+                    if cached and cached["mtime"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                        files[entry.name] = cached
+                        continue
+                    try:
+                        classes = self.parse(entry.path)
+                    except (OSError, SyntaxError, ValueError) as e:
+                        print(f"SuiteRegistry: Error parsing {entry.name}: {e}")
+                        classes = []
+                    files[entry.name] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "classes": classes}
+            if files != registry["files"]:
+                registry["files"] = files
+                self.save()
+            return files
+
+    def suites(self):
+        """
+        Returns {module file: [suite class names]}: classes deriving from AutoTestFramework, directly or through
+        classes of any test_suites module (Ex: from test_suites.base_qt import LabQtSuite), expanded to a fixed point
+        """
+        files = self.scan()
+        suite_names = self.framework_class_names()
+        found = {file_name: [] for file_name in files}
+        pending = [(file_name, class_name, set(bases)) for file_name, info in sorted(files.items())
+                   for class_name, bases in info["classes"]]
+        while True:
+            resolved = [cls for cls in pending if cls[2] & suite_names]
+            if not resolved:
+                break
+            for file_name, class_name, _ in resolved:
+                found[file_name].append(class_name)
+                suite_names.add(class_name)
+            pending = [cls for cls in pending if cls not in resolved]
+        return found
+
+    @staticmethod
+    def normalize(name):
+        return name.replace("_", "").lower()
+
+    def find(self, name):
+        """
+        Returns (module name, class name) of the suite matching name, None if none
+        :param name: TestCases name or suite class name (Ex: connect, Connect)
+        """
+        key = self.normalize(name)
+        for file_name, class_names in sorted(self.suites().items()):
+            for class_name in class_names:
+                if self.normalize(class_name) == key:
+                    return file_name[:-3], class_name
+        return None
+
+    def get_class(self, name):
+        """ Returns the suite class matching name (importing its module on first use), None if none """
+        found = self.find(name)
+        if found is None:
+            return None
+        module_name, class_name = found
+        module = importlib.import_module(f"{os.path.basename(os.path.normpath(self.suite_dir))}.{module_name}")
+        return getattr(module, class_name)
 
 
 class TestGeneration(AutoTestFramework):
+    def __init__(self, stop_event):
+        super().__init__(stop_event)
+        self.templates = TemplateEngine(self.stop_event)                # Class Instances
+        self.fw_bins = FwBinIndex(self.stop_event)
+        self.qt_runner = QtRunner(self.stop_event)
+
     @staticmethod
     def invalid_bin_name(name_list):
         if len(name_list) != 1:
@@ -362,16 +1142,15 @@ class TestGeneration(AutoTestFramework):
     def get_fw_bin_name(self, fw_string, build_type, bin_format):
         """
         Gets the FW binary file name strings via inputting full FW binary file name
-        :param fw_string: FW Binary name string
+        :param fw_string: FW Binary name string (glob pattern)
         :param build_type: CI or Deploy build
         :param bin_format: Main, LED, PM bins = 1. Camera bin = 2. FPGA bin = 3
         :return: Firmware Name Version String
         """
-        fw_bin_names_list = glob.glob(f"{self.paths.DEPLOY.value}/{fw_string}")
-        if self.invalid_bin_name(fw_bin_names_list):
+        fw_bin_records = self.fw_bins.match(fw_string)                     # Deploy dir scanned once & indexed
+        if self.invalid_bin_name([record.file_name for record in fw_bin_records]):
             return 0
-        fw_name_strings_list = fw_bin_names_list[0].split('.')
-        fw_name_token_list = fw_name_strings_list[0].split('_')
+        fw_name_token_list = fw_bin_records[0].tokens
 
         if build_type == "Deploy":                                          # Deploy
             fw_name_version_string = self.deploy_build_type(fw_name_token_list)
@@ -411,24 +1190,43 @@ class TestGeneration(AutoTestFramework):
         tst_version_fw_file = version_fw_file + self.const.TEST_FILE_TYPE
         auto_test_file = f"{self.paths.CONFIG.value}/{tst_version_fw_file}"
 
-        # Generate var to open 1template\config\<file>.tst in read mode, then read it
-        infile = open(file_template, "r")
-        content_template = infile.read()
-
-        # Replace all occurrences of template_prefix with version_fw_file
-        content_template = content_template.replace(template_prefix, version_fw_file)
+        # Render 1template\config\<file>.tst, replacing all occurrences of template_prefix with version_fw_file
+        content = self.templates.render(file_template, {template_prefix: version_fw_file})
 
-        # Create auto-test\deploy\config\<test>_<version>.tst via opening in Read/Write mode
-        outfile = open(auto_test_file, "w+")
-        outfile.write(content_template)
-
-        # Close up .tst files
-        infile.close()
-        outfile.close()
+        # Create auto-test\deploy\config\<test>_<version>.tst (skipped if unchanged)
+        if not self.templates.write_if_changed(auto_test_file, content):
+            print("Test case from template unchanged")
+            return
 
         # Print to user
         print("Generated test case from template")
 
+    @staticmethod
+    def qt_templates(test_cases):                       # {QtExecutionPrefix: template} of the Qt test cases
+        return {test_case.value[3]: test_case.value[2] for test_case in test_cases
+                if test_case.value[2] and test_case.value[3]}
+
+    def generate_test_files(self, test_cases, version_string):
+        """
+        Generate the .tst files of a whole TestCases selection in one pass
+        :param test_cases: Selected TestCases members (non-Qt test cases are skipped)
+        :param version_string: version grabbed from FW version being used, resolved once for the selection
+        :return: Dict of QtExecutionPrefix: test case name
+        """
+        templates = self.qt_templates(test_cases)
+
+        def generate(test_name_prefix):
+            self.generate_test_file(templates[test_name_prefix], test_name_prefix, version_string)
+
+        if len(templates) >= self.const.BATCH_GEN_THRESHOLD:                   # Large selection: worker pool
+            with ThreadPoolExecutor(max_workers=self.const.BATCH_GEN_WORKERS) as pool:
+                list(pool.map(generate, templates))
+        else:
+            for test_name_prefix in templates:
+                generate(test_name_prefix)
+
+        return {test_name_prefix: f"{test_name_prefix}{version_string}" for test_name_prefix in templates}
+
     def generate_fw_update_test_file(self, template_prefix, test_name_prefix, version_string):
         """
         generate_test_file Modified for usage on the Firmware Update test
@@ -449,13 +1247,6 @@ class TestGeneration(AutoTestFramework):
         tst_version_fw_file = version_fw_file + self.const.TEST_FILE_TYPE
         auto_test_file = f"{self.paths.CONFIG.value}/{tst_version_fw_file}"
 
-        # Generate var to open 1template\config\<file>.tst in read mode, then read it
-        infile = open(file_template, "r")
-        content_template = infile.read()
-
-        # Replace all occurrences of template_prefix with version_fw_file
-        content_template = content_template.replace(template_prefix, version_fw_file)
-
         # Diverge onto FW Update Specific: Set Major, Minor and Build number variables & assign to ver var
         major_no, minor_no, build_no = self.get_major_minor_build_number(self.flags.DEBUG_MODE, version_string)
         ver = f"{major_no}_{minor_no}_{build_no}"
@@ -467,7 +1258,6 @@ class TestGeneration(AutoTestFramework):
         fpga_fw_suffix = self.get_fw_bin_name(self.const.CAM_FPGA + "_*.bin", self.const.FW_VER, 3)
         pm_fw_suffix = self.get_fw_bin_name(self.const.PM + '_' + ver + "_*.bin", self.const.FW_VER, 1)
         if main_fw_suffix == 0 or led_fw_suffix == 0 or cam_fw_suffix == 0 or fpga_fw_suffix == 0 or pm_fw_suffix == 0:
-            infile.close()
             print("Cannot get the fw binary file name string")
             exit(-7)
 
@@ -478,60 +1268,60 @@ class TestGeneration(AutoTestFramework):
         fpga_bin_name = self.const.CAM_FPGA + '_' + fpga_fw_suffix + self.const.FW_FILE_TYPE
         pm_fw_bin_name = self.const.PM + '_' + pm_fw_suffix + self.const.FW_FILE_TYPE
 
-        # Replace Firmware Binary names on template
-        content_template = content_template.replace(self.const.MAIN + FwConstants.FW_FILE_TYPE, main_fw_bin_name)
-        content_template = content_template.replace(self.const.LED + FwConstants.FW_FILE_TYPE, led_fw_bin_name)
-        content_template = content_template.replace(self.const.CAMERA + FwConstants.FW_FILE_TYPE, camera_fw_bin_name)
-        content_template = content_template.replace( self.const.CAM_FPGA + FwConstants.FW_FILE_TYPE, fpga_bin_name)
-        content_template = content_template.replace( self.const.PM + FwConstants.FW_FILE_TYPE, pm_fw_bin_name)
+        # Render template in one pass: template_prefix w/ version_fw_file & Firmware Binary names w/ finalized names
+        content = self.templates.render(file_template, {
+            template_prefix: version_fw_file,
+            self.const.MAIN + FwConstants.FW_FILE_TYPE: main_fw_bin_name,
+            self.const.LED + FwConstants.FW_FILE_TYPE: led_fw_bin_name,
+            self.const.CAMERA + FwConstants.FW_FILE_TYPE: camera_fw_bin_name,
+            self.const.CAM_FPGA + FwConstants.FW_FILE_TYPE: fpga_bin_name,
+            self.const.PM + FwConstants.FW_FILE_TYPE: pm_fw_bin_name})
 
-        # Finalize w/ continuing generate_test_file workflow
-        # Create auto-test\deploy\config\<test>_<version>.tst via opening in Read/Write mode
-        outfile = open(auto_test_file, "w+")
-        outfile.write(content_template)
+        # Create auto-test\deploy\config\<test>_<version>.tst (skipped if unchanged)
+        self.templates.write_if_changed(auto_test_file, content)
 
-        # Close up .tst files
-        infile.close()
-        outfile.close()
-
-    def run_qt_test_suite(self, test_case_name):
+    def run_qt_test_suite(self, test_case_name, timeout=None):
         """
-        Returns build version that test will run
+        Runs the Qt TestApp headless on a test case
         :param test_case_name: String with full Test Case name (found in TestCases const) & version
+        :param timeout: Seconds before the run is killed, defaults to QT_TEST_TIMEOUT
+        :return: Pass/Fail
         """
-        # Change to Deploy dir
-        push_dir = os.getcwd()
-        os.chdir(str(self.paths.DEPLOY.value))
+        # Deploy dir is the child's cwd (no process-wide chdir)
+        deploy_dir = os.path.abspath(str(self.paths.DEPLOY.value))
         if self.flags.DEBUG_MODE:
-            print("chdir to: " + os.getcwd())
+            print("cwd: " + deploy_dir)
             print("QtTestAppWin64 name: " + str(self.paths.QT_EXE.value))
 
         # Create QT TestApp run command & Log
-        qt_cmd = '.\\' + str(self.paths.QT_EXE.value)
-        qt_cmd = qt_cmd + " -t " + test_case_name + " --headless"
-        print("qt_cmd: " + qt_cmd)
-        logging.info('qt_cmd: starting ' + qt_cmd)
-
-        # Run QT TestApp Headless & Report out
-        exit_code = os.system(qt_cmd)
-        if exit_code == 0:
+        qt_cmd = [os.path.join(deploy_dir, str(self.paths.QT_EXE.value)), "-t", test_case_name, "--headless"]
+        if self.const.QT_INSTRUMENT_ARG and self.inst_info.ip:             # Target this suite's instrument (opt-in)
+            qt_cmd += [self.const.QT_INSTRUMENT_ARG, str(self.inst_info.ip)]
+        print("qt_cmd: " + " ".join(qt_cmd))
+        logging.info('qt_cmd: starting ' + " ".join(qt_cmd))
+
+        # Run QT TestApp Headless (output streamed to log, killed on timeout or stop) & Report out
+        exit_code, status = self.qt_runner.run(qt_cmd, cwd=deploy_dir, timeout=timeout or self.const.QT_TEST_TIMEOUT,
+                                               name=test_case_name)
+        if status == "completed" and exit_code == 0:
             print(f"{test_case_name} Test Case Run Completed.")
             logging.info('qt_cmd: Run Completed')
             cmd_result = True
-        else:
+        elif status == "completed":
             print(f"{test_case_name} Run Failed with exit code: {exit_code}")
             logging.info(f"qt_cmd: Run Failed with exit code: {exit_code}")
             cmd_result = False
-
-        # Get back to Base dir
-        os.chdir(push_dir)
-        if self.flags.DEBUG_MODE:
-            print("chdir to: " + os.getcwd())
+        else:
+            print(f"{test_case_name} Run killed ({status})")
+            logging.info(f"qt_cmd: Run killed ({status})")
+            cmd_result = False
 
         return cmd_result
 
 
 class FileManipulation(AutoTestFramework):
+    FICLONE = 0x40049409                                                # Linux ioctl to reflink a file
+
     def dir_check_create(self, directory):
         """
         Check if directory exists from where this function runs. Else it will create it
@@ -577,6 +1367,30 @@ class FileManipulation(AutoTestFramework):
         except Exception as e:
             print(f"Unexpected error: {e}")
 
+    @staticmethod
+    def link_file(src_path, dest_path):
+        """
+        Hard link (or reflink) file from source path to destination path, copying only if neither is possible
+        :param src_path: Path of the source file
+        :param dest_path: Path of the destination file
+        """
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        try:
+            os.link(src_path, dest_path)                                    # Same volume: no bytes written
+            return
+        except OSError:
+            pass
+        try:
+            import fcntl                                                    # Copy-on-write clone (Linux only)
+            with open(src_path, "rb") as src, open(dest_path, "wb") as dest:
+                fcntl.ioctl(dest.fileno(), FileManipulation.FICLONE, src.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+        shutil.copy2(src_path, dest_path)
+        print(f"File copied from {src_path} to {dest_path}")
+
     @staticmethod
     def delete_dir_content(path_file):
         """
@@ -593,12 +1407,23 @@ class FileManipulation(AutoTestFramework):
         except Exception as e:
             print(f"An error occurred: {e}")
 
+    def clear_dir(self, directory):
+        """
+        Remove the inputted Directory & recreate it empty (fast: its files are links into the build cache)
+        :param directory: Dir to clear
+        """
+        dir_path = os.path.normpath(directory)
+        if os.path.exists(dir_path):
+            shutil.rmtree(dir_path)
+        self.dir_check_create(dir_path)
+
     @staticmethod
     def delete_dir(dir_name):
         """
         Delete the inputted Directory
         :param dir_name: Dir to delete
         """
+        import send2trash
         group_dir = dir_name[1:]
         if os.path.exists(group_dir):
             try:
@@ -607,10 +1432,762 @@ class FileManipulation(AutoTestFramework):
                 print(f"send2trash failed to remove directory: {group_dir} due to {e}")
 
 
+class BuildVersion(NamedTuple):
+    """
+    Sortable version key of a build zip, parsed once from its name
+        - ARM64/Windows format (1): <...>_<major>.<minor>.<build>.zip
+        - FPGA format (2): <tokens 0-3>_<major>_<minor>_<build>_<...>.zip
+    Tuples order by (major, minor, build) first, so the latest build is max() over the keys
+    """
+    major: int
+    minor: int
+    build: int
+    zip_name: str
+
+    @classmethod
+    def parse(cls, zip_name, build_format):
+        """
+        Returns the BuildVersion of a build zip name, None if the name does not follow build_format
+        :param zip_name: Build zip file name
+        :param build_format: ARM/Win/FPGA_BUILD_FORMAT from constants
+        """
+        try:
+            if build_format == FwConstants.FPGA_BUILD_FORMAT:                   # FPGA Format
+                tokens = zip_name.rsplit('.', 1)[0].split('_')
+                major = tokens[FwConstants.FPGA_VER_INDEXING1]
+                minor = tokens[FwConstants.FPGA_VER_INDEXING2]
+                build = tokens[FwConstants.FPGA_VER_INDEXING3]
+            else:                                                               # ARM64 or Windows Format
+                major, minor, build = zip_name.split('.')[:3]
+                major = major.rsplit('_', 1)[-1]
+            return cls(int(major) if major.isdigit() else 0, int(minor), int(build), zip_name)
+        except (IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def latest(versions):
+        """ Returns the latest of versions (first one wins on equal versions), None if empty """
+        return max(versions, key=lambda version: version[:3], default=None)
+
+
+class NexusClient(AutoTestFramework):
+    """
+    Base Class for talking to the Nexus server over HTTP
+    Class in Charge of:
+        - Keeping one pooled (keep-alive) HTTP connection per worker thread
+        - Aborting every open connection once stop_event is set (unblocks reads in progress)
+    """
+    def __init__(self, stop_event, host=None, timeout=None):
+        super().__init__(stop_event)
+        self.host = host or self.paths.NEXUS_HOST.value                     # Local Variables
+        self.timeout = timeout or self.const.NEXUS_TIMEOUT
+        self.local = threading.local()                                      # Connection pool (1 per thread)
+        self.open_connections = set()
+        self.connections_lock = threading.Lock()
+        self.on_cancel(self.abort_connections)
+
+    def get_connection(self):
+        """ Returns the calling thread's connection to Nexus, creating it on first use """
+        import http.client
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(self.host, timeout=self.timeout)
+            self.local.conn = conn
+            with self.connections_lock:
+                self.open_connections.add(conn)
+        return conn
+
+    def close_connection(self):
+        """ Closes the calling thread's connection to Nexus """
+        conn = getattr(self.local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self.local.conn = None
+            with self.connections_lock:
+                self.open_connections.discard(conn)
+
+    def abort_connections(self):
+        """ Shuts down the socket of every open connection (called from the thread setting stop_event) """
+        with self.connections_lock:
+            connections = list(self.open_connections)
+        for conn in connections:
+            sock = conn.sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
+class NexusCrawler(NexusClient):
+    """
+    Crawler Class used to list the CI builds published on the Nexus search API
+    Class in Charge of:
+        - Parsing every page in memory & following its continuationToken
+        - Yielding pages as they arrive so callers can process them right away
+    """
+    def get_json(self, url):
+        """
+        GET a Nexus url on the pooled connection & decode the JSON body in memory
+        :param url: Path & query string of the request
+        :return: Decoded JSON body
+        """
+        import http.client
+        for attempt in range(2):                                # Retry once if keep-alive connection went stale
+            conn = self.get_connection()
+            try:
+                conn.request("GET", url)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, OSError):
+                self.close_connection()
+                if attempt or self.stop_event.is_set():             # No retry once aborted by stop
+                    raise
+                continue
+            if response.status != 200:
+                raise ConnectionError(f"Nexus returned {response.status} {response.reason} for {url}")
+            return json.loads(body)
+
+    def pages(self, group_name, continuation_token=None):
+        """
+        Yields every search page of a group, following the continuationToken until the last page
+        :param group_name: ARM64/Windows/FPGA_GROUP from constants
+        :param continuation_token: Page to start from, None starts from the first page
+        """
+        search_url = self.paths.NEXUS_SEARCH.value + quote(group_name, safe="/")
+        while not self.stop_event.is_set():
+            page_url = search_url
+            if continuation_token is not None:
+                page_url += "&continuationToken=" + quote(continuation_token)
+            if self.flags.DEBUG_MODE:
+                print("Nexus GET: " + page_url)
+
+            page = self.get_json(page_url)
+            yield page
+
+            continuation_token = page.get('continuationToken')
+            if continuation_token is None:                      # Last page reached
+                break
+
+
+class BuildDownloader(NexusClient):
+    """
+    Downloader Class used to pull build zips from the Nexus repository
+    Class in Charge of:
+        - Fetching ranged chunks of a zip in parallel (1 pooled connection per worker)
+        - Resuming partial downloads (<zip>.part & its <zip>.part.json chunk journal)
+        - Verifying the SHA-1/MD5 checksum Nexus publishes for the zip
+    """
+    BLOCK_SIZE = 1024 * 1024                                            # Read/write/hash block size
+
+    def __init__(self, stop_event, host=None, timeout=None, chunk_size=None, workers=None):
+        super().__init__(stop_event, host, timeout)
+        self.chunk_size = chunk_size or self.const.DOWNLOAD_CHUNK_SIZE      # Local Variables
+        self.workers = workers or self.const.DOWNLOAD_WORKERS
+        self.journal_lock = threading.Lock()
+
+    def request(self, method, url, headers=None):
+        """
+        Sends a request on the pooled connection & returns the response (body left unread)
+        :param method: HTTP method
+        :param url: Path of the file on the Nexus server
+        :param headers: Extra request headers
+        """
+        import http.client
+        for attempt in range(2):                                # Retry once if keep-alive connection went stale
+            conn = self.get_connection()
+            try:
+                conn.request(method, url, headers=headers or {})
+                return conn.getresponse()
+            except (http.client.HTTPException, OSError):
+                self.close_connection()
+                if attempt or self.stop_event.is_set():             # No retry once aborted by stop
+                    raise
+
+    def get_size(self, url):
+        """ Returns (size in bytes, True if ranged requests are supported) of a file on Nexus """
+        response = self.request("HEAD", url)
+        response.read()
+        if response.status != 200:
+            raise ConnectionError(f"Nexus returned {response.status} {response.reason} for {url}")
+        size = int(response.getheader("Content-Length", -1))
+        return size, size > 0 and response.getheader("Accept-Ranges", "") == "bytes"
+
+    def stream_to(self, response, part_file, offset):
+        """ Writes a response body into part_file starting at offset, returns False if stopped """
+        with open(part_file, "r+b") as file:
+            file.seek(offset)
+            while block := response.read(self.BLOCK_SIZE):
+                if self.stop_event.is_set():
+                    self.close_connection()                             # Body left unread: drop connection
+                    return False
+                file.write(block)
+        return True
+
+    def fetch_chunk(self, url, part_file, start, end):
+        """ Downloads bytes start-end (inclusive) of url into part_file, returns Pass/Fail """
+        response = self.request("GET", url, {"Range": f"bytes={start}-{end}"})
+        if response.status != 206:
+            response.read()
+            print(f"fetch_chunk: Nexus returned {response.status} for bytes {start}-{end} of {url}")
+            return False
+        return self.stream_to(response, part_file, start)
+
+    def read_journal(self, journal_file, size):
+        """ Returns the set of chunks already downloaded, empty if journal is missing or for another file """
+        try:
+            with open(journal_file, "r") as file:
+                journal = json.load(file)
+        except (OSError, ValueError):
+            return set()
+        if journal.get("size") != size or journal.get("chunk_size") != self.chunk_size:
+            return set()
+        return set(journal.get("done", []))
+
+    def write_journal(self, journal_file, size, done):
+        with self.journal_lock:
+            with open(journal_file, "w") as file:
+                json.dump({"size": size, "chunk_size": self.chunk_size, "done": sorted(done)}, file)
+
+    def download_ranges(self, url, part_file, size):
+        """ Downloads the missing chunks of part_file in parallel, returns Pass/Fail """
+        journal_file = part_file + ".json"
+        done = self.read_journal(journal_file, size) if os.path.exists(part_file) else set()
+        if not done:                                                    # New download: pre-allocate part file
+            with open(part_file, "wb") as file:
+                file.truncate(size)
+        if self.flags.DEBUG_MODE and done:
+            print(f"Resuming {part_file}: {len(done)} chunk(s) already downloaded")
+
+        def worker(worker_chunks):                                      # 1 keep-alive connection per worker
+            try:
+                for chunk in worker_chunks:
+                    start = chunk * self.chunk_size
+                    if not self.fetch_chunk(url, part_file, start, min(start + self.chunk_size, size) - 1):
+                        return False                                    # Rest is fetched on resume
+                    with self.journal_lock:
+                        done.add(chunk)
+                    self.write_journal(journal_file, size, done)
+                return True
+            finally:
+                self.close_connection()                                 # Pool thread exits w/ the pool
+
+        chunks = [chunk for chunk in range(-(-size // self.chunk_size)) if chunk not in done]
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(worker, [chunks[i::self.workers] for i in range(self.workers)]))
+        return all(results)
+
+    def download_stream(self, url, part_file):
+        """ Downloads url into part_file in one request (server without ranged requests), returns Pass/Fail """
+        response = self.request("GET", url)
+        if response.status != 200:
+            response.read()
+            print(f"download_stream: Nexus returned {response.status} for {url}")
+            return False
+        with open(part_file, "wb"):
+            pass
+        return self.stream_to(response, part_file, 0)
+
+    def verify(self, file_name, checksum):
+        """
+        Returns True if file_name matches the SHA-1 (or MD5) checksum published by Nexus
+        :param file_name: File to verify
+        :param checksum: Nexus asset checksum dict, Ex: {'sha1': '...', 'md5': '...'}
+        """
+        algorithm = next((name for name in ("sha1", "md5") if checksum and checksum.get(name)), None)
+        if algorithm is None:
+            print(f"No checksum published for {file_name}, skipping verification")
+            return True
+        digest = hashlib.new(algorithm)
+        with open(file_name, "rb") as file:
+            while block := file.read(self.BLOCK_SIZE):
+                digest.update(block)
+        if digest.hexdigest() != checksum[algorithm].lower():
+            print(f"{file_name} {algorithm} mismatch: expected {checksum[algorithm]}, got {digest.hexdigest()}")
+            return False
+        return True
+
+    def download(self, url, dest, checksum=None):
+        """
+        Downloads a file from Nexus to dest: ranged & resumable when supported, verified against checksum
+        :param url: Path of the file on the Nexus server
+        :param dest: Destination file
+        :param checksum: Nexus asset checksum dict, Ex: {'sha1': '...', 'md5': '...'}
+        :return: Pass/Fail
+        """
+        part_file = dest + ".part"
+        try:
+            size, ranged = self.get_size(url)
+            if ranged:
+                completed = self.download_ranges(url, part_file, size)
+            else:
+                completed = self.download_stream(url, part_file)
+        except Exception as e:
+            print(f"An error occurred downloading {url}: {e}")
+            return False
+        finally:
+            self.close_connection()
+        if not completed:                                               # Part file kept to resume next time
+            return False
+
+        if not self.verify(part_file, checksum):                        # Corrupted: start over next time
+            for file_name in (part_file, part_file + ".json"):
+                if os.path.exists(file_name):
+                    os.remove(file_name)
+            return False
+        os.replace(part_file, dest)
+        if os.path.exists(part_file + ".json"):
+            os.remove(part_file + ".json")
+        return True
+
+
+class BuildIndex(AutoTestFramework):
+    """
+    Persistent per-group index of the CI builds seen on Nexus (auto-test-downloads/index_<Group>_CI.json)
+    Class in Charge of:
+        - Storing the parsed (major, minor, build) key of every build zip seen
+        - Storing the high-water mark (continuationToken of the last page seen) so a refresh only walks new pages
+        - Storing the latest build seen & the last build downloaded (replaces last_<Build>_downloaded.txt)
+    Indexes are loaded once per group & shared by every instance
+    """
+    indexes = {}                                                    # group_name: index dict
+    lock = threading.RLock()
+
+    def get_index_file_name(self, group_name):
+        """ Returns index_<Group>_CI.json path within auto-test-downloads dir """
+        group_prefix = group_name.replace('/', '_')
+        return f"{self.paths.AT_DOWNLOADS.value}/index{group_prefix}.json"
+
+    def load(self, group_name):
+        """
+        Returns the index of a group, reading it from disk on first use
+        :param group_name: ARM64/Windows/FPGA_GROUP from constants
+        """
+        with self.lock:
+            if group_name in self.indexes:
+                return self.indexes[group_name]
+
+            try:
+                with open(self.get_index_file_name(group_name), "r") as file:
+                    index = json.load(file)
+            except (OSError, ValueError):
+                index = {"builds": {}, "continuationToken": None, "latest": "",
+                         "downloaded": self.read_legacy_downloaded(group_name)}
+            self.indexes[group_name] = index
+            return index
+
+    def save(self, group_name):
+        """ Writes the index of a group to disk (atomically, via a temp file) """
+        with self.lock:
+            index_file = self.get_index_file_name(group_name)
+            os.makedirs(os.path.dirname(index_file), exist_ok=True)
+            with open(index_file + ".tmp", "w") as file:
+                json.dump(self.indexes[group_name], file)
+            os.replace(index_file + ".tmp", index_file)
+
+    def reset(self, group_name):
+        """ Forgets the builds & high-water mark of a group so the next refresh rescans Nexus """
+        with self.lock:
+            index = self.load(group_name)
+            index.update(builds={}, continuationToken=None, latest="")
+
+    def read_legacy_downloaded(self, group_name):
+        """ Seeds a new index with the build name stored in last_<Build>_downloaded.txt, if any """
+        legacy_file = Builds.get_last_downloaded_build_name(group_name, self.paths.AT_DOWNLOADS.value)
+        try:
+            with open(legacy_file, "r") as file:
+                return file.read()
+        except OSError:
+            return ""
+
+    def get_downloaded(self, group_name):
+        return self.load(group_name)["downloaded"]
+
+    def set_downloaded(self, group_name, zip_file_name):
+        with self.lock:
+            self.load(group_name)["downloaded"] = zip_file_name
+            self.save(group_name)
+
+
+class BuildCache(AutoTestFramework):
+    """
+    Content-addressed cache of build zips & their extracted trees (auto-test-downloads/cache)
+        - zips/<sha1>.zip: Downloaded build zip, named by its SHA-1
+        - trees/<sha1>/: Extracted tree of that zip
+        - cache.json: zip name (build version) -> SHA-1, plus size & last use of every entry
+    Switching to a cached build hard links its files into the auto-test tree instead of download, unzip & copy.
+    Least recently used entries are evicted once the cache grows past BUILD_CACHE_SIZE.
+    """
+    lock = threading.RLock()
+    index = None                                                    # Shared by every instance, loaded once
+
+    def __init__(self, stop_event, max_size=None):
+        super().__init__(stop_event)
+        self.max_size = max_size or self.const.BUILD_CACHE_SIZE                 # Local Variables
+        self.cache_dir = f"{self.paths.AT_DOWNLOADS.value}/cache"
+
+    def get_index_file_name(self):
+        return f"{self.cache_dir}/cache.json"
+
+    def get_zip_file_name(self, sha1):
+        return f"{self.cache_dir}/zips/{sha1}.zip"
+
+    def get_tree_dir(self, sha1):
+        return f"{self.cache_dir}/trees/{sha1}"
+
+    def load(self):
+        """ Returns the cache index, reading it from disk on first use """
+        with self.lock:
+            if BuildCache.index is None:
+                try:
+                    with open(self.get_index_file_name(), "r") as file:
+                        BuildCache.index = json.load(file)
+                except (OSError, ValueError):
+                    BuildCache.index = {"versions": {}, "entries": {}}
+            return BuildCache.index
+
+    def save(self):
+        """ Writes the cache index to disk (atomically, via a temp file) """
+        with self.lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.get_index_file_name() + ".tmp", "w") as file:
+                json.dump(self.load(), file)
+            os.replace(self.get_index_file_name() + ".tmp", self.get_index_file_name())
+
+    def lookup(self, zip_name):
+        """
+        Returns the cache entry of a build & marks it as used, None if not cached
+        :param zip_name: Build zip file name (build version)
+        """
+        with self.lock:
+            index = self.load()
+            sha1 = index["versions"].get(zip_name)
+            entry = index["entries"].get(sha1)
+            if entry is None or not os.path.exists(self.get_zip_file_name(sha1)):
+                return None
+            entry["last_used"] = time.time()
+            self.save()
+            return dict(entry, sha1=sha1)
+
+    @staticmethod
+    def hash_file(file_name):
+        digest = hashlib.sha1()
+        with open(file_name, "rb") as file:
+            while block := file.read(BuildDownloader.BLOCK_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def add_zip(self, zip_name, file_name, sha1=None, move=True):
+        """
+        Stores a build zip in the cache
+        :param zip_name: Build zip file name (build version)
+        :param file_name: Zip file to store
+        :param sha1: SHA-1 of the zip if already known (Ex: published by Nexus & verified)
+        :param move: Move file_name into the cache (True) or link/copy it (False)
+        :return: SHA-1 of the zip
+        """
+        sha1 = (sha1 or self.hash_file(file_name)).lower()
+        cached_zip = self.get_zip_file_name(sha1)
+        os.makedirs(os.path.dirname(cached_zip), exist_ok=True)
+        if move:
+            os.replace(file_name, cached_zip)
+        elif not os.path.exists(cached_zip):
+            FileManipulation.link_file(file_name, cached_zip)
+
+        with self.lock:
+            index = self.load()
+            index["versions"][zip_name] = sha1
+            entry = index["entries"].setdefault(sha1, {"zip_size": 0, "tree_size": 0})
+            entry.update(zip_size=os.path.getsize(cached_zip), last_used=time.time())
+            self.save()
+        self.evict(keep=sha1)
+        return sha1
+
+    def add_tree(self, zip_name, tree_dir):
+        """
+        Stores the extracted tree of a cached build zip by linking every file of tree_dir into the cache
+        :param zip_name: Build zip file name (build version)
+        :param tree_dir: Dir the zip was extracted into
+        """
+        with self.lock:
+            sha1 = self.load()["versions"].get(zip_name)
+        if sha1 is None:
+            return
+        cached_tree = self.get_tree_dir(sha1)
+        if os.path.exists(cached_tree):
+            shutil.rmtree(cached_tree)
+        tree_size = 0
+        for root, _, files in os.walk(tree_dir):
+            for file in files:
+                if root == tree_dir and file == zip_name:                   # Zip itself is cached separately
+                    continue
+                src = os.path.join(root, file)
+                dest = os.path.join(cached_tree, os.path.relpath(src, tree_dir))
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                FileManipulation.link_file(src, dest)
+                tree_size += os.path.getsize(src)
+
+        with self.lock:
+            entry = self.load()["entries"][sha1]
+            entry.update(tree_size=tree_size, last_used=time.time())
+            self.save()
+        self.evict(keep=sha1)
+
+    def materialize(self, zip_name, dest_dir):
+        """
+        Links a cached build into dest_dir: its extracted tree if cached, otherwise its zip
+        :param zip_name: Build zip file name (build version)
+        :param dest_dir: auto-test group dir
+        :return: "tree", "zip" or None if the build is not cached
+        """
+        entry = self.lookup(zip_name)
+        if entry is None:
+            return None
+        cached_tree = self.get_tree_dir(entry["sha1"])
+        if entry["tree_size"] and os.path.isdir(cached_tree):
+            for root, _, files in os.walk(cached_tree):
+                for file in files:
+                    src = os.path.join(root, file)
+                    dest = os.path.join(dest_dir, os.path.relpath(src, cached_tree))
+                    os.makedirs(os.path.dirname(dest), exist_ok=True)
+                    FileManipulation.link_file(src, dest)
+            return "tree"
+        FileManipulation.link_file(self.get_zip_file_name(entry["sha1"]), f"{dest_dir}/{zip_name}")
+        return "zip"
+
+    def evict(self, keep=None):
+        """
+        Removes least recently used entries until the cache fits within max_size
+        :param keep: SHA-1 of an entry that must not be evicted (the one just used)
+        """
+        with self.lock:
+            index = self.load()
+            entries = index["entries"]
+            total_size = sum(entry["zip_size"] + entry["tree_size"] for entry in entries.values())
+            for sha1 in sorted(entries, key=lambda key: entries[key]["last_used"]):
+                if total_size <= self.max_size:
+                    break
+                if sha1 == keep:
+                    continue
+                entry = entries.pop(sha1)
+                total_size -= entry["zip_size"] + entry["tree_size"]
+                index["versions"] = {name: key for name, key in index["versions"].items() if key != sha1}
+                if os.path.exists(self.get_zip_file_name(sha1)):
+                    os.remove(self.get_zip_file_name(sha1))
+                shutil.rmtree(self.get_tree_dir(sha1), ignore_errors=True)
+                if self.flags.DEBUG_MODE:
+                    print(f"Evicted {sha1} from build cache")
+            self.save()
+
+
+class ZipExtractor(AutoTestFramework):
+    """
+    Extractor Class used to unzip builds on absolute paths (no process-wide chdir)
+    Class in Charge of:
+        - Extracting zip members in parallel across a worker pool (1 zip handle per worker)
+        - Skipping members whose size & CRC already match the file on disk
+        - Replacing files via a temp file, so links shared w/ the build cache are never written through
+        - Giving extracted files the mtime stored in the zip (TreeSync compares size & mtime)
+    """
+    BLOCK_SIZE = 1024 * 1024                                            # Read/write/CRC block size
+
+    def __init__(self, stop_event, workers=None):
+        super().__init__(stop_event)
+        self.workers = workers or self.const.UNZIP_WORKERS                  # Local Variables
+        self.local = threading.local()
+
+    def get_zip(self, zip_path):
+        """ Returns the calling thread's handle on zip_path, opening it on first use """
+        import zipfile
+        handles = self.local.__dict__.setdefault("handles", {})
+        if zip_path not in handles:
+            handles[zip_path] = zipfile.ZipFile(zip_path)
+        return handles[zip_path]
+
+    def close_zip(self, zip_path):
+        """ Closes the calling thread's handle on zip_path """
+        handle = self.local.__dict__.get("handles", {}).pop(zip_path, None)
+        if handle is not None:
+            handle.close()
+
+    def is_unchanged(self, target, info):
+        """ Returns True if target already holds the member described by info (same size & CRC) """
+        try:
+            if os.path.getsize(target) != info.file_size:
+                return False
+            crc = 0
+            with open(target, "rb") as file:
+                while block := file.read(self.BLOCK_SIZE):
+                    crc = zlib.crc32(block, crc)
+            return crc == info.CRC
+        except OSError:
+            return False
+
+    def extract_member(self, zip_path, info, dest_dir):
+        """
+        Extracts one member of zip_path into dest_dir, raises TestCancelled once stop_event is set
+        :return: True if written, False if skipped (unchanged)
+        """
+        target = os.path.realpath(os.path.join(dest_dir, info.filename))
+        if os.path.commonpath([dest_dir, target]) != dest_dir:                  # Refuse ../ members
+            raise ValueError(f"Zip member {info.filename} escapes {dest_dir}")
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            return False
+        self.check_cancelled()
+        if self.is_unchanged(target, info):
+            return False
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with self.get_zip(zip_path).open(info) as src, open(target + ".unzip", "wb") as dest:
+            shutil.copyfileobj(src, dest, self.BLOCK_SIZE)
+        os.replace(target + ".unzip", target)
+        zip_time = time.mktime(info.date_time + (0, 0, -1))                     # Member mtime (local time), so
+        os.utime(target, (zip_time, zip_time))                                  # identical files sync as unchanged
+        return True
+
+    def extract(self, zip_path, dest_dir):
+        """
+        Extracts every member of a zip into dest_dir in parallel
+        Raises TestCancelled if stopped before every member was written or verified (dest_dir is then partial)
+        :param zip_path: Zip file to extract
+        :param dest_dir: Dir to extract into
+        :return: (Number of members written, Number of members skipped)
+        """
+        import zipfile
+        zip_path = os.path.abspath(zip_path)
+        dest_dir = os.path.realpath(dest_dir)
+        with zipfile.ZipFile(zip_path) as zip_file:
+            members = zip_file.infolist()
+
+        def worker(chunk):
+            try:
+                return [self.extract_member(zip_path, info, dest_dir) for info in chunk]
+            finally:
+                self.close_zip(zip_path)
+
+        chunks = [members[i::self.workers] for i in range(self.workers)]        # Spread members over workers
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            written = sum(sum(result) for result in pool.map(worker, chunks))
+        files = sum(not info.is_dir() for info in members)
+        if self.flags.DEBUG_MODE:
+            print(f"Unzipped {zip_path}: {written} file(s) written, {files - written} unchanged")
+        return written, files - written
+
+
+class SyncReport(NamedTuple):
+    """ Totals of a TreeSync run """
+    files_copied: int
+    bytes_copied: int
+    files_removed: int
+    files_skipped: int
+
+
+class TreeSync(AutoTestFramework):
+    """
+    Sync Class used to mirror a build tree into another dir in-process (replaces del & xcopy)
+    Class in Charge of:
+        - Copying only files whose size or mtime (or hash, if use_hash) changed, in parallel
+        - Removing stale files that match cleanup patterns & are no longer in the source tree
+        - Reporting files & bytes moved
+    """
+    BLOCK_SIZE = 1024 * 1024                                            # Hash block size
+
+    def __init__(self, stop_event, workers=None, use_hash=False):
+        super().__init__(stop_event)
+        self.workers = workers or self.const.DEPLOY_WORKERS                 # Local Variables
+        self.use_hash = use_hash
+
+    def hash_file(self, file_name):
+        digest = hashlib.sha1()
+        with open(file_name, "rb") as file:
+            while block := file.read(self.BLOCK_SIZE):
+                digest.update(block)
+        return digest.digest()
+
+    def is_changed(self, src, dest):
+        """ Returns True if dest is missing or differs from src """
+        try:
+            dest_stat = os.stat(dest)
+        except OSError:
+            return True
+        src_stat = os.stat(src)
+        if src_stat.st_size != dest_stat.st_size:
+            return True
+        if self.use_hash:
+            return self.hash_file(src) != self.hash_file(dest)
+        return abs(src_stat.st_mtime - dest_stat.st_mtime) > 2                 # FAT/SMB mtime granularity
+
+    @staticmethod
+    def matches(rel_path, patterns):
+        """
+        Returns True if rel_path matches any pattern
+        :param patterns: Glob patterns relative to the tree root, "**/" prefix matches at any depth
+        """
+        for pattern in patterns:
+            if pattern.startswith("**/"):
+                if fnmatch(os.path.basename(rel_path), pattern[3:]):
+                    return True
+            elif fnmatch(rel_path.replace(os.sep, "/"), pattern):
+                return True
+        return False
+
+    def copy_file(self, src, dest):
+        """ Copies src over dest (via a temp file, keeping mtime), returns bytes copied """
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        shutil.copy2(src, dest + ".sync")
+        os.replace(dest + ".sync", dest)
+        return os.path.getsize(dest)
+
+    def sync(self, src_dir, dest_dir, remove_patterns=()):
+        """
+        Mirrors src_dir into dest_dir
+        :param src_dir: Source tree
+        :param dest_dir: Destination tree (files not in src_dir are kept unless they match remove_patterns)
+        :param remove_patterns: Patterns of dest_dir files to remove when they are not in src_dir
+        :return: SyncReport, raises TestCancelled if stopped before every changed file was copied
+        """
+        src_files = set()
+        for root, _, files in os.walk(src_dir):
+            for file in files:
+                src_files.add(os.path.relpath(os.path.join(root, file), src_dir))
+
+        # Remove stale files (Ex: firmware binaries of the previous build)
+        files_removed = 0
+        for root, _, files in os.walk(dest_dir):
+            for file in files:
+                rel_path = os.path.relpath(os.path.join(root, file), dest_dir)
+                if rel_path not in src_files and self.matches(rel_path, remove_patterns):
+                    os.remove(os.path.join(root, file))
+                    files_removed += 1
+
+        # Copy new & changed files
+        changed = [rel_path for rel_path in src_files
+                   if self.is_changed(os.path.join(src_dir, rel_path), os.path.join(dest_dir, rel_path))]
+
+        def worker(rel_path):
+            if self.stop_event.is_set():
+                return None
+            return self.copy_file(os.path.join(src_dir, rel_path), os.path.join(dest_dir, rel_path))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            copied = [size for size in pool.map(worker, changed) if size is not None]
+        if len(copied) != len(changed):                                     # Stopped: dest_dir is half synced
+            self.check_cancelled()
+
+        return SyncReport(len(copied), sum(copied), files_removed, len(src_files) - len(changed))
+
+
 class Builds(AutoTestFramework):
     def __init__(self, stop_event):
         super().__init__(stop_event)
         self.file_manip = FileManipulation(self.stop_event)     # Instance
+        self.crawler = NexusCrawler(self.stop_event)
+        self.downloader = BuildDownloader(self.stop_event)
+        self.build_index = BuildIndex(self.stop_event)
+        self.build_cache = BuildCache(self.stop_event)
+        self.extractor = ZipExtractor(self.stop_event)
+        self.tree_sync = TreeSync(self.stop_event)
 
     @staticmethod
     def get_last_downloaded_build_name(group_name, downloads_path):
@@ -631,48 +2208,6 @@ class Builds(AutoTestFramework):
         name_list = path_file_name.split('/')
         return name_list[2]
 
-    @staticmethod
-    def compare_build_name(build_1, build_2, build_format):
-        """
-        Compare Build numbers & returns a value depending on comparison
-        :param build_1: Newly downloaded zip
-        :param build_2: Current_latest_zip
-        :param build_format: ARM/Win/FPGA_BUILD_FORMAT from constants
-        :return: 1 if build number is equal or greater than the one saved in last download file
-        """
-        # Inputted builds are blank
-        if build_2 == "":  # No Current_latest_zip
-            return 1
-        if build_1 == "":  # No Newly downloaded zip
-            return -1
-
-        # ARM64 or Windows Format
-        if build_format == 1:
-            minor_number_1 = int(build_1.split('.')[1])
-            build_number_1 = int(build_1.split('.')[2])
-
-            minor_number_2 = int(build_2.split('.')[1])
-            build_number_2 = int(build_2.split('.')[2])
-
-        # FPGA Format
-        elif build_format == 2:
-            minor_number_1 = int(build_1.split('_')[5])
-            build_number_1 = int(build_1.split('_')[6])
-
-            minor_number_2 = int(build_2.split('_')[5])
-            build_number_2 = int(build_2.split('_')[6])
-
-        if minor_number_1 > minor_number_2:  # Newly downloaded zip is newer
-            return 1
-
-        if (minor_number_1 == minor_number_2) and (build_number_1 > build_number_2):  # Same Build
-            return 1
-
-        if (minor_number_1 == minor_number_2) and (build_number_1 == build_number_2):  # Current_latest_zip is newer
-            return 0
-        else:
-            return -1
-
     def find_version(self, zip_file, index):
         """ Find Version # given Zip file & index """
         version_info_list = zip_file.split('_')
@@ -682,72 +2217,71 @@ class Builds(AutoTestFramework):
 
     def get_last_downloaded_zip_name(self, group_name):
         """
-        Returns name of zip file needed within last_<Build>_downloaded.txt
+        Returns name of the last zip file downloaded, answered from the group's build index
         :param group_name: Group string within constants.py,  Ex: WINDOWS_GROUP = r"/Windows/CI"
         """
-        downloaded_file = self.get_last_downloaded_build_name(group_name, self.paths.AT_DOWNLOADS.value)
-        try:
-            file = open(downloaded_file, "r")
-            zip_file_name = file.read()
-        except Exception as e:
-            print(f"get_last_downloaded_zip_name error: {e}, zip_file_name blank")
-            file = open(downloaded_file, "w")
-            zip_file_name = ""
-
-        file.close()
-        return zip_file_name
+        return self.build_index.get_downloaded(group_name)
 
-    def get_latest_build(self, debug, group_name, nexus_fwapi_ci_page, build_format):
+    def refresh_build_index(self, group_name, build_format):
+        """
+        Walks the Nexus pages from the index high-water mark & adds the builds not seen before
+        :param group_name: ARM64/Windows/FPGA_GROUP from constants
+        :param build_format: ARM/Win/FPGA_BUILD_FORMAT from constants
+        :return: Latest build zip name seen on Nexus
+        """
+        index = self.build_index.load(group_name)
+        builds = index["builds"]
+        page_token = index["continuationToken"]                         # Resume from last page seen
+        latest = BuildVersion.parse(index["latest"], build_format)
+
+        for build_image_list in self.crawler.pages(group_name, page_token):
+            new_versions = [latest] if latest else []
+            new_items = {}
+            for item in build_image_list['items']:                      # Only parse builds not seen before
+                item_zip_name = item['name'].split('/')[-1]
+                if item_zip_name in builds or not item_zip_name.endswith(".zip"):
+                    continue
+                version = BuildVersion.parse(item_zip_name, build_format)
+                if version is not None:
+                    builds[item_zip_name] = version[:3]
+                    new_versions.append(version)
+                    new_items[item_zip_name] = item
+            latest = BuildVersion.latest(new_versions)
+            if latest and latest.zip_name in new_items:                 # Keep checksum Nexus publishes for it
+                assets = new_items[latest.zip_name].get('assets') or [{}]
+                index["checksum"] = assets[0].get('checksum', {})
+
+            if build_image_list.get('continuationToken') is not None:   # Move high-water mark to next page
+                page_token = build_image_list['continuationToken']
+        index["continuationToken"] = page_token
+        index["latest"] = latest.zip_name if latest else ""
+
+        self.build_index.save(group_name)
+        return index["latest"]
+
+    def get_latest_build(self, debug, group_name, build_format):
         """
         Pulls latest ARM64, Windows or FPGA CI Build
         :param debug: Debug Flag
         :param group_name: ARM64/Windows/FPGA_GROUP from constants
-        :param nexus_fwapi_ci_page: NEXUS_ARM64/Win/FPGA_CI from constants
         :param build_format: ARM/Win/FPGA_BUILD_FORMAT from constants
         :return: Pass/Fail
         """
-        # initialize the latest_build_number
-        latest_build_zip_name = ""
-
-        # Obtain CI build list:
-        # curl_cmd = f"curl -X GET {self.paths.NEXUS_REPO.value}{group_name} -o {nexus_fwapi_ci_page}"
-        curl_prefix = 'curl -X GET "http://10.240.20.40/service/rest/v1/search?repository=ChemiDocGo-FW&group='
-        curl_cmd = curl_prefix + group_name + '"'
-        curl_cmd = curl_cmd + " -o " + nexus_fwapi_ci_page
-
-        # Run curl_cmd to get .json file
-        if debug:
-            print("curl_cmd: " + curl_cmd)
+        # Refresh the build index w/ the builds published since the last crawl
         try:
-            os.system(curl_cmd)
+            try:
+                latest_build_zip_name = self.refresh_build_index(group_name, build_format)
+            except ConnectionError as e:                                # High-water mark rejected: rescan all
+                print(f"Incremental Nexus refresh of {group_name} failed ({e}), rescanning")
+                self.build_index.reset(group_name)
+                latest_build_zip_name = self.refresh_build_index(group_name, build_format)
         except Exception as e:
-            print(f"An error occurred running curl_cmd: {e}")
-            exit(-15)
-
-        # Read in the ARM64/Win/FPGA_html.json file & store list in variable
-        f = open(nexus_fwapi_ci_page)
-        build_image_list = json.load(f)
-        f.close()
-
-        # Update latest_build_zip_name w/ the latest build version
-        latest_build_zip_name = self.update_latest(latest_build_zip_name, build_image_list, build_format)
-
-        # Confirm we checked the last page
-        contTokenString = build_image_list['continuationToken']
-        while contTokenString != None:
-            curl_cmd_cont = curl_prefix + group_name + '&continuationToken=' + contTokenString + '"'
-            curl_cmd_cont = curl_cmd_cont + " -o " + nexus_fwapi_ci_page
-            if debug:
-                print("curl_cmd_cont: " + curl_cmd_cont)
-            os.system(curl_cmd_cont)
-
-            f = open(nexus_fwapi_ci_page)
-            build_image_list = json.load(f)
-            contTokenString = build_image_list['continuationToken']
-            f.close()
-
-            # Update latest_build_zip_name w/ the latest build version
-            latest_build_zip_name = self.update_latest(latest_build_zip_name, build_image_list, build_format)
+            print(f"An error occurred crawling Nexus {group_name}: {e}")
+            return False
+        finally:
+            self.crawler.close_connection()
+        if self.stop_event.is_set():
+            return False
         if debug:
             print("last page downloaded")
             print(f"Latest C/I zip built: {latest_build_zip_name}")
@@ -760,24 +2294,26 @@ class Builds(AutoTestFramework):
         if debug:
             print(f"URL of latest zip file: {latest_build_zip_name}")
 
-        # Create group path under AT_DOWNLOADS dir
-        self.file_manip.dir_check_create(str(self.paths.AT_DOWNLOADS.value + group_name))
-
-        # Download new build zip file
-        curl_cmd2 = ("curl -X GET " + "http://10.240.20.40/repository/ChemiDocGo-FW" + group_name + "/" +
-                     latest_build_zip_name + " -o " + self.paths.AT_DOWNLOADS.value + '/' + latest_build_zip_path)
-        if debug:
-            print("curl_cmd2 = " + curl_cmd2)
-        os.system(curl_cmd2)
-        logging.info("Downloaded new zip file from Nexus: " + latest_build_zip_path)
-
-        # Create group path under auto-test directory
-        FileManipulation.delete_dir(str(self.paths.AUTOTEST.value + group_name))
-        self.file_manip.dir_check_create(str(self.paths.AUTOTEST.value + group_name))
-
-        # Copy the zip file just downloaded from downloads to auto_test directory
-        self.file_manip.file_copy_win(f"{self.paths.AT_DOWNLOADS.value}/{latest_build_zip_path}",
-                                      f"{self.paths.AUTOTEST.value}/{latest_build_zip_path}")
+        # Download new build zip file into the build cache, unless it is cached already
+        if self.build_cache.lookup(latest_build_zip_name) is None:
+            self.file_manip.dir_check_create(str(self.paths.AT_DOWNLOADS.value + group_name))
+            zip_url = self.paths.NEXUS_REPO.value + group_name + "/" + quote(latest_build_zip_name)
+            download_file = f"{self.paths.AT_DOWNLOADS.value}/{latest_build_zip_path}"
+            if debug:
+                print(f"Downloading {zip_url} to {download_file}")
+            checksum = self.build_index.load(group_name).get("checksum") or {}
+            if not self.downloader.download(zip_url, download_file, checksum):     # Ranged, resumable & verified
+                print(f"get_latest_build: failed to download {latest_build_zip_path}")
+                return False
+            self.build_cache.add_zip(latest_build_zip_name, download_file, checksum.get("sha1"))
+            logging.info("Downloaded new zip file from Nexus: " + latest_build_zip_path)
+        elif debug:
+            print(f"{latest_build_zip_name} found in build cache")
+
+        # Recreate group path under auto-test directory & link the cached build into it
+        group_auto_test_dir = str(self.paths.AUTOTEST.value + group_name)
+        self.file_manip.clear_dir(group_auto_test_dir)
+        self.build_cache.materialize(latest_build_zip_name, group_auto_test_dir)
 
         # Update the last download file record with the downloaded file
         self.set_last_downloaded_build_name(group_name, latest_build_zip_path)
@@ -786,6 +2322,23 @@ class Builds(AutoTestFramework):
             print("End of get_latest_build")
         return True
 
+    def get_latest_builds(self, debug, groups=None):
+        """
+        Pulls latest ARM64, Windows & FPGA CI Builds, crawling every group at the same time
+        :param debug: Debug Flag
+        :param groups: Dict of group_name: build_format, defaults to ARM64, Windows & FPGA groups
+        :return: Dict of group_name: Pass/Fail
+        """
+        if groups is None:
+            groups = {self.paths.ARM64_GROUP.value: self.const.ARM_BUILD_FORMAT,
+                      self.paths.WINDOWS_GROUP.value: self.const.WIN_BUILD_FORMAT,
+                      self.paths.FPGA_GROUP.value: self.const.FPGA_BUILD_FORMAT}
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as pool:          # 1 worker (& connection) per group
+            futures = {group_name: pool.submit(self.get_latest_build, debug, group_name, build_format)
+                       for group_name, build_format in groups.items()}
+        return {group_name: future.result() for group_name, future in futures.items()}
+
     def generate_deploy_build(self, build, path):
         """
         Generates new (ARM64/Windows) Build when running Deploy version
@@ -794,16 +2347,15 @@ class Builds(AutoTestFramework):
         :return Pass/Fail
         """
         try:
-            # Wipe old Deploy (ARM64/Windows) build from auto-test-downloads Dir
+            # Wipe old Deploy (ARM64/Windows) build from auto-test Dir
             build_path = path + "/" + build
-            cur_dir = os.getcwd()
-            os.chdir(str(self.paths.AUTOTEST.value))
-            FileManipulation.delete_dir(path)
-            self.file_manip.dir_check_create(path)
-            os.chdir(cur_dir)
+            group_auto_test_dir = str(self.paths.AUTOTEST.value + path)
+            self.file_manip.clear_dir(group_auto_test_dir)
 
-            # Copy build Zip file from resources to auto-test Dir
-            self.file_manip.file_copy_win(f"resources/{build}", f"{self.paths.AUTOTEST.value}/{build_path}")
+            # Link build (extracted tree or zip) from build cache, adding resources zip to cache first if needed
+            if self.build_cache.lookup(build) is None:
+                self.build_cache.add_zip(build, f"resources/{build}", move=False)
+            self.build_cache.materialize(build, group_auto_test_dir)
 
             # Update auto-test-downloads\last_X_CI_downloaded.txt
             self.set_last_downloaded_build_name(path, build_path)
@@ -813,43 +2365,28 @@ class Builds(AutoTestFramework):
         return True
 
     def deploy_windows_qt_build(self, debug):
-        push_dir = os.getcwd()
-        os.chdir(self.paths.AUTOTEST.value)
-        if debug:
-            print("chdir to: " + os.getcwd())
-
-        # Convert group_name to Windows format
-        windows_group_name = self.paths.WINDOWS_GROUP.value.replace("/", "\\")
-        source_path = os.getcwd() + windows_group_name
-        target_path = 'deploy'
-
-        # clean up firmware binary files in the target path: CameraBoard_FX3, LedBoard, MainBoard, and PMBoard binary files
-        if debug:
-            print("clean up firmware binary files: CameraBoard_FX3, LedBoard, MainBoard, and PMBoard binary files")
-        clean_up_cmd = "del /q " + target_path + "\\CDGo_CameraBoard_FX3_*.bin"
-        os.system(clean_up_cmd)
-        clean_up_cmd = "del /s /q " + target_path + "\\CDGo_LedBoard_*.bin"
-        os.system(clean_up_cmd)
-        clean_up_cmd = "del /s /q " + target_path + "\\CDGo_MainBoard_*.bin"
-        os.system(clean_up_cmd)
-        clean_up_cmd = "del /s /q " + target_path + "\\CDGo_PMBoard_*.bin"
-        os.system(clean_up_cmd)
-
+        """
+        Syncs the Windows Qt Build (auto-test/Windows/CI) into the deploy dir, copying only changed files
+        :param debug: Debug Flag
+        :return: SyncReport, raises TestCancelled if stopped mid-sync
+        """
+        source_path = os.path.normpath(self.paths.AUTOTEST.value + self.paths.WINDOWS_GROUP.value)
+        target_path = os.path.normpath(self.paths.DEPLOY.value)
         if debug:
             print("source_path: ", source_path)
             print("target_path: ", target_path)
 
-        deep_copy_cmd = f'xcopy "{source_path}" "{target_path}" /s /e /k /h /y'
-        deep_copy_status = os.system(deep_copy_cmd)
-        if deep_copy_status != 0:
-            print("deploy_windows_qt_build: xcopy failed: status code = " + str(deep_copy_status))
+        # Clean up stale firmware binary files (CameraBoard_FX3, LedBoard, MainBoard & PMBoard) & copy changed files
+        try:
+            report = self.tree_sync.sync(source_path, target_path, self.const.DEPLOY_CLEANUP_PATTERNS)
+        except OSError as e:
+            print(f"deploy_windows_qt_build: sync failed: {e}")
             exit(-40)
-        else:
-            print("Deployed Windows Qt Build to deploy directory")
 
-        os.chdir(push_dir)
-        if debug:
-            print("chdir to: " + os.getcwd())
+        print(f"Deployed Windows Qt Build to deploy directory: {report.files_copied} file(s) "
+              f"({report.bytes_copied} bytes) copied, {report.files_removed} removed, "
+              f"{report.files_skipped} unchanged")
+        return report
 
     def get_build_version(self, group_path, ver_index):
         """
@@ -885,50 +2422,20 @@ class Builds(AutoTestFramework):
         zip_file_name = self.get_last_downloaded_zip_name(zip_file_path)
         print("Zip file name: " + zip_file_name)
 
-        # Go to zip file location dir (auto-test/X)
-        cur_dir = os.getcwd()
-        group_auto_test_dir = self.paths.AUTOTEST.value + zip_file_path
-        os.chdir(group_auto_test_dir)
+        # Zip file location dir (auto-test/X), used as absolute path
+        group_auto_test_dir = os.path.abspath(self.paths.AUTOTEST.value + zip_file_path)
+        zip_file = os.path.join(group_auto_test_dir, zip_file_name)
 
-        # Unzip & remove original zip file
-        if os.path.exists(zip_file_name):
-            shutil.unpack_archive(zip_file_name)
-            os.remove(zip_file_name)
+        # Unzip in parallel, cache the extracted tree & remove original zip file
+        # (nothing to do when the extracted tree came from the build cache)
+        # A stopped extract raises TestCancelled before the zip is removed or a partial tree is cached
+        if zip_file_name and os.path.exists(zip_file):
+            self.extractor.extract(zip_file, group_auto_test_dir)
+            os.remove(zip_file)
+            self.build_cache.add_tree(zip_file_name, group_auto_test_dir)
 
-        # Go back to Dir where we started & return zip file name
-        os.chdir(cur_dir)
         return zip_file_name
 
-    def update_latest(self, latest_build_zip, build_image_list, build_format):
-        """
-        Returns currently latest zip file name after comparing
-        :param latest_build_zip: Current latest build zip before comparing
-        :param build_image_list: List created from ARM64/Win/FPGA_html.json file
-        :param build_format: ARM/Win/FPGA_BUILD_FORMAT from constants
-        :return: 1 if build number is equal or greater than the one saved in last download file
-        """
-        # Initialize latest zip to be returned & items elements in List inputted
-        current_latest_zip = latest_build_zip
-        items = build_image_list['items']
-        items_length = len(items)
-
-        # Handle last page with null list in items exceptional case
-        if items_length == 0:
-            return current_latest_zip
-
-        # Iterate items: find name, extension, & zip name
-        for item in items:
-            item_name = item['name']
-            item_extension = item_name.split('.')[-1]
-            item_zip_name = item_name.split('/')[-1]
-            if item_extension != "zip":  # skip if not a zip file
-                continue
-            # Compare builds
-            if self.compare_build_name(item_zip_name, current_latest_zip, build_format) > 0:
-                current_latest_zip = item_zip_name  # found later build zip than current one
-
-        return current_latest_zip
-
     def is_downloaded(self, group_name, build_name):
         """
         Returns if name of the last build file is newer than the one previously downloaded or not
@@ -937,18 +2444,14 @@ class Builds(AutoTestFramework):
         :return: True if downloaded already or False if it has not been downloaded yet
         """
 
-        ci_build_name_saved = self.get_last_downloaded_build_name(group_name, self.paths.AT_DOWNLOADS.value)
-        if not os.path.exists(ci_build_name_saved):
-            print(ci_build_name_saved + " does not exists")
+        previous_build_name = self.build_index.get_downloaded(group_name)
+        if not previous_build_name:
+            print(f"No build of {group_name} downloaded yet")
             return False
 
         current_build_name = self.get_file_name_from_path_name(build_name)
         print("Current build name on Nexus Server: " + current_build_name)
-
-        savefile = open(ci_build_name_saved, "r")
-        previous_build_name = savefile.read()
         print("Previous downloaded build name: " + previous_build_name)
-        savefile.close()
 
         if previous_build_name == current_build_name:
             print(current_build_name + " was downloaded previously!")
@@ -957,17 +2460,308 @@ class Builds(AutoTestFramework):
         return False
 
     def set_last_downloaded_build_name(self, group_name, build_name):
-        """ Updates last_X_CI_downloaded.txt file """
-        # Store last_X_CI_downloaded.txt name in var
-        saved_file_name = self.get_last_downloaded_build_name(group_name, str(self.paths.AT_DOWNLOADS.value))
+        """ Updates the last downloaded build within the group's build index """
+        self.build_index.set_downloaded(group_name, self.get_file_name_from_path_name(build_name))
+
+
+class JsonLogStream:
+    """
+    Streaming Parser Class used to read the Qt TestApp JSON logs ({..., "tests": [{...}, ...], ...})
+    Class in Charge of:
+        - Reading the log in chunks & yielding the "tests" entries one at a time as they are decoded
+        - Letting callers stop early (stop iterating: the rest of the log is never read)
+        - Skipping the other top level values without decoding them
+    Memory holds 1 chunk & the entry being decoded, whatever the size of the log.
+    """
+    WHITESPACE = " \t\r\n"
+    NUMBER_CHARS = "0123456789+-.eE"                                            # A number may go on with these
+    STRUCTURE = re.compile(r'["{}\[\]]')                                        # Chars that open/close a value
+    STRING_END = re.compile(r'["\\]')                                           # Chars that end/escape in a string
+
+    def __init__(self, file_name, chunk_size=None):
+        self.file_name = file_name                                              # Local Variables
+        self.chunk_size = chunk_size or FwConstants.LOG_READ_CHUNK
+        self.decoder = json.JSONDecoder()
+        self.file = None
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.found_tests = False                                                # "tests" key reached
+
+    def __enter__(self):
+        self.file = open(self.file_name, "r", encoding="utf-8", errors="replace")
+        return self
+
+    def __exit__(self, *exc_info):
+        self.file.close()
+
+    def fill(self):
+        """ Drops the consumed part of the buffer & reads the next chunk, returns False at end of file """
+        chunk = self.file.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        self.eof = not chunk
+        return bool(chunk)
+
+    def next_char(self):
+        """ Skips whitespace & returns the next char (not consumed), "" at end of file """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in self.WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        """ Consumes the next char, raises ValueError if it is not one of chars """
+        char = self.next_char()
+        if not char or char not in chars:
+            raise ValueError(f"expected {chars!r} at offset {self.pos}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def decode(self):
+        """ Decodes the next JSON value, reading more chunks until it is complete """
+        while True:
+            self.next_char()
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                if self.eof or (end < len(self.buffer) and self.buffer[end] not in self.NUMBER_CHARS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill()
+
+    def skip(self):
+        """ Consumes the next JSON value without decoding it (strings & containers are scanned chunk by chunk) """
+        if self.next_char() not in '{["':
+            self.decode()                                                       # Number, true, false or null
+            return
+        depth = 0
+        in_string = False
+        while True:
+            match = (self.STRING_END if in_string else self.STRUCTURE).search(self.buffer, self.pos)
+            if match is None:
+                self.pos = len(self.buffer)                                     # Whole buffer scanned, drop it
+                if not self.fill():
+                    raise ValueError(f"unterminated value at end of {self.file_name}")
+                continue
+            char = match.group()
+            self.pos = match.end()
+            if char == "\\":
+                if self.pos >= len(self.buffer) and not self.fill():
+                    raise ValueError(f"unterminated string at end of {self.file_name}")
+                self.pos += 1                                                   # Escaped char
+            elif char == '"':
+                in_string = not in_string
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+            if depth == 0 and not in_string:
+                return
+
+    def tests(self):
+        """ Yields every entry of the top level "tests" array """
+        self.expect("{")
+        if self.next_char() == "}":
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            if key == "tests":
+                self.found_tests = True
+                self.expect("[")
+                if self.next_char() == "]":
+                    self.pos += 1
+                else:
+                    while True:
+                        yield self.decode()
+                        if self.expect(",]") == "]":
+                            break
+            else:
+                self.skip()                                                     # Other top level values
+            if self.expect(",}") == "}":
+                return
+
+
+class LogCatalog(AutoTestFramework):
+    """
+    Persistent catalog of the Qt test logs in the log dir (auto-test/log_catalog.json)
+    Class in Charge of:
+        - Recording (test case, mtime, size) of every log, as it is produced or when the dir changes
+        - Rescanning the log dir only when its mtime changes & only stat-ing new files
+        - Answering the latest log of a test case from a memo (1 dict lookup once known)
+        - Archiving logs older than LOG_RETENTION_DAYS into monthly zips (archive_if_due, once a day, after a run)
+    The catalog is loaded once & shared by every instance
+    """
+    catalog = None                                                  # {dir_mtime, archived, logs, latest}
+    lock = threading.RLock()
+
+    def __init__(self, stop_event, log_dir=None):
+        super().__init__(stop_event)
+        self.log_dir = log_dir or str(self.paths.AT_LOG.value)              # Local Variables
+
+    def load(self):
+        """ Returns the catalog, reading it from disk on first use """
+        with self.lock:
+            if LogCatalog.catalog is None:
+                try:
+                    with open(self.paths.LOG_CATALOG.value, "r") as file:
+                        LogCatalog.catalog = json.load(file)
+                except (OSError, ValueError):
+                    LogCatalog.catalog = {"dir_mtime": None, "archived": 0, "logs": {}, "latest": {}}
+            return LogCatalog.catalog
+
+    def save(self):
+        """ Writes the catalog to disk (atomically, via a temp file) """
+        with self.lock:
+            catalog_file = self.paths.LOG_CATALOG.value
+            try:
+                with open(catalog_file + ".tmp", "w") as file:
+                    json.dump(self.load(), file)
+                os.replace(catalog_file + ".tmp", catalog_file)
+            except OSError as e:
+                print(f"LogCatalog: Error saving {catalog_file}: {e}")
+
+    @staticmethod
+    def belongs(name, test_case_name):                              # Log of test_case_name (Basic_1 not Basic_10)
+        return (name.startswith(test_case_name) and
+                name[len(test_case_name):len(test_case_name) + 1] in tuple(FwConstants.LOG_NAME_SEPARATORS))
+
+    @staticmethod
+    def is_newer(log, other):                                       # Compare (test case, mtime, size) entries
+        return (log[1][1], log[0]) > (other[1][1], other[0])
+
+    def add(self, catalog, name, entry):
+        """ Adds a log to the catalog & to the latest memo of every test case it belongs to """
+        catalog["logs"][name] = entry
+        for test_case, latest_name in catalog["latest"].items():
+            latest = catalog["logs"].get(latest_name)
+            if self.belongs(name, test_case) and (latest is None or
+                                                  self.is_newer((name, entry), (latest_name, latest))):
+                catalog["latest"][test_case] = name
+
+    def refresh(self):
+        """ Updates the catalog w/ the logs added/removed since the last scan (only if the dir changed) """
+        with self.lock:
+            catalog = self.load()
+            try:
+                dir_mtime = os.stat(self.log_dir).st_mtime_ns
+            except OSError:
+                return
+            if dir_mtime == catalog["dir_mtime"]:
+                return
+
+            with os.scandir(self.log_dir) as entries:
+                names = {entry.name for entry in entries
+                         if entry.name.endswith(".log") and entry.is_file()}
+            removed = set(catalog["logs"]) - names
+            added = names - set(catalog["logs"])
+            for name in removed:                                                    # Removed logs
+                del catalog["logs"][name]
+            catalog["latest"] = {test_case: name for test_case, name in catalog["latest"].items()
+                                 if name in catalog["logs"]}
+            for name in added:                                                      # New logs
+                try:
+                    stat = os.stat(os.path.join(self.log_dir, name))
+                except OSError:
+                    continue
+                self.add(catalog, name, ["", stat.st_mtime, stat.st_size])
+            catalog["dir_mtime"] = dir_mtime
+            if removed or added:                                                    # Only write when logs changed
+                self.save()
+
+    def record(self, test_case_name, log_file):
+        """ Records a log just produced by a test case """
+        with self.lock:
+            try:
+                stat = os.stat(log_file)
+            except OSError:
+                return
+            catalog = self.load()
+            name = os.path.basename(log_file)
+            catalog["latest"].setdefault(test_case_name, name)
+            self.add(catalog, name, [test_case_name, stat.st_mtime, stat.st_size])
+            self.save()
+
+    def latest(self, test_case_name):
+        """ Returns the latest log file of a test case, "" if none """
+        with self.lock:
+            self.refresh()
+            catalog = self.load()
+            name = catalog["latest"].get(test_case_name)
+            if name is None:                                                # 1st lookup: find & memoize
+                logs = [log for log in catalog["logs"].items() if self.belongs(log[0], test_case_name)]
+                if not logs:
+                    return ""
+                name = logs[0]
+                for log in logs[1:]:
+                    if self.is_newer(log, name):
+                        name = log
+                name = name[0]
+                catalog["latest"][test_case_name] = name
+            return f"{self.log_dir}/{name}"
+
+    def archive_if_due(self):
+        """ Archives old logs if the last archive is over a day old (maintenance, run between Test Runs) """
+        with self.lock:
+            self.refresh()
+            if time.time() - self.load()["archived"] > 24 * 3600:
+                return self.archive()
+            return 0
 
-        # Update file
-        saved_file = open(saved_file_name, "w")
-        saved_file.write(self.get_file_name_from_path_name(build_name))
-        saved_file.close()
+    def archive(self, retention_days=None):
+        """
+        Moves the logs older than the retention period into <log dir>/archive/logs_<YYYY>_<MM>.zip
+        :param retention_days: Days logs are kept in the log dir, defaults to LOG_RETENTION_DAYS
+        :return: Number of logs archived
+        """
+        import zipfile
+        with self.lock:
+            catalog = self.load()
+            cutoff = time.time() - (retention_days or self.const.LOG_RETENTION_DAYS) * 24 * 3600
+            archive_dir = os.path.join(self.log_dir, "archive")
+            by_month = {}
+            for name, entry in catalog["logs"].items():
+                if entry[1] < cutoff:
+                    by_month.setdefault(datetime.fromtimestamp(entry[1]).strftime("%Y_%m"), []).append(name)
+
+            archived = 0
+            for month, names in by_month.items():
+                os.makedirs(archive_dir, exist_ok=True)
+                with zipfile.ZipFile(os.path.join(archive_dir, f"logs_{month}.zip"), "a",
+                                     zipfile.ZIP_DEFLATED) as archive:
+                    for name in names:
+                        log_file = os.path.join(self.log_dir, name)
+                        try:
+                            archive.write(log_file, name)
+                            os.remove(log_file)
+                        except OSError as e:
+                            print(f"LogCatalog: Error archiving {name}: {e}")
+                            continue
+                        del catalog["logs"][name]
+                        archived += 1
+            catalog["latest"] = {test_case: name for test_case, name in catalog["latest"].items()
+                                 if name in catalog["logs"]}
+            catalog["archived"] = time.time()
+            if archived:
+                catalog["dir_mtime"] = None                                 # Dir changed by us
+                print(f"LogCatalog: archived {archived} log(s) older than the retention period")
+            self.save()
+            return archived
 
 
 class Logging(AutoTestFramework):
+    version_extractors = None                                       # Compiled FW_VERSION_COMMANDS (shared)
+
+    def __init__(self, stop_event):
+        super().__init__(stop_event)
+        self.log_catalog = LogCatalog(self.stop_event)                  # Class Instances
+
     def log_init(self):
         """ Initialize Logging under auto-test\deploy\log """
         print("\nauto_test_main: initializing logging")
@@ -978,71 +2772,81 @@ class Logging(AutoTestFramework):
         """
         Returns the Firmware versions from the get_firmware_versions test case
         :param test_case_name: String with full Test Case name (found in TestCases const) & version
+        :return: Dict of InstrumentInfo field: version (Ex: {'main': '1.2.3'}), only the versions found
         """
         # Get latest test case Log
-        test_log_file_list = str(self.paths.AT_LOG.value) + '/' + test_case_name + "*.log"
-        latest_log_file = ""
-        for file in glob.glob(test_log_file_list):
-            if file > latest_log_file:
-                latest_log_file = file
+        latest_log_file = self.get_latest_log(test_case_name)
+        versions = {}
 
-        # Open Log in Read Mode
+        # Stream the 'tests' entries of the Log (stops reading once every version is found)
         try:
-            file = open(latest_log_file, "r")
-        except Exception as e:
-            print(f"get_test_result: Error reading log file: {e}")
-
-        # Parse the JSON file
-        test_result_json = json.load(file)
-
-        # Check if the 'tests' key exists and access it safely
-        if 'tests' in test_result_json:
-            tests = test_result_json['tests']
-
-            # Iterate through the tests and process them
-            for test in tests:
-                cmd_str = test.get('cmdStr', '')                                        # Access the 'cmdStr' safely
-                log_str = test.get('logStr', '')                                        # Access 'logStr' safely
-
-                # Extract the versions based on cmdStr for each firmware type
-                if cmd_str == "version(firmware,main,)":
-                    self.extract_version(log_str, 'main')
+            with JsonLogStream(latest_log_file) as log_stream:
+                versions = self.extract_versions(log_stream.tests())
+                if not log_stream.found_tests:
+                    print("'tests' key not found in the JSON structure.")
+        except (OSError, ValueError) as e:
+            print(f"get_fw_versions: Error reading log file {latest_log_file}: {e}")
 
-                elif cmd_str == "version(firmware,camera,)":
-                    self.extract_version(log_str, 'camera')
+        return versions
 
-                elif cmd_str == "version(firmware,led,)":
-                    self.extract_version(log_str, 'led')
+    def get_latest_log(self, test_case_name):
+        """ Returns the latest log file of a test case, "" if none """
+        return self.log_catalog.latest(test_case_name)
 
-                elif cmd_str == "version(firmware,powermonitor,)":
-                    self.extract_version(log_str, 'powermonitor')
-        else:
-            print("'tests' key not found in the JSON structure.")
-
-        # Close file & Report out
-        file.close()
-
-        return self.inst_info.main, self.inst_info.camera, self.inst_info.led, self.inst_info.powermonitor
-
-    def extract_version(self, log_str, fw_type):
-        """
-        Helper function to extract firmware version and assign it to the respective attribute.
-        :param log_str: Log string containing firmware version information
-        :param fw_type: Type of firmware (main, camera, led, powermonitor)
-        """
-        version_match = re.search(r"firmwareVersion = ([\d.]+)", log_str)
-        if version_match:
-            version = version_match.group(1)
-            if fw_type == 'main':
-                self.inst_info.main = version
-            elif fw_type == 'camera':
-                self.inst_info.camera = version
-            elif fw_type == 'led':
-                self.inst_info.led = version
-            elif fw_type == 'powermonitor':
-                self.inst_info.powermonitor = version
-        else:
-            print(f"No {fw_type} firmware version found in the logStr.")
+    def wait_for_log(self, test_case_name, start_time, timeout=None):
+        """
+        Waits until the test case log written since start_time stops growing (or timeout/stop)
+        :param test_case_name: String with full Test Case name (found in TestCases const) & version
+        :param start_time: Time the test case started
+        :param timeout: Seconds to wait at most, defaults to LOG_SETTLE_TIMEOUT
+        :return: Log file name, "" if no log was written in time
+        """
+        deadline = time.time() + (timeout or self.const.LOG_SETTLE_TIMEOUT)
+        last_size = -1
+        while True:
+            log_file = self.get_latest_log(test_case_name)
+            try:
+                stat = os.stat(log_file) if log_file else None
+            except OSError:
+                stat = None
+            if stat is not None and stat.st_mtime >= start_time - 1:
+                if stat.st_size == last_size:                              # Same size over 2 polls: complete
+                    self.log_catalog.record(test_case_name, log_file)
+                    return log_file
+                last_size = stat.st_size
+            if time.time() >= deadline or self.stop_event.wait(0.2):
+                return ""
+
+    @classmethod
+    def get_version_extractors(cls):
+        """ Returns the FW_VERSION_COMMANDS table as cmdStr: (compiled regex, field), compiled once """
+        if cls.version_extractors is None:
+            cls.version_extractors = {cmd_str: (re.compile(pattern), field)
+                                      for cmd_str, (field, pattern) in FwConstants.FW_VERSION_COMMANDS.items()}
+        return cls.version_extractors
+
+    def extract_versions(self, tests):
+        """
+        Extracts the firmware versions of test entries in 1 pass (1 dict lookup per entry)
+        :param tests: Iterable of 'tests' entries (dicts w/ cmdStr & logStr)
+        :return: Dict of field: version, stops consuming tests once every field is found
+        """
+        extractors = self.get_version_extractors()
+        field_count = len({field for _, field in extractors.values()})
+        versions = {}
+        for test in tests:
+            extractor = extractors.get(test.get('cmdStr', ''))
+            if extractor is None:
+                continue
+            regex, field = extractor
+            version_match = regex.search(test.get('logStr', ''))
+            if version_match:
+                versions[field] = version_match.group(1)
+                if len(versions) == field_count:
+                    break
+            else:
+                print(f"No {field} firmware version found in the logStr.")
+        return versions
 
     def get_unix_time(self, test_suite):
         """
@@ -1077,18 +2881,13 @@ class Printing(AutoTestFramework):
         """ Printout every time a new Test Case Begins """
         print(f"\n{test_num} - {test_case} Test Starting")
 
-    def print_results(self):
-        """ Printout ResultCounters at the end of Test Execution """
-        results = []                                                                # List to collect each result string
-
-        for test_case in self.tests:
-            test_name = test_case.value[1]                                          # Get from TestCases
-            pass_count = getattr(self.results, f"{test_case.name.lower()}_pass")    # Match pass/fail
-            fail_count = getattr(self.results, f"{test_case.name.lower()}_fail")
-
-            # Print only if the test ran
-            if pass_count != 0 or fail_count != 0:
-                result = f"{test_name}\t\t\t\t -  Pass: {pass_count}\t\t -  Fail: {fail_count}"
-                results.append(result)                                              # Add each result to the list
-
-        return "\n".join(results)                                                   # Return as single string w/ newline
+    def print_results(self, test_cases=None, results=None):
+        """
+        Printout results at the end of Test Execution
+        :param test_cases: TestCases members selected for the run, None for every TestCases member
+        :param results: ResultStore of the run, None for this object's store
+        """
+        results = results or self.results
+        summary = results.summary(self.tests if test_cases is None else test_cases)
+        print(summary)
+        return summary
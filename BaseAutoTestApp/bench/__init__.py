@@ -0,0 +1,27 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       __init__.py
+Purpose:    Auto-Test framework benchmarks (run from BaseAutoTestApp: python -m bench.<script>)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import os
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:                                 # Framework modules are top level modules of the App dir
+    sys.path.insert(0, APP_DIR)
+
+
+def best_of(function, repeat=5):
+    """ Returns (best wall time in seconds, last result) of repeat calls to function """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start_time)
+    return best, result
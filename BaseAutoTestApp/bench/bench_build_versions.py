@@ -0,0 +1,86 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       bench_build_versions.py
+Purpose:    Latest build of a synthetic 100k-item Nexus listing: BuildVersion keys vs per-item string compare
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import argparse
+import random
+from bench import best_of
+from autotest_framework import BuildVersion
+from constants import FwConstants
+
+
+def legacy_compare_build_name(build_1, build_2, build_format):
+    """ Former Builds.compare_build_name: re-splits both names on every comparison (major ignored) """
+    if build_2 == "":
+        return 1
+    if build_format == 1:
+        minor_number_1, build_number_1 = int(build_1.split('.')[1]), int(build_1.split('.')[2])
+        minor_number_2, build_number_2 = int(build_2.split('.')[1]), int(build_2.split('.')[2])
+    else:
+        minor_number_1, build_number_1 = int(build_1.split('_')[5]), int(build_1.split('_')[6])
+        minor_number_2, build_number_2 = int(build_2.split('_')[5]), int(build_2.split('_')[6])
+    if minor_number_1 > minor_number_2:
+        return 1
+    if minor_number_1 == minor_number_2 and build_number_1 > build_number_2:
+        return 1
+    return 0 if (minor_number_1, build_number_1) == (minor_number_2, build_number_2) else -1
+
+
+def legacy_latest(items, build_format):                     # Former Builds.update_latest loop
+    latest = ""
+    for item in items:
+        item_name = item['name']
+        item_zip_name = item_name.split('/')[-1]
+        if item_name.split('.')[-1] != "zip":
+            continue
+        if legacy_compare_build_name(item_zip_name, latest, build_format) > 0:
+            latest = item_zip_name
+    return latest
+
+
+def build_version_latest(items, build_format):              # Builds.refresh_build_index parsing
+    versions = (BuildVersion.parse(item['name'].split('/')[-1], build_format) for item in items
+                if item['name'].endswith(".zip"))
+    latest = BuildVersion.latest(version for version in versions if version is not None)
+    return latest.zip_name if latest else ""
+
+
+def synthetic_items(count, build_format, seed=0):
+    """ Returns a Nexus search page 'items' list of count build zips (+ 1 checksum file per 10 zips) """
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        minor, build = rng.randrange(100), rng.randrange(10000)
+        if build_format == FwConstants.FPGA_BUILD_FORMAT:
+            zip_name = f"ChemiDocGo_CameraBoard_FPGA_100T_1_{minor}_{build}_CI.zip"
+        else:
+            zip_name = f"ChemiDocGo_Windows_CI_1.{minor}.{build}.zip"
+        items.append({'name': f"/Windows/CI/{zip_name}"})
+        if rng.randrange(10) == 0:
+            items.append({'name': f"/Windows/CI/{zip_name}.sha1"})
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=100_000, help="Build zips in the synthetic listing")
+    args = parser.parse_args()
+
+    for format_name, build_format in (("ARM64/Windows", FwConstants.WIN_BUILD_FORMAT),
+                                      ("FPGA", FwConstants.FPGA_BUILD_FORMAT)):
+        items = synthetic_items(args.items, build_format)
+        legacy_time, legacy = best_of(lambda: legacy_latest(items, build_format))
+        keys_time, latest = best_of(lambda: build_version_latest(items, build_format))
+        assert BuildVersion.parse(legacy, build_format)[:3] == BuildVersion.parse(latest, build_format)[:3]
+        print(f"{format_name:<14} {len(items)} items: compare_build_name {legacy_time * 1000:7.1f} ms, "
+              f"BuildVersion {keys_time * 1000:7.1f} ms ({legacy_time / keys_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
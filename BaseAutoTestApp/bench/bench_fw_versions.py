@@ -0,0 +1,90 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       bench_fw_versions.py
+Purpose:    Firmware version extraction on large synthetic Qt TestApp logs: FW_VERSION_COMMANDS table
+            (streamed & in memory) vs the former json.load + if/elif chain
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import argparse
+import json
+import os
+import re
+import tempfile
+from bench import best_of
+from autotest_framework import CancellationToken, JsonLogStream, Logging
+
+FW_TYPES = ("main", "camera", "led", "powermonitor")
+
+
+def legacy_get_fw_versions(log_file):
+    """ Former Logging.get_fw_versions: json.load, if/elif chain on cmdStr & uncompiled regex per version entry """
+    versions = {}
+    with open(log_file, "r") as file:
+        tests = json.load(file).get('tests', [])
+    for test in tests:
+        cmd_str = test.get('cmdStr', '')
+        log_str = test.get('logStr', '')
+        if cmd_str == "version(firmware,main,)":
+            fw_type = 'main'
+        elif cmd_str == "version(firmware,camera,)":
+            fw_type = 'camera'
+        elif cmd_str == "version(firmware,led,)":
+            fw_type = 'led'
+        elif cmd_str == "version(firmware,powermonitor,)":
+            fw_type = 'powermonitor'
+        else:
+            continue
+        version_match = re.search(r"firmwareVersion = ([\d.]+)", log_str)
+        if version_match:
+            versions[fw_type] = version_match.group(1)
+    return versions
+
+
+def synthetic_tests(entries, versions_at):
+    """ Returns 'tests' entries: filler commands w/ the 4 version commands at the start, end or everywhere """
+    tests = [{"cmdStr": f"capture(image,{number},)", "logStr": f"exposure = {number} ms", "result": "Pass"}
+             for number in range(entries)]
+    version_tests = [{"cmdStr": f"version(firmware,{fw_type},)", "logStr": f"firmwareVersion = 1.{number}.42",
+                      "result": "Pass"} for number, fw_type in enumerate(FW_TYPES)]
+    if versions_at == "start":
+        return version_tests + tests
+    if versions_at == "end":
+        return tests + version_tests
+    return [version_tests[number // 2 % 4] if number % 2 else test for number, test in enumerate(tests)]   # Every other
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=1_000_000, help="'tests' entries per synthetic log")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measure (best kept)")
+    args = parser.parse_args()
+
+    logging = Logging(CancellationToken())
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for versions_at in ("start", "end", "every"):
+            tests = synthetic_tests(args.entries, versions_at)
+            log_file = os.path.join(tmp_dir, f"get_firmware_versions_{versions_at}.log")
+            with open(log_file, "w") as file:
+                json.dump({"testCase": "get_firmware_versions", "tests": tests}, file)
+
+            legacy_time, legacy = best_of(lambda: legacy_get_fw_versions(log_file), args.repeat)
+            table_time, table = best_of(lambda: logging.extract_versions(tests), args.repeat)
+
+            def stream():
+                with JsonLogStream(log_file) as log_stream:
+                    return logging.extract_versions(log_stream.tests())
+
+            stream_time, streamed = best_of(stream, args.repeat)
+            if versions_at != "every":                              # Every other: first match wins vs last
+                assert legacy == table == streamed, (legacy, table, streamed)
+            print(f"{len(tests)} entries, versions at {versions_at:<5} ({os.path.getsize(log_file) >> 20} MB): "
+                  f"json.load + if/elif {legacy_time:6.3f} s, stream + table {stream_time:6.3f} s, "
+                  f"table in memory {table_time:6.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       bench_startup.py
+Purpose:    Cold start of the App: -X importtime of the framework modules & time to first window
+            (--check fails if the first window misses GuiElements.FIRST_WINDOW_TARGET_MS)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from bench import APP_DIR
+from constants import GuiElements
+
+MODULES = ("autotest_framework", "ui_framework", "ui")              # main.py import chain, innermost first
+LAZY_MODULES = ("asyncio", "http.client", "zipfile", "send2trash", "test_suites.connect")   # Not at start-up
+
+# Run in a fresh interpreter: prints once the main window is mapped, then closes the App
+FIRST_WINDOW = """
+import time
+from ui import AutoTestApp
+app = AutoTestApp()
+def mapped(event):
+    if event.widget is app.root:
+        print("mapped", flush=True)
+        app.root.after(0, app.root.destroy)
+app.root.bind("<Map>", mapped, add="+")
+app.run()
+"""
+
+
+def import_times(module):
+    """ Returns ({imported module: cumulative us}, {imported module: self us}) of a cold import of module """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=APP_DIR,
+                            capture_output=True, text=True)
+    if result.returncode:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+    cumulative, own = {}, {}
+    for line in result.stderr.splitlines():                 # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+        own[name.strip()] = int(self_us)
+    return cumulative, own
+
+
+def first_window_ms():
+    """ Returns ms from launching a fresh interpreter to the main window being mapped """
+    start_time = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", FIRST_WINDOW], cwd=APP_DIR, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    elapsed = (time.perf_counter() - start_time) * 1000
+    _, stderr = process.communicate(timeout=30)
+    if line.strip() != "mapped":
+        raise RuntimeError(stderr.strip().splitlines()[-1] if stderr.strip() else "window never shown")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=15, help="Cold starts per measure (median kept)")
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports listed")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit 1 if the first window misses its target, 2 if it cannot be measured here")
+    args = parser.parse_args()
+
+    for module in MODULES:
+        try:
+            runs = [import_times(module) for _ in range(args.runs)]
+        except ImportError as e:
+            print(f"import {module}: skipped ({e})")
+            continue
+        print(f"import {module}: {statistics.median(run[0][module] for run in runs) / 1000:.1f} ms cumulative "
+              f"(median of {args.runs})")
+        cumulative, own = runs[-1]
+        eager = [name for name in LAZY_MODULES if name in cumulative]
+        print(f"\tlazy modules imported at start-up: {', '.join(eager) or 'none'}")
+        for name in sorted(own, key=own.get, reverse=True)[:args.top]:
+            print(f"\t{own[name] / 1000:7.1f} ms  {name}")
+
+    target = GuiElements.FIRST_WINDOW_TARGET_MS
+    try:
+        first_window = statistics.median(first_window_ms() for _ in range(args.runs))
+    except (RuntimeError, subprocess.TimeoutExpired) as e:
+        print(f"first window: skipped ({e})")
+        return 2 if args.check else 0
+    print(f"first window: {first_window:.0f} ms (median of {args.runs}), target {target} ms: "
+          f"{'met' if first_window <= target else 'MISSED'}")
+    return 1 if args.check and first_window > target else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
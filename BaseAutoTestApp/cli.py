@@ -0,0 +1,219 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       cli.py
+Purpose:    Headless command line entry point (no Tk) for scripted/CI Auto-Test runs
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import argparse
+import contextlib
+import json
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ElementTree
+from autotest_framework import (Builds, CancellationToken, LogCatalog, ResultStore, SuiteRegistry, SuiteRun,
+                                TestCancelled, TestScheduler, TestSuiteBatchGeneration)
+from constants import Flags, InstrumentInfo, InstrumentPool, TestCases
+
+EXIT_PASS = 0                       # Every selected Test Suite passed
+EXIT_FAIL = 1                       # A Test Suite failed or did not run
+EXIT_USAGE = 2                      # Bad arguments (same as argparse)
+EXIT_CANCELLED = 130                # Stopped w/ Ctrl+C
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run Auto-Test Suites without the GUI")
+    parser.add_argument("tests", nargs="*", help="TestCases names to run, in order (Ex: connect)")
+    parser.add_argument("--all", action="store_true", help="Run every TestCases member")
+    parser.add_argument("--list", action="store_true", help="List the TestCases names & exit")
+    parser.add_argument("--instrument", action="append", default=[], metavar="IP",
+                        help="Instrument to run on (repeat to spread Test Suites across instruments)")
+    parser.add_argument("--jobs", type=int, default=0, metavar="N",
+                        help="Max instruments used at the same time (default: every --instrument)")
+    parser.add_argument("--fetch-builds", action="store_true",
+                        help="Pull the latest CI builds from Nexus & deploy the Windows Qt build first")
+    parser.add_argument("--json", metavar="FILE", help="Write results as JSON (- for stdout)")
+    parser.add_argument("--junit", metavar="FILE", help="Write results as JUnit XML (- for stdout)")
+    parser.add_argument("--debug", action="store_true", help="Enable DEBUG_MODE printouts")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        return parser, args
+    if args.all == bool(args.tests):
+        parser.error("give test names or --all (not both)")
+    if args.jobs < 0:
+        parser.error("--jobs must be positive")
+    return parser, args
+
+
+def select_test_cases(parser, args, registry):
+    """ Returns [(TestCases member, suite class)] of the selection, exits w/ EXIT_USAGE on unknown names """
+    if args.all:
+        test_cases = [test_case for test_case in TestCases if test_case.is_runnable()]     # Same as the GUI
+    else:
+        test_cases = []
+        for name in args.tests:
+            test_case = next((tc for tc in TestCases if registry.normalize(tc.name) == registry.normalize(name)), None)
+            if test_case is None:
+                parser.error(f"unknown test {name!r} (see --list)")
+            test_cases.append(test_case)
+
+    selection = []
+    for test_case in test_cases:
+        suite_class = registry.get_class(test_case.name)
+        if suite_class is None:
+            parser.error(f"no Test Suite found in {registry.suite_dir} for {test_case.name}")
+        selection.append((test_case, suite_class))
+    return selection
+
+
+def run_sequential(stop_event, suite_classes, results, endpoint):
+    """ Runs Test Suites one after another on 1 instrument, stops at the first failure (like the GUI) """
+    runs = []
+    inst_info = InstrumentInfo
+    if endpoint:
+        inst_info.ip = endpoint
+    for suite_class in suite_classes:
+        if stop_event.is_set():
+            break
+        suite = TestScheduler.bind_instrument(suite_class(stop_event), inst_info, results)
+        start_time = time.time()
+        try:
+            passed = bool(suite.run())
+        except Exception as e:
+            print(f"{suite_class.__name__} raised: {e}")
+            passed = False
+        runs.append(SuiteRun(endpoint or "local", suite_class.__name__, passed, time.time() - start_time))
+        if not passed:
+            break
+    return runs
+
+
+def run_selection(stop_event, args, selection, results):
+    """ Fetches builds (optional), generates the .tst files & runs the selection, returns [SuiteRun] """
+    if args.fetch_builds:
+        builds = Builds(stop_event)
+        fetched = builds.get_latest_builds(Flags.DEBUG_MODE)
+        if not all(fetched.values()):
+            print(f"Fetching builds failed: {fetched}")
+        try:
+            builds.deploy_windows_qt_build(Flags.DEBUG_MODE)
+        except TestCancelled as e:
+            print(f"Deploy stopped: {e}")
+            return []
+
+    endpoints = args.instrument or list(InstrumentPool.ENDPOINTS)
+    if args.jobs:
+        endpoints = endpoints[:args.jobs]
+    suite_classes = [suite_class for _, suite_class in selection]
+
+    batch_gen = TestSuiteBatchGeneration(stop_event)
+    batch_gen.run([test_case for test_case, _ in selection], results)  # Generate all selected .tst files once
+    if len(endpoints) > 1:
+        return TestScheduler(stop_event, endpoints).run(suite_classes, results)
+    return run_sequential(stop_event, suite_classes, results, endpoints[0] if endpoints else "")
+
+
+def build_report(selection, runs, results, cancelled):
+    """ Returns the run report as a JSON-ready dict """
+    ran = {run.suite_name for run in runs}
+    tests = []
+    for test_case, suite_class in selection:
+        record = results.get(ResultStore.result_name(test_case))
+        tests.append({"test": test_case.name, "name": test_case.value[1], "suite": suite_class.__name__,
+                      "ran": suite_class.__name__ in ran, "pass_count": record.passed,
+                      "fail_count": record.failed, "seconds": round(record.seconds, 3)})
+    return {"run_id": results.run_id,
+            "passed": bool(runs) and all(run.passed for run in runs) and all(test["ran"] for test in tests),
+            "cancelled": cancelled,
+            "runs": [run._asdict() for run in runs],
+            "tests": tests}
+
+
+def build_junit(report):
+    """ Returns the run report as a JUnit XML tree (1 testcase per Test Suite run, skipped if it never ran) """
+    runs = report["runs"]
+    skipped = [test for test in report["tests"] if not test["ran"]]
+    suites = ElementTree.Element("testsuites")
+    suite = ElementTree.SubElement(suites, "testsuite", name="AutoTest", id=report["run_id"],
+                                   tests=str(len(runs) + len(skipped)),
+                                   failures=str(sum(not run["passed"] for run in runs)),
+                                   skipped=str(len(skipped)),
+                                   time=f"{sum(run['duration'] for run in runs):.3f}")
+    for run in runs:
+        case = ElementTree.SubElement(suite, "testcase", classname=run["endpoint"], name=run["suite_name"],
+                                      time=f"{run['duration']:.3f}")
+        if not run["passed"]:
+            ElementTree.SubElement(case, "failure", message=f"{run['suite_name']} failed on {run['endpoint']}")
+    for test in skipped:
+        case = ElementTree.SubElement(suite, "testcase", classname="", name=test["suite"], time="0")
+        ElementTree.SubElement(case, "skipped", message="cancelled" if report["cancelled"] else "not run")
+    return ElementTree.ElementTree(suites)
+
+
+def write_output(file_name, write):                         # Write to file_name ("-" for stdout)
+    if file_name == "-":
+        write(sys.stdout)
+        sys.stdout.write("\n")
+    else:
+        with open(file_name, "w", encoding="utf-8") as file:
+            write(file)
+
+
+def main(argv=None):
+    parser, args = parse_args(argv)
+    if args.list:
+        for test_case in TestCases:
+            print(f"{test_case.name}\t{test_case.value[1]}")
+        return EXIT_PASS
+    Flags.DEBUG_MODE = Flags.DEBUG_MODE or args.debug
+
+    stop_event = CancellationToken()
+    registry = SuiteRegistry(stop_event)
+    selection = select_test_cases(parser, args, registry)
+    results = ResultStore()
+    runs = []
+
+    # Framework printouts go to stderr when results are written to stdout
+    machine_stdout = "-" in (args.json, args.junit)
+    with contextlib.redirect_stdout(sys.stderr) if machine_stdout else contextlib.nullcontext():
+        done = threading.Event()                            # Not Thread.join: an interrupted join can
+                                                            # report the worker dead while it still runs
+        def work():
+            try:
+                runs.extend(run_selection(stop_event, args, selection, results))
+            finally:
+                done.set()
+
+        threading.Thread(target=work, name="cli-run").start()
+        try:
+            while not done.wait(0.2):                       # Keeps main thread responsive to Ctrl+C
+                pass
+        except KeyboardInterrupt:
+            print("Cancelling...", file=sys.stderr)
+            stop_event.set()                                # Waits return, Qt child killed
+            done.wait()
+        if not stop_event.is_set():
+            LogCatalog(stop_event).archive_if_due()         # Log maintenance once the run is over
+
+    report = build_report(selection, runs, results, stop_event.is_set())
+    if args.json:
+        write_output(args.json, lambda file: json.dump(report, file, indent=2))
+    if args.junit:
+        write_output(args.junit, lambda file: build_junit(report).write(file, encoding="unicode",
+                                                                        xml_declaration=True))
+    if not machine_stdout:
+        for run in runs:
+            print(f"{run.endpoint}\t{run.suite_name}: {'Pass' if run.passed else 'Fail'} ({run.duration:.1f}s)")
+
+    if stop_event.is_set():
+        return EXIT_CANCELLED
+    return EXIT_PASS if report["passed"] else EXIT_FAIL
+
+
+if __name__ == "__main__":          # Python construct to ensure script run directly (not imported as module)
+    sys.exit(main())
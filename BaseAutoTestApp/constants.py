@@ -34,6 +34,14 @@ class GuiElements:                              # GUI Elements Constants
     XL_FONT_SIZE = 24
     L_FONT_SIZE = 16
     M_FONT_SIZE = 12
+    UI_POLL_MS = 50                             # UI event queue drained every X ms on the Tk main loop
+    UI_DRAIN_MAX = 2000                         # Max UI events handled per drain (rest waits for next one)
+    STATUS_MAX_LINES = 1000                     # Status console lines kept on screen (full log in STATUS_LOG)
+    UI_WORKERS = 2                              # Worker pool running button commands off the Tk main loop
+    BUSY_MSG = " ..."                           # Appended to a button label while its command runs
+    TEST_LIST_ROWS = 10                         # Test selection checkbuttons built (list scrolls through them)
+    FIRST_WINDOW_TARGET_MS = 1000               # Start-up budget: launch to main window shown
+                                                # (checked by python -m bench.bench_startup --check)
 
 
 # Paths of files & directories of interest
@@ -45,12 +53,18 @@ class Paths(Enum):
     AT_ARM64 = r"auto-test\ARM64\CI"
     AT_WIN = r"auto-test\Windows\CI"
     AT_DOWNLOADS = r"auto-test-downloads"
+    STATUS_LOG = r"auto-test-status.log"                                # Full status console log
     TEST_SUITES = r"test_suites"
+    SUITE_REGISTRY = r"auto-test\suite_registry.json"                  # Test Suites found in test_suites (cache)
+    LOG_CATALOG = r"auto-test\log_catalog.json"                        # Index of the Qt test logs (outside AT_LOG)
     TEMPLATE_CONFIG = r"1template/config"
     ARM64_GROUP = "/ARM64/CI"                                           # Builds dir (within auto-test-downloads)
     WINDOWS_GROUP = "/Windows/CI"
     FPGA_GROUP = "/FPGA/CI"
     QT_EXE = "FwTestApp.exe"
+    NEXUS_HOST = "10.240.20.40"                                         # Nexus server hosting the CI builds
+    NEXUS_SEARCH = "/service/rest/v1/search?repository=ChemiDocGo-FW&group="
+    NEXUS_REPO = "/repository/ChemiDocGo-FW"
 
 
 # Feature Enable/Disable Flags
@@ -67,7 +81,14 @@ class FwConstants:
     TEST_FILE_TYPE = ".tst"                     # QT Test Script filetype
     MAIN = "Instr_MainBoard_FW"                  # Firmware Prefixes
     FW_VER = "CI"
-    BOOT_TIME_DELAY = 60                        # CDG estimate boot time
+    BOOT_TIME_DELAY = 60                        # CDG estimate boot time (ceiling of readiness wait)
+    FAIL_DELAY = 5                              # Ceiling of readiness wait after a failed test
+    RESTART_DOWN_TIMEOUT = 15                   # Seconds to see the instrument go down after TestApp is started
+                                                # (so the old app is not taken as ready), min delay if never seen
+    READY_POLL_MIN = 0.5                        # Readiness polling backoff (seconds)
+    READY_POLL_MAX = 5
+    TESTAPP_PORT = None                         # Instrument TestApp TCP port, enables port readiness probe
+    READY_LOG_MARKER = None                     # (log file, text) written once instrument is up
     ARM_VER_INDEX = 7                           # Version Indexing
     WIN_VER_INDEX = 3
     FPGA_VER_INDEXING1 = 4
@@ -76,6 +97,31 @@ class FwConstants:
     ARM_BUILD_FORMAT = 1
     WIN_BUILD_FORMAT = 1
     FPGA_BUILD_FORMAT = 2
+    NEXUS_TIMEOUT = 30                          # Seconds before a Nexus request is abandoned
+    DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024       # Bytes per ranged build zip request
+    DOWNLOAD_WORKERS = 4                        # Parallel ranged requests per build zip
+    BUILD_CACHE_SIZE = 20 * 1024 ** 3           # Bytes of zips & extracted trees kept in build cache
+    UNZIP_WORKERS = 4                           # Parallel build zip member extraction
+    DEPLOY_WORKERS = 4                          # Parallel file copies into deploy dir
+    DEPLOY_CLEANUP_PATTERNS = ("CDGo_CameraBoard_FX3_*.bin",          # Stale bins removed from deploy dir
+                               "**/CDGo_LedBoard_*.bin",              # ("**/" = at any depth)
+                               "**/CDGo_MainBoard_*.bin",
+                               "**/CDGo_PMBoard_*.bin")
+    BATCH_GEN_THRESHOLD = 8                     # Selections this large generate .tst files on a worker pool
+    BATCH_GEN_WORKERS = 4
+    QT_TEST_TIMEOUT = 3600                      # Seconds before a headless Qt test run is killed
+    QT_INSTRUMENT_ARG = None                    # Qt TestApp option naming the instrument to test (Ex: "--ip"),
+                                                # opt-in: needed by multi-instrument runs, FwTestApp has no known one
+    LOG_SETTLE_TIMEOUT = 5                      # Seconds to wait for a Qt test log to be complete
+    LOG_READ_CHUNK = 1024 * 1024                # Chars read at a time when streaming a Qt test log
+    LOG_RETENTION_DAYS = 30                     # Qt test logs older than this are archived into monthly zips
+    LOG_NAME_SEPARATORS = "_-. "                # Chars that may follow the test case name in its log file names
+    FW_VERSION_COMMANDS = {                     # Qt log cmdStr: (InstrumentInfo field, regex w/ version as group 1)
+        "version(firmware,main,)": ("main", r"firmwareVersion = ([\d.]+)"),
+        "version(firmware,camera,)": ("camera", r"firmwareVersion = ([\d.]+)"),
+        "version(firmware,led,)": ("led", r"firmwareVersion = ([\d.]+)"),
+        "version(firmware,powermonitor,)": ("powermonitor", r"firmwareVersion = ([\d.]+)"),
+    }
 
 
 # Firmware Versions
@@ -87,10 +133,9 @@ class InstrumentInfo:
     ip = 0
 
 
-# Pass/Fail Test Execution Counters
-class ResultCounters:
-    connect_pass = 0
-    connect_fail = 0
+# Lab Instruments Test Suites can be spread across (1 worker per endpoint)
+class InstrumentPool:
+    ENDPOINTS = []                  # Instrument IP addresses, fewer than 2 runs tests one after another
 
 
 # Test Cases using Tuples to store values
@@ -115,3 +160,8 @@ class TestCases(Enum):
               "",
               0,
               "")
+
+    def is_runnable(self):
+        """ Returns False if [0] is a non-integer (Ex: 1.5), shared by the GUI test list & the CLI --all """
+        number = self.value[0]
+        return not (isinstance(number, float) and not number.is_integer())
@@ -0,0 +1,17 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       __init__.py
+Purpose:    Auto-Test framework tests (run from BaseAutoTestApp: python -m pytest tests
+            or python -m unittest discover -s tests -t .)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import os
+import sys
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:                                 # Framework modules are top level modules of the App dir
+    sys.path.insert(0, APP_DIR)
@@ -0,0 +1,28 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       fake_qt_app.py
+Purpose:    Stand-in for FwTestApp.exe: prints its arguments, optionally sleeps, exits w/ a given code
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import argparse
+import os
+import sys
+import time
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sleep", type=float, default=0.0, help="Seconds to run before exiting")
+    parser.add_argument("--exit", type=int, default=0, help="Exit code")
+    parser.add_argument("--stderr", default="", help="Line written to stderr")
+    args, rest = parser.parse_known_args()
+
+    print(f"cwd={os.getcwd()}", flush=True)
+    print(f"args={' '.join(rest)}", flush=True)
+    if args.stderr:
+        print(args.stderr, file=sys.stderr, flush=True)
+    time.sleep(args.sleep)
+    sys.exit(args.exit)
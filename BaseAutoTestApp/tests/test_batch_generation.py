@@ -0,0 +1,57 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_batch_generation.py
+Purpose:    Batch generated test case names live on the run's ResultStore (not shared across runs)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import unittest
+from types import SimpleNamespace
+import autotest_framework as framework                      # Module import: pytest would collect Test* classes
+from autotest_framework import CancellationToken, ResultStore
+import constants                                            # Module import: pytest would collect TestCases
+
+BASIC = SimpleNamespace(name="basic", value=(2, "Basic", "basic_template", "Basic_", "", "", 0, ""))   # Qt test case
+
+
+class BatchGenerationTest(unittest.TestCase):
+    def setUp(self):
+        self.stop_event = CancellationToken()
+        self.batch_gen = framework.TestSuiteBatchGeneration(self.stop_event)
+        self.batch_gen.builds.get_win_build_ver = lambda: "1_2_3"
+        self.generated = []
+        self.batch_gen.test_gen.generate_test_file = lambda *args: self.generated.append(args)
+
+    def test_names_published_on_run_store(self):
+        run_results, other_run = ResultStore(), ResultStore()
+        self.assertTrue(self.batch_gen.run([BASIC, constants.TestCases.connect], run_results))
+
+        self.assertEqual(self.generated, [("basic_template", "Basic_", "1_2_3")])
+        self.assertEqual(run_results.test_case_names, {"Basic_": "Basic_1_2_3"})
+        self.assertEqual(run_results.partition("10.0.0.7").test_case_names, {"Basic_": "Basic_1_2_3"})
+        self.assertEqual(other_run.test_case_names, {})
+        self.assertEqual(ResultStore.default().test_case_names, {})
+
+    def test_suite_reads_its_run_names(self):
+        run_results = ResultStore()
+        self.batch_gen.run([BASIC], run_results)
+        qt_dep = framework.TestSuiteQtDependencies(self.stop_event, "basic_template", "Basic_")
+        qt_dep.builds.get_win_build_ver = lambda: "9_9_9"                           # Used w/o the run's names
+
+        self.assertEqual(qt_dep.get_test_case(), "Basic_9_9_9")
+        framework.TestScheduler.bind_instrument(qt_dep, framework.InstrumentInfo(), run_results)
+        self.assertEqual(qt_dep.get_test_case(), "Basic_1_2_3")
+
+    def test_non_qt_selection_skips_build_lookup(self):
+        run_results = ResultStore()
+        run_results.test_case_names["Basic_"] = "Basic_0_0_1"                        # Left by an earlier batch
+        self.batch_gen.builds.get_win_build_ver = lambda: [][0]                     # No Windows build recorded
+        self.assertTrue(self.batch_gen.run([constants.TestCases.connect], run_results))
+        self.assertEqual(run_results.test_case_names, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
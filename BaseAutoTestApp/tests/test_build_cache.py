@@ -0,0 +1,109 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_build_cache.py
+Purpose:    BuildCache eviction & materialize (hard links, zip fallback, copy fallback), clearing linked dirs
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import itertools
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from autotest_framework import BuildCache, CancellationToken, FileManipulation
+
+ZIP_SIZE = 1000                                             # Bytes of every build zip
+
+
+class BuildCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)                         # Cache dir is relative to cwd
+        BuildCache.index = None
+        self.stop_event = CancellationToken()
+        self.clock = mock.patch("time.time", side_effect=itertools.count(1000).__next__)
+        self.clock.start()                                  # Every use of an entry is 1 s later than the last
+
+    def tearDown(self):
+        self.clock.stop()
+        BuildCache.index = None
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def write_file(self, file_name, content):
+        os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+        with open(file_name, "wb") as file:
+            file.write(content)
+        return file_name
+
+    def add_build(self, cache, zip_name):
+        """ Downloads (writes) a build zip & stores it in the cache, returns its SHA-1 """
+        return cache.add_zip(zip_name, self.write_file(f"downloads/{zip_name}", os.urandom(ZIP_SIZE)))
+
+    def test_evicts_least_recently_used(self):
+        cache = BuildCache(self.stop_event, max_size=3 * ZIP_SIZE)
+        first, second, third = (self.add_build(cache, f"build_{number}.zip") for number in range(3))
+        cache.lookup("build_0.zip")                         # build_1 is now the least recently used
+        self.add_build(cache, "build_3.zip")
+
+        self.assertEqual(sorted(cache.load()["versions"]), ["build_0.zip", "build_2.zip", "build_3.zip"])
+        self.assertFalse(os.path.exists(cache.get_zip_file_name(second)))
+        self.assertTrue(all(os.path.exists(cache.get_zip_file_name(sha1)) for sha1 in (first, third)))
+
+    def test_index_survives_reload(self):
+        sha1 = self.add_build(BuildCache(self.stop_event), "build_0.zip")
+        BuildCache.index = None                             # Next App run
+        self.assertEqual(BuildCache(self.stop_event).lookup("build_0.zip")["sha1"], sha1)
+
+    def test_materialize_tree_hard_links(self):
+        cache = BuildCache(self.stop_event)
+        self.add_build(cache, "build_0.zip")
+        self.write_file("extracted/FwTestApp.exe", b"app")
+        self.write_file("extracted/config/test.tst", b"tst")
+        cache.add_tree("build_0.zip", "extracted")
+
+        self.assertEqual(cache.materialize("build_0.zip", "group"), "tree")
+        for rel_path in ("FwTestApp.exe", os.path.join("config", "test.tst")):
+            self.assertTrue(os.path.samefile(os.path.join("extracted", rel_path), os.path.join("group", rel_path)))
+
+    def test_materialize_zip_without_tree(self):
+        cache = BuildCache(self.stop_event)
+        sha1 = self.add_build(cache, "build_0.zip")
+        os.makedirs("group")
+
+        self.assertEqual(cache.materialize("build_0.zip", "group"), "zip")
+        self.assertTrue(os.path.samefile(cache.get_zip_file_name(sha1), "group/build_0.zip"))
+        self.assertIsNone(cache.materialize("build_1.zip", "group"))                # Not cached
+
+    def test_materialize_copies_when_links_fail(self):
+        cache = BuildCache(self.stop_event)
+        sha1 = self.add_build(cache, "build_0.zip")
+        os.makedirs("group")
+        with mock.patch("os.link", side_effect=OSError("cross-device link")), \
+                mock.patch.dict(sys.modules, {"fcntl": None}):                      # No reflink either
+            self.assertEqual(cache.materialize("build_0.zip", "group"), "zip")
+
+        self.assertFalse(os.path.samefile(cache.get_zip_file_name(sha1), "group/build_0.zip"))
+        with open(cache.get_zip_file_name(sha1), "rb") as cached, open("group/build_0.zip", "rb") as copied:
+            self.assertEqual(cached.read(), copied.read())
+
+    def test_clear_dir_keeps_cached_files(self):
+        cache = BuildCache(self.stop_event)
+        sha1 = self.add_build(cache, "build_0.zip")
+        os.makedirs("group/nested")
+        cache.materialize("build_0.zip", "group")
+        self.write_file("group/nested/old.bin", b"old")
+        with mock.patch.dict(sys.modules, {"send2trash": None}):                    # Removed in place, not trashed
+            FileManipulation(self.stop_event).clear_dir("group")
+
+        self.assertEqual(os.listdir("group"), [])
+        self.assertEqual(os.path.getsize(cache.get_zip_file_name(sha1)), ZIP_SIZE)  # Only the link was removed
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_build_downloader.py
+Purpose:    BuildDownloader against a local HTTP stand-in for Nexus (ranges, resume, checksum, connections)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from autotest_framework import BuildDownloader, CancellationToken
+
+BUILD_ZIP = os.urandom(1024 * 1024 + 123)                   # Build zip served by the stand-in
+CHUNK_SIZE = 64 * 1024
+
+
+class NexusStandIn(BaseHTTPRequestHandler):
+    """ Serves BUILD_ZIP w/ keep-alive & (optional) ranged requests, records the ranges asked for """
+    protocol_version = "HTTP/1.1"
+    ranged = True
+    ranges = []
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BUILD_ZIP)))
+        if self.ranged:
+            self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if match and self.ranged:
+            start, end = int(match[1]), int(match[2])
+            self.ranges.append(start)
+            body = BUILD_ZIP[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(BUILD_ZIP)}")
+        else:
+            body = BUILD_ZIP
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):                           # Keep test output quiet
+        pass
+
+
+class BuildDownloaderTest(unittest.TestCase):
+    def setUp(self):
+        NexusStandIn.ranged = True
+        NexusStandIn.ranges = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), NexusStandIn)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dest = os.path.join(self.tmp_dir.name, "build.zip")
+        self.downloader = BuildDownloader(CancellationToken(), host=f"127.0.0.1:{self.server.server_address[1]}",
+                                          timeout=10, chunk_size=CHUNK_SIZE, workers=4)
+        self.checksum = {"sha1": hashlib.sha1(BUILD_ZIP).hexdigest(), "md5": hashlib.md5(BUILD_ZIP).hexdigest()}
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def read_dest(self):
+        with open(self.dest, "rb") as file:
+            return file.read()
+
+    def test_ranged_download(self):
+        self.assertTrue(self.downloader.download("/build.zip", self.dest, self.checksum))
+        self.assertEqual(self.read_dest(), BUILD_ZIP)
+        self.assertEqual(sorted(NexusStandIn.ranges), list(range(0, len(BUILD_ZIP), CHUNK_SIZE)))
+        self.assertFalse(os.path.exists(self.dest + ".part.json"))
+
+    def test_connections_closed_after_download(self):
+        self.assertTrue(self.downloader.download("/build.zip", self.dest, self.checksum))
+        self.assertEqual(self.downloader.open_connections, set())
+
+    def test_resume_fetches_missing_chunks_only(self):
+        done = list(range(0, 10))                               # Chunks 0-9 already on disk
+        with open(self.dest + ".part", "wb") as file:
+            file.write(BUILD_ZIP[:10 * CHUNK_SIZE])
+            file.truncate(len(BUILD_ZIP))
+        with open(self.dest + ".part.json", "w") as file:
+            json.dump({"size": len(BUILD_ZIP), "chunk_size": CHUNK_SIZE, "done": done}, file)
+
+        self.assertTrue(self.downloader.download("/build.zip", self.dest, self.checksum))
+        self.assertEqual(self.read_dest(), BUILD_ZIP)
+        self.assertEqual(min(NexusStandIn.ranges), 10 * CHUNK_SIZE)
+
+    def test_checksum_mismatch_starts_over(self):
+        self.assertFalse(self.downloader.download("/build.zip", self.dest, {"sha1": "0" * 40}))
+        self.assertFalse(os.path.exists(self.dest))
+        self.assertFalse(os.path.exists(self.dest + ".part"))
+        self.assertFalse(os.path.exists(self.dest + ".part.json"))
+
+    def test_stream_without_ranges(self):
+        NexusStandIn.ranged = False
+        self.assertTrue(self.downloader.download("/build.zip", self.dest, {"md5": self.checksum["md5"]}))
+        self.assertEqual(self.read_dest(), BUILD_ZIP)
+        self.assertEqual(NexusStandIn.ranges, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_cancellation.py
+Purpose:    Stop-to-idle latency of a Test Run (waits, Qt child, Nexus reads) & CancellationToken callbacks
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import socket
+import threading
+import time
+import unittest
+import autotest_framework as framework                      # Module import: pytest would collect Test* classes
+from autotest_framework import AutoTestFramework, CancellationToken, NexusCrawler, QtRunner
+from tests.test_qt_runner import fake_qt_args
+
+STOP_AFTER = 0.3                                            # Seconds into the run the Stop button is pressed
+MAX_STOP_LATENCY = 1.0                                      # Seconds from stop to idle
+
+
+class SlowSuite(AutoTestFramework):
+    """ Suite spending its time in a post run delay then in a Qt child, like the Qt Test Suites """
+    def __init__(self, stop_event):
+        super().__init__(stop_event)
+        self.post_run = framework.TestSuitePostRun(self.stop_event)
+        self.qt_runner = QtRunner(self.stop_event)
+
+    def run(self):
+        try:
+            self.post_run.delay(60)
+            return self.qt_runner.run(fake_qt_args("--sleep", "60"))[1] == "completed"
+        except framework.TestCancelled:
+            return False
+
+
+class CancellationTest(unittest.TestCase):
+    def stop_latency(self, stop_event, target):
+        """ Runs target on a worker thread, stops it after STOP_AFTER & returns (seconds to idle, result) """
+        result = []
+        thread = threading.Thread(target=lambda: result.append(target()))
+        thread.start()
+        time.sleep(STOP_AFTER)
+        stop_time = time.monotonic()
+        stop_event.set()
+        thread.join(10)
+        self.assertFalse(thread.is_alive(), "run still going 10s after stop")
+        return time.monotonic() - stop_time, result[0]
+
+    def test_delay_stop_to_idle(self):
+        stop_event = CancellationToken()
+        post_run = framework.TestSuitePostRun(stop_event)
+
+        def delay():
+            try:
+                post_run.delay(60)
+            except framework.TestCancelled:
+                return "cancelled"
+
+        latency, result = self.stop_latency(stop_event, delay)
+        self.assertEqual(result, "cancelled")
+        self.assertLess(latency, MAX_STOP_LATENCY)
+
+    def test_qt_child_stop_to_idle(self):
+        stop_event = CancellationToken()
+        latency, (_, status) = self.stop_latency(stop_event,
+                                                 lambda: QtRunner(stop_event).run(fake_qt_args("--sleep", "60")))
+        self.assertEqual(status, "stopped")
+        self.assertLess(latency, MAX_STOP_LATENCY)
+
+    def test_nexus_read_stop_to_idle(self):
+        with socket.socket() as server:                     # Accepts the request, never answers it
+            server.bind(("127.0.0.1", 0))
+            server.listen()
+            stop_event = CancellationToken()
+            crawler = NexusCrawler(stop_event, host=f"127.0.0.1:{server.getsockname()[1]}", timeout=60)
+
+            def get_json():
+                try:
+                    crawler.get_json("/service/rest/v1/search")
+                except OSError:
+                    return "aborted"
+
+            latency, result = self.stop_latency(stop_event, get_json)
+        self.assertEqual(result, "aborted")
+        self.assertLess(latency, MAX_STOP_LATENCY)
+
+    def test_scheduler_stop_to_idle(self):
+        stop_event = CancellationToken()
+        scheduler = framework.TestScheduler(stop_event, ["sim-1", "sim-2"])
+        latency, runs = self.stop_latency(stop_event, lambda: scheduler.run([SlowSuite] * 4))
+        self.assertEqual([run.passed for run in runs], [False, False])          # 1 suite per worker, none after
+        self.assertLess(latency, MAX_STOP_LATENCY)
+
+    def test_callback_registered_while_set(self):
+        stop_event = CancellationToken()
+        stop_event.set()                                    # Left set by a stopped run
+        calls = []
+        handle = stop_event.register(lambda: calls.append(1))
+        self.assertIsNotNone(handle)
+        self.assertEqual(calls, [1])                        # Ran right away
+
+        stop_event.clear()                                  # Next run
+        stop_event.set()
+        self.assertEqual(calls, [1, 1])                     # Still registered
+        stop_event.unregister(handle)
+        stop_event.set()
+        self.assertEqual(calls, [1, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_cli.py
+Purpose:    Headless CLI: argument errors, test selection, JSON & JUnit reports and exit codes (stub suites)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ElementTree
+from enum import Enum
+from unittest import mock
+import cli
+import constants
+from autotest_framework import AutoTestFramework, LogCatalog
+
+
+class StubCases(Enum):                                      # Stand-in for TestCases (same tuple layout)
+    ping = (1, "Ping", "", "", "", "", 0, "")
+    soak = (2, "Soak", "", "", "", "", 0, "")
+    draft = (2.5, "Draft", "", "", "", "", 0, "")           # Non-integer: left out of --all & the GUI list
+    halt = (3, "Halt", "", "", "", "", 0, "")
+
+    is_runnable = constants.TestCases.is_runnable
+
+
+class StubSuite(AutoTestFramework):
+    outcome = True
+
+    def run(self):
+        result_name = self.__class__.__name__.lower().removesuffix("suite")             # Ex: PingSuite -> ping
+        self.results.add(result_name, passed=int(self.outcome), failed=int(not self.outcome))
+        return self.outcome
+
+
+class PingSuite(StubSuite):
+    pass
+
+
+class SoakSuite(StubSuite):
+    outcome = False
+
+
+class HaltSuite(StubSuite):
+    def run(self):                                          # Same as Ctrl+C during the suite
+        self.stop_event.set()
+        return False
+
+
+class StubRegistry:
+    suite_dir = "test_suites"
+    suites = {"ping": PingSuite, "soak": SoakSuite, "draft": PingSuite, "halt": HaltSuite}
+
+    @staticmethod
+    def normalize(name):
+        return name.lower()
+
+    def get_class(self, name):
+        return self.suites.get(name)
+
+
+class CliTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)                         # Log catalog is written relative to cwd
+        LogCatalog.catalog = None
+        for patch in (mock.patch.object(cli, "TestCases", StubCases),
+                      mock.patch.object(cli, "SuiteRegistry", lambda stop_event: StubRegistry())):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        LogCatalog.catalog = None
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def run_cli(self, *argv):
+        """ Runs the CLI, returns (exit code, stdout) """
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(io.StringIO()):
+            try:
+                exit_code = cli.main(list(argv))
+            except SystemExit as e:
+                exit_code = e.code
+        return exit_code, stdout.getvalue()
+
+    def test_argument_errors(self):
+        for argv in ([], ["--all", "ping"], ["nope"], ["ping", "--jobs", "-1"], ["ping", "--jobs", "two"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(self.run_cli(*argv)[0], cli.EXIT_USAGE)
+
+    def test_runnable_shared_with_gui(self):
+        self.assertEqual([test_case for test_case in StubCases if test_case.is_runnable()],
+                         [StubCases.ping, StubCases.soak, StubCases.halt])
+        self.assertTrue(constants.TestCases.connect.is_runnable())
+
+    def test_all_json_report(self):
+        exit_code, stdout = self.run_cli("--all", "--json", "-")
+        report = json.loads(stdout)
+
+        self.assertEqual(exit_code, cli.EXIT_FAIL)                                   # Soak failed
+        self.assertEqual(sorted(report), ["cancelled", "passed", "run_id", "runs", "tests"])
+        self.assertEqual((report["passed"], report["cancelled"]), (False, False))
+        self.assertEqual([(run["suite_name"], run["passed"]) for run in report["runs"]],
+                         [("PingSuite", True), ("SoakSuite", False)])               # Stops at the 1st failure
+        self.assertEqual([(test["test"], test["ran"]) for test in report["tests"]],
+                         [("ping", True), ("soak", True), ("halt", False)])        # No draft
+        self.assertEqual((report["tests"][0]["pass_count"], report["tests"][1]["fail_count"]), (1, 1))
+
+    def test_pass_exit_code(self):
+        self.assertEqual(self.run_cli("ping")[0], cli.EXIT_PASS)
+
+    def test_junit_report(self):
+        exit_code, _ = self.run_cli("ping", "soak", "halt", "--junit", "results.xml")
+        suite = ElementTree.parse("results.xml").getroot().find("testsuite")
+
+        self.assertEqual(exit_code, cli.EXIT_FAIL)
+        self.assertEqual({key: suite.get(key) for key in ("tests", "failures", "skipped")},
+                         {"tests": "3", "failures": "1", "skipped": "1"})
+        cases = {case.get("name"): case for case in suite.iter("testcase")}
+        self.assertIsNotNone(cases["SoakSuite"].find("failure"))
+        self.assertEqual(cases["HaltSuite"].find("skipped").get("message"), "not run")
+
+    def test_cancelled_exit_code(self):
+        exit_code, _ = self.run_cli("ping", "halt", "soak", "--json", "results.json", "--junit", "results.xml")
+        with open("results.json", encoding="utf-8") as file:
+            report = json.load(file)
+        suite = ElementTree.parse("results.xml").getroot().find("testsuite")
+
+        self.assertEqual(exit_code, cli.EXIT_CANCELLED)
+        self.assertEqual((report["passed"], report["cancelled"]), (False, True))
+        self.assertEqual(next(suite.iter("skipped")).get("message"), "cancelled")     # Soak never ran
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_deploy.py
+Purpose:    Build zip extraction & deploy sync (ZipExtractor, TreeSync)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import os
+import tempfile
+import time
+import unittest
+import zipfile
+import autotest_framework as framework
+from autotest_framework import CancellationToken, TreeSync, ZipExtractor
+
+QT_RUNTIME = {f"Qt6Core{number}.dll": os.urandom(4096) for number in range(5)}      # Same in every build
+
+
+def write_build_zip(zip_path, app_content, date_time):
+    """ Writes a Windows Qt build zip: the Qt runtime (unchanged between builds) & FwTestApp.exe """
+    with zipfile.ZipFile(zip_path, "w") as build_zip:
+        for file_name, content in QT_RUNTIME.items():
+            build_zip.writestr(zipfile.ZipInfo(file_name, (2026, 1, 2, 3, 4, 6)), content)
+        build_zip.writestr(zipfile.ZipInfo("FwTestApp.exe", date_time), app_content)
+
+
+class DeployTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.stop_event = CancellationToken()
+        self.deploy_dir = self.path("deploy")
+        os.makedirs(self.deploy_dir)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, *names):
+        return os.path.join(self.tmp_dir.name, *names)
+
+    def test_extracted_files_keep_zip_mtime(self):
+        write_build_zip(self.path("build_1.zip"), b"app 1", (2026, 3, 4, 5, 6, 8))
+        ZipExtractor(self.stop_event).extract(self.path("build_1.zip"), self.path("build_1"))
+        self.assertEqual(os.path.getmtime(self.path("build_1", "FwTestApp.exe")),
+                         time.mktime((2026, 3, 4, 5, 6, 8, 0, 0, -1)))
+
+    def write_tree(self, name, files):
+        for rel_path, content in files.items():
+            os.makedirs(os.path.dirname(self.path(name, rel_path)), exist_ok=True)
+            with open(self.path(name, rel_path), "wb") as file:
+                file.write(content)
+
+    def test_sync_removes_stale_files_matching_patterns(self):
+        self.write_tree("build", {"FwTestApp.exe": b"app", os.path.join("bin", "CDGo_LedBoard_2.bin"): b"led 2"})
+        self.write_tree("deploy", {os.path.join("bin", "CDGo_LedBoard_1.bin"): b"led 1", "local.ini": b"keep"})
+        report = TreeSync(self.stop_event).sync(self.path("build"), self.deploy_dir, ("**/CDGo_LedBoard_*.bin",))
+
+        self.assertEqual((report.files_copied, report.files_removed), (2, 1))
+        self.assertFalse(os.path.exists(self.path("deploy", "bin", "CDGo_LedBoard_1.bin")))
+        self.assertTrue(os.path.exists(self.path("deploy", "local.ini")))          # Not a cleanup pattern, kept
+
+    def test_sync_skips_unchanged_files(self):
+        self.write_tree("build", {"FwTestApp.exe": b"app", "Qt6Core.dll": b"qt"})
+        tree_sync = TreeSync(self.stop_event)
+        tree_sync.sync(self.path("build"), self.deploy_dir)
+        report = tree_sync.sync(self.path("build"), self.deploy_dir)
+
+        self.assertEqual((report.files_copied, report.bytes_copied, report.files_skipped), (0, 0, 2))
+
+    def test_stopped_sync_raises_cancelled(self):
+        self.write_tree("build", {"FwTestApp.exe": b"app", "Qt6Core.dll": b"qt"})
+        self.stop_event.set()
+        with self.assertRaises(framework.TestCancelled):
+            TreeSync(self.stop_event).sync(self.path("build"), self.deploy_dir)
+
+    def test_redeploy_skips_unchanged_files(self):
+        extractor = ZipExtractor(self.stop_event)
+        tree_sync = TreeSync(self.stop_event)
+        write_build_zip(self.path("build_1.zip"), b"app 1", (2026, 3, 4, 5, 6, 8))
+        write_build_zip(self.path("build_2.zip"), b"app 2", (2026, 3, 5, 5, 6, 8))
+
+        extractor.extract(self.path("build_1.zip"), self.path("build_1"))
+        self.assertEqual(tree_sync.sync(self.path("build_1"), self.deploy_dir).files_copied, len(QT_RUNTIME) + 1)
+        extractor.extract(self.path("build_2.zip"), self.path("build_2"))           # Fresh extraction, new build
+        report = tree_sync.sync(self.path("build_2"), self.deploy_dir)
+
+        self.assertEqual((report.files_copied, report.files_skipped), (1, len(QT_RUNTIME)))
+        with open(os.path.join(self.deploy_dir, "FwTestApp.exe"), "rb") as file:
+            self.assertEqual(file.read(), b"app 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_json_log_stream.py
+Purpose:    Streaming of the Qt test log "tests" entries (JsonLogStream)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from autotest_framework import JsonLogStream
+from constants import FwConstants
+
+TESTS = [{"cmdStr": "version(firmware,main,)", "response": "firmwareVersion = 1.2.3"},
+         {"cmdStr": "version(firmware,led,)", "response": "firmwareVersion = 4.5.6", "retries": 12},
+         {"cmdStr": "home(\"x\", [1, 2])", "response": {"ok": True, "positions": [-1.5, 2e3, None]}}]
+HEADER = {"app": "FwTestApp {v2}", "notes": "braces } ] [ { & escapes \\\" \\\\ in strings",
+          "steps": [[1, [2, [3]]], {"nested": {"deep": "]"}}]}
+
+
+class RecordingDecoder(json.JSONDecoder):
+    """ JSONDecoder keeping every value it decoded """
+    def __init__(self):
+        super().__init__()
+        self.decoded = []
+
+    def raw_decode(self, s, idx=0):
+        value, end = super().raw_decode(s, idx)
+        self.decoded.append(value)
+        return value, end
+
+
+class JsonLogStreamTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.log_file = os.path.join(self.tmp_dir.name, "Get_FW_Versions_1.json")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_log(self, content):
+        with open(self.log_file, "w", encoding="utf-8") as file:
+            file.write(content)
+
+    def read_tests(self, chunk_size):
+        with JsonLogStream(self.log_file, chunk_size) as log_stream:
+            return list(log_stream.tests()), log_stream.found_tests
+
+    def test_entries_split_across_chunks(self):
+        self.write_log(json.dumps({"header": HEADER, "tests": TESTS, "result": 3.25}))
+        for chunk_size in range(1, 12):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(self.read_tests(chunk_size), (TESTS, True))
+
+    def test_whitespace_between_entries(self):
+        self.write_log(json.dumps({"header": HEADER, "tests": TESTS}, indent="\t", separators=(" \r\n ,  ", " : ")))
+        with mock.patch.object(FwConstants, "LOG_READ_CHUNK", 3):
+            self.assertEqual(self.read_tests(None), (TESTS, True))
+
+    def test_empty_tests(self):
+        self.write_log('{ "tests" : [ ] , "result": "pass" }')
+        self.assertEqual(self.read_tests(2), ([], True))
+
+    def test_missing_tests_key(self):
+        self.write_log(json.dumps({"header": HEADER, "result": "pass"}))
+        self.assertEqual(self.read_tests(4), ([], False))
+
+    def test_truncated_log(self):
+        log = json.dumps({"header": HEADER, "tests": TESTS})
+        for end in (len(log) // 4, len(log) // 2, len(log) - 2):                   # In header, entry & after
+            with self.subTest(end=end):
+                self.write_log(log[:end])
+                with self.assertRaises(ValueError):
+                    self.read_tests(5)
+
+    def test_early_stop_leaves_rest_unread(self):
+        self.write_log(json.dumps({"tests": TESTS, "trailer": "x" * 10000}))
+        with JsonLogStream(self.log_file, 16) as log_stream:
+            self.assertEqual(next(log_stream.tests()), TESTS[0])
+            self.assertLess(log_stream.file.tell(), 1000)
+
+    def test_other_values_skipped_without_decoding(self):
+        self.write_log(json.dumps({"header": HEADER, "tests": TESTS[:1], "trailer": ["x" * 1000] * 10}))
+        buffer_sizes = []
+        with JsonLogStream(self.log_file, 8) as log_stream:
+            log_stream.decoder = RecordingDecoder()
+            fill = log_stream.fill
+            log_stream.fill = lambda: (fill(), buffer_sizes.append(len(log_stream.buffer)))[0]
+            self.assertEqual(list(log_stream.tests()), TESTS[:1])
+
+        self.assertEqual(log_stream.decoder.decoded, ["header", "tests", TESTS[0], "trailer"])    # Keys & entries
+        self.assertLess(max(buffer_sizes), len(json.dumps(TESTS[0])) + 8)      # 1 chunk + the entry being decoded
+
+
+if __name__ == "__main__":
+    unittest.main()
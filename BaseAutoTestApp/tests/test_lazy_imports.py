@@ -0,0 +1,34 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_lazy_imports.py
+Purpose:    Heavy modules & Test Suites stay out of start-up (imported on first use)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import subprocess
+import sys
+import unittest
+from tests import APP_DIR
+
+LAZY_MODULES = ("asyncio", "http.client", "zipfile", "send2trash", "test_suites.connect")
+
+
+class LazyImportTest(unittest.TestCase):
+    def imported_lazy_modules(self, module):
+        """ Returns the LAZY_MODULES a cold import of module pulls in """
+        result = subprocess.run([sys.executable, "-c", f"import sys, {module}; print(*sorted(sys.modules))"],
+                                cwd=APP_DIR, capture_output=True, text=True, check=True)
+        return [name for name in LAZY_MODULES if name in result.stdout.split()]
+
+    def test_framework_import(self):
+        self.assertEqual(self.imported_lazy_modules("autotest_framework"), [])
+
+    def test_cli_import(self):
+        self.assertEqual(self.imported_lazy_modules("cli"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
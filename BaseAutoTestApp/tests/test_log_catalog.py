@@ -0,0 +1,104 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_log_catalog.py
+Purpose:    LogCatalog refresh, latest log lookups & archiving of old logs
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import os
+import tempfile
+import time
+import unittest
+import zipfile
+from datetime import datetime
+from unittest import mock
+import autotest_framework as framework
+from autotest_framework import CancellationToken, LogCatalog
+
+DAY = 24 * 3600
+
+
+class LogCatalogTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)                             # Catalog file is written relative to cwd
+        self.log_dir = os.path.join(self.tmp_dir.name, "log")
+        os.makedirs(self.log_dir)
+        LogCatalog.catalog = None
+
+    def tearDown(self):
+        LogCatalog.catalog = None
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def write_log(self, name, age=0.0):
+        """ Writes a log modified age seconds ago """
+        log_file = os.path.join(self.log_dir, name)
+        with open(log_file, "w") as file:
+            file.write("{}")
+        mtime = time.time() - age
+        os.utime(log_file, (mtime, mtime))
+        return log_file
+
+    def catalog(self):
+        return LogCatalog(CancellationToken(), self.log_dir)
+
+    def test_latest_log_of_test_case(self):
+        self.write_log("Basic_1_a.log", age=300)
+        self.write_log("Basic_1_b.log", age=200)
+        self.write_log("Basic_10_c.log", age=100)                # Other test case sharing the prefix
+        self.assertEqual(self.catalog().latest("Basic_1"), f"{self.log_dir}/Basic_1_b.log")
+        self.assertEqual(self.catalog().latest("Basic_10"), f"{self.log_dir}/Basic_10_c.log")
+        self.assertEqual(self.catalog().latest("Basic_2"), "")
+
+    def test_new_log_picked_up(self):
+        self.write_log("Basic_1_a.log", age=300)
+        self.assertEqual(self.catalog().latest("Basic_1"), f"{self.log_dir}/Basic_1_a.log")
+        time.sleep(0.01)                                        # Dir mtime moves on
+        self.write_log("Basic_1_b.log")
+        self.write_log("Basic_10_c.log")
+        self.assertEqual(self.catalog().latest("Basic_1"), f"{self.log_dir}/Basic_1_b.log")
+
+    def test_lookups_do_not_rescan(self):
+        for number in range(200):
+            self.write_log(f"Basic_{number}_a.log", age=number)
+        catalog = self.catalog()
+        with mock.patch.object(framework.os, "scandir", wraps=os.scandir) as scandir:
+            for _ in range(50):
+                catalog.latest("Basic_7")
+        self.assertEqual(scandir.call_count, 1)
+
+    def test_catalog_reload(self):
+        self.write_log("Basic_1_a.log")
+        self.catalog().latest("Basic_1")
+        LogCatalog.catalog = None                               # New process: catalog read from disk
+        self.assertEqual(self.catalog().latest("Basic_1"), f"{self.log_dir}/Basic_1_a.log")
+
+    def test_lookups_do_not_archive(self):
+        self.write_log("Basic_1_old.log", age=60 * DAY)
+        self.catalog().latest("Basic_1")
+        self.assertTrue(os.path.exists(os.path.join(self.log_dir, "Basic_1_old.log")))
+        self.assertFalse(os.path.exists(os.path.join(self.log_dir, "archive")))
+
+    def test_archive_if_due(self):
+        old_log = self.write_log("Basic_1_old.log", age=60 * DAY)
+        self.write_log("Basic_1_new.log")
+        month = datetime.fromtimestamp(os.path.getmtime(old_log)).strftime("%Y_%m")
+
+        self.assertEqual(self.catalog().archive_if_due(), 1)
+        self.assertFalse(os.path.exists(old_log))
+        with zipfile.ZipFile(os.path.join(self.log_dir, "archive", f"logs_{month}.zip")) as archive:
+            self.assertEqual(archive.namelist(), ["Basic_1_old.log"])
+        self.assertEqual(self.catalog().latest("Basic_1"), f"{self.log_dir}/Basic_1_new.log")
+
+        self.write_log("Basic_2_old.log", age=60 * DAY)
+        self.assertEqual(self.catalog().archive_if_due(), 0)    # Once a day
+        self.assertTrue(os.path.exists(os.path.join(self.log_dir, "Basic_2_old.log")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_qt_runner.py
+Purpose:    QtRunner against a fake Qt executable (exit code, output, timeout, stop)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from autotest_framework import CancellationToken, QtRunner
+
+FAKE_QT_APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_qt_app.py")
+
+
+def fake_qt_args(*args):                                    # Command line running the fake Qt executable
+    return [sys.executable, FAKE_QT_APP, *args]
+
+
+class QtRunnerTest(unittest.TestCase):
+    def run_qt(self, stop_event, *args, timeout=10):
+        return QtRunner(stop_event).run(fake_qt_args(*args), cwd=os.path.dirname(FAKE_QT_APP), timeout=timeout,
+                                        name="fake_qt")
+
+    def test_completed_exit_code(self):
+        for stop_event in (CancellationToken(), threading.Event()):
+            with self.subTest(stop_event=type(stop_event).__name__):
+                self.assertEqual(self.run_qt(stop_event, "--exit", "3", "--sleep", "0.3"), (3, "completed"))
+
+    def test_output_logged(self):
+        with self.assertLogs(level="INFO") as logs:
+            self.run_qt(CancellationToken(), "--stderr", "boom", "suite.tst")
+        output = "\n".join(logs.output)
+        self.assertIn("fake_qt stdout: args=suite.tst", output)
+        self.assertIn("fake_qt stdout: cwd=" + os.path.dirname(FAKE_QT_APP), output)
+        self.assertIn("fake_qt stderr: boom", output)
+
+    def test_timeout_kills_child(self):
+        for stop_event in (CancellationToken(), threading.Event()):
+            with self.subTest(stop_event=type(stop_event).__name__):
+                start_time = time.monotonic()
+                returncode, status = self.run_qt(stop_event, "--sleep", "30", timeout=0.5)
+                self.assertEqual(status, "timeout")
+                self.assertNotEqual(returncode, 0)
+                self.assertLess(time.monotonic() - start_time, 5)
+
+    def test_stop_kills_child(self):
+        for stop_event in (CancellationToken(), threading.Event()):
+            with self.subTest(stop_event=type(stop_event).__name__):
+                threading.Timer(0.5, stop_event.set).start()
+                start_time = time.monotonic()
+                returncode, status = self.run_qt(stop_event, "--sleep", "30")
+                self.assertEqual(status, "stopped")
+                self.assertNotEqual(returncode, 0)
+                self.assertLess(time.monotonic() - start_time, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
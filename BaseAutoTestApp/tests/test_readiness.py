@@ -0,0 +1,59 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_readiness.py
+Purpose:    Readiness waits after the TestApp command against a simulated restarting instrument
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import time
+import unittest
+from unittest import mock
+import autotest_framework as framework                      # Module import: pytest would collect Test* classes
+from autotest_framework import CancellationToken
+from constants import FwConstants
+
+
+class RestartingInstrument:
+    """ instrument_control stand-in: keeps answering for down_after seconds, then is down for down_for seconds """
+    def __init__(self, down_after, down_for):
+        self.down_after = down_after
+        self.down_for = down_for
+        self.started = None
+
+    def run_testapp_on_instrument(self):
+        self.started = time.monotonic()
+
+    def read_server_ip_address(self):
+        elapsed = time.monotonic() - self.started
+        return "" if self.down_after <= elapsed < self.down_after + self.down_for else "10.0.0.7"
+
+
+@mock.patch.multiple(FwConstants, READY_POLL_MIN=0.05, READY_POLL_MAX=0.05, BOOT_TIME_DELAY=5,
+                     RESTART_DOWN_TIMEOUT=2)
+class TestAppReadinessTest(unittest.TestCase):
+    def run_testapp(self, instrument):
+        post_run = framework.TestSuitePostRun(CancellationToken(), instrument)
+        start_time = time.monotonic()
+        post_run.run_testapp_on_instrument(True)
+        return time.monotonic() - start_time
+
+    def test_old_app_not_taken_as_ready(self):
+        elapsed = self.run_testapp(RestartingInstrument(down_after=0.5, down_for=0.5))
+        self.assertGreaterEqual(elapsed, 1.0)               # Waited through the restart
+        self.assertLess(elapsed, 2.0)                       # Continued as soon as it was back up
+
+    def test_ping_probe_wired(self):
+        post_run = framework.TestSuitePostRun(CancellationToken(), RestartingInstrument(0, 0))
+        self.assertIn(post_run.readiness.ping, post_run.readiness.get_probes())
+
+    def test_restart_never_seen_waits_min_delay(self):
+        elapsed = self.run_testapp(RestartingInstrument(down_after=0.0, down_for=0.0))      # Too fast to see
+        self.assertGreaterEqual(elapsed, FwConstants.RESTART_DOWN_TIMEOUT)
+        self.assertLess(elapsed, FwConstants.BOOT_TIME_DELAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
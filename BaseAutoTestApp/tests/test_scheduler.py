@@ -0,0 +1,135 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_scheduler.py
+Purpose:    TestScheduler against simulated instruments (spread, isolation, failures, Qt instrument targeting)
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import socketserver
+import threading
+import time
+import unittest
+from unittest import mock
+import autotest_framework as framework                      # Module import: pytest would collect Test* classes
+from autotest_framework import AutoTestFramework, CancellationToken, ResultStore
+from constants import FwConstants, InstrumentInfo
+
+
+class SimulatedInstrument(socketserver.ThreadingTCPServer):
+    """ Instrument stand-in: answers each Test Suite name w/ PASS (or FAIL if listed) & records what it ran """
+    daemon_threads = True
+
+    def __init__(self, failing=()):
+        super().__init__(("127.0.0.1", 0), SimulatedInstrumentHandler)
+        self.failing = set(failing)
+        self.ran = []
+        self.busy = 0                                       # Test Suites running at once (must stay <= 1)
+        self.max_busy = 0
+        self.lock = threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    @property
+    def endpoint(self):
+        return f"127.0.0.1:{self.server_address[1]}"
+
+
+class SimulatedInstrumentHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        instrument = self.server
+        suite_name = self.rfile.readline().decode().strip()
+        with instrument.lock:
+            instrument.busy += 1
+            instrument.max_busy = max(instrument.max_busy, instrument.busy)
+        time.sleep(0.05)                                    # Test takes a while on the instrument
+        with instrument.lock:
+            instrument.busy -= 1
+            instrument.ran.append(suite_name)
+        self.wfile.write(b"FAIL\n" if suite_name in instrument.failing else b"PASS\n")
+
+
+class InstrumentSuite(AutoTestFramework):
+    """ Test Suite running its test on the instrument of its (bound) InstrumentInfo """
+    def run(self):
+        import socket
+        host, port = str(self.inst_info.ip).split(":")
+        with socket.create_connection((host, int(port)), timeout=5) as conn:
+            conn.sendall(type(self).__name__.encode() + b"\n")
+            passed = conn.makefile().readline().strip() == "PASS"
+        self.results.add(type(self).__name__, passed=int(passed), failed=int(not passed))
+        return passed
+
+
+SUITES = [type(f"Suite{number}", (InstrumentSuite,), {}) for number in range(8)]
+
+
+class TestSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.instruments = []
+
+    def tearDown(self):
+        for instrument in self.instruments:
+            instrument.shutdown()
+            instrument.server_close()
+
+    def start_instruments(self, *failing):
+        self.instruments = [SimulatedInstrument(fail) for fail in failing]
+        return [instrument.endpoint for instrument in self.instruments]
+
+    def test_suites_spread_across_instruments(self):
+        endpoints = self.start_instruments((), (), ())
+        runs = framework.TestScheduler(CancellationToken(), endpoints).run(SUITES)
+
+        self.assertEqual(sorted(run.suite_name for run in runs), sorted(suite.__name__ for suite in SUITES))
+        self.assertTrue(all(run.passed for run in runs))
+        for instrument in self.instruments:
+            self.assertTrue(instrument.ran, "instrument left idle")
+            self.assertEqual(instrument.max_busy, 1)        # 1 Test Suite at a time per instrument
+            self.assertEqual(sorted(instrument.ran),
+                             sorted(run.suite_name for run in runs if run.endpoint == instrument.endpoint))
+
+    def test_results_partitioned_per_instrument(self):
+        endpoints = self.start_instruments((), ())
+        results = ResultStore()
+        framework.TestScheduler(CancellationToken(), endpoints).run(SUITES, results)
+
+        for instrument in self.instruments:
+            for suite_name in instrument.ran:
+                self.assertEqual(results.get(suite_name, instrument.endpoint).passed, 1)
+        self.assertEqual(sum(results.get(suite.__name__).passed for suite in SUITES), len(SUITES))
+
+    def test_failure_stops_only_its_worker(self):
+        endpoints = self.start_instruments({suite.__name__ for suite in SUITES}, ())
+        runs = framework.TestScheduler(CancellationToken(), endpoints).run(SUITES)
+
+        failed = [run for run in runs if not run.passed]
+        self.assertEqual(len(failed), 1)                    # Failing instrument's worker stopped after 1 suite
+        self.assertEqual(failed[0].endpoint, endpoints[0])
+        self.assertEqual(len(runs), len(SUITES))            # Other worker ran the rest
+        self.assertIn("Total\t\t -  Pass: 7\t\t -  Fail: 1", framework.TestScheduler.format_report(runs))
+
+    @staticmethod
+    def qt_cmd(ip):
+        """ Returns the Qt TestApp command line of a Test Suite bound to an instrument at ip """
+        inst_info = InstrumentInfo()
+        inst_info.ip = ip
+        test_gen = framework.TestScheduler.bind_instrument(framework.TestGeneration(CancellationToken()),
+                                                           inst_info, ResultStore())
+        qt_cmds = []
+        test_gen.qt_runner.run = lambda args, **kwargs: (qt_cmds.append(args), (0, "completed"))[1]
+        test_gen.run_qt_test_suite("Basic_1_0_0")
+        return qt_cmds[0]
+
+    def test_qt_cmd_unchanged_by_default(self):
+        self.assertIsNone(FwConstants.QT_INSTRUMENT_ARG)
+        self.assertEqual(self.qt_cmd("10.0.0.7")[-3:], ["-t", "Basic_1_0_0", "--headless"])
+
+    @mock.patch.object(FwConstants, "QT_INSTRUMENT_ARG", "--ip")
+    def test_qt_cmd_targets_worker_instrument(self):
+        self.assertEqual(self.qt_cmd("10.0.0.7")[-2:], ["--ip", "10.0.0.7"])
+
+
+if __name__ == "__main__":
+    unittest.main()
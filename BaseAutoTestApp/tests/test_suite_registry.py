@@ -0,0 +1,94 @@
+"""
+-------------------------------------------------------------------------------
+                                Fidelicious
+File:       test_suite_registry.py
+Purpose:    SuiteRegistry discovery across test_suites modules (subclass chains) & its cache
+
+Creator:    Fidel Quezada Guzman
+Cr. Date:   10/18/2026
+-------------------------------------------------------------------------------
+"""
+import json
+import os
+import sys
+import tempfile
+import unittest
+from autotest_framework import AutoTestFramework, CancellationToken, SuiteRegistry
+from constants import Paths
+
+BASE_QT = """
+from autotest_framework import TestSuiteQtExecution
+
+
+class LabQtSuite(TestSuiteQtExecution):
+    pass
+"""
+
+SOAK = """
+from lab_suites.base_qt import LabQtSuite
+
+
+class Soak(LabQtSuite):
+    def __init__(self, stop_event):
+        super().__init__(stop_event, "soak", "soak_", "", "", 0, "soak")
+
+
+class Helper:
+    pass
+"""
+
+
+class SuiteRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir.name)                             # Registry cache is written relative to cwd
+        self.suite_dir = os.path.join(self.tmp_dir.name, "lab_suites")
+        os.makedirs(self.suite_dir)
+        for file_name, content in (("__init__.py", ""), ("base_qt.py", BASE_QT), ("soak.py", SOAK)):
+            with open(os.path.join(self.suite_dir, file_name), "w") as file:
+                file.write(content)
+        SuiteRegistry.registry = None
+
+    def tearDown(self):
+        SuiteRegistry.registry = None
+        for module in [name for name in sys.modules if name.split(".")[0] == "lab_suites"]:
+            del sys.modules[module]
+        if self.tmp_dir.name in sys.path:
+            sys.path.remove(self.tmp_dir.name)
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
+    def registry(self):
+        return SuiteRegistry(CancellationToken(), self.suite_dir)
+
+    def test_subclass_chain_across_modules(self):
+        self.assertEqual(self.registry().find("soak"), ("soak", "Soak"))
+        self.assertEqual(self.registry().find("lab_qt_suite"), ("base_qt", "LabQtSuite"))
+        self.assertIsNone(self.registry().find("helper"))
+        self.assertNotIn("lab_suites.base_qt", sys.modules)    # Found w/o importing anything
+
+    def test_cache_reload(self):
+        self.registry().find("soak")
+        SuiteRegistry.registry = None                           # New process: registry read from the cache
+        with open(Paths.SUITE_REGISTRY.value, "r") as file:
+            cached = json.load(file)
+        self.assertEqual(cached["version"], SuiteRegistry.VERSION)
+        self.assertEqual(cached["files"]["soak.py"]["classes"], [["Soak", ["LabQtSuite"]], ["Helper", []]])
+        self.assertEqual(self.registry().find("soak"), ("soak", "Soak"))
+
+    def test_old_cache_discarded(self):
+        stat = os.stat(os.path.join(self.suite_dir, "soak.py"))
+        with open(Paths.SUITE_REGISTRY.value, "w") as file:     # Older format, Soak missed by an earlier scan
+            json.dump({"files": {"soak.py": {"mtime": stat.st_mtime_ns, "size": stat.st_size, "classes": []}}}, file)
+        self.assertEqual(self.registry().find("soak"), ("soak", "Soak"))
+
+    def test_get_class_imports_on_first_use(self):
+        sys.path.insert(0, self.tmp_dir.name)
+        suite_class = self.registry().get_class("soak")
+        self.assertEqual(suite_class.__name__, "Soak")
+        self.assertTrue(issubclass(suite_class, AutoTestFramework))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,7 +10,7 @@ Cr. Date:   10/30/2024
 """
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
-from ui_framework import UiFramework
+from ui_framework import UiFramework, VirtualChecklist
 
 
 class AutoTestApp(UiFramework):
@@ -20,9 +20,9 @@ class AutoTestApp(UiFramework):
         try:
             self.setup_ui()                                                             # Setup UI
             self.app_window(self.gui.APP_TITLE, self.gui.APP_ICON, self.gui.APP_SIZE)   # Setup Window
-            self.frames[self.gui.MAIN] = self.create_main_page()                        # Init pages
-            self.frames[self.gui.BASIC] = self.create_basic_tests_page()
-            self.frames[self.gui.SCRIPTED] = self.create_scripted_tests_page()
+            self.pages = {self.gui.MAIN: self.create_main_page,                         # Pages built on 1st show
+                          self.gui.BASIC: self.create_basic_tests_page,
+                          self.gui.SCRIPTED: self.create_scripted_tests_page}
             self.show_frame(self.gui.MAIN)                                              # First Frame to open
         except Exception as e:
             print(f"AutoTestApp Initialization error: {e}")
@@ -54,7 +54,9 @@ class AutoTestApp(UiFramework):
         self.status_text = self.create_scroll_txt_wid(frame=status_frame)                       # Scrolled Text Widget
 
     def show_frame(self, frame_name):
-        """ Show a specific frame and hide others """
+        """ Show a specific frame and hide others (frame built on its first show, then cached) """
+        if frame_name not in self.frames:
+            self.frames[frame_name] = self.pages[frame_name]()
         for frame in self.frames.values():
             frame.pack_forget()
         self.frames[frame_name].pack(fill="both", expand=True)
@@ -77,9 +79,11 @@ class AutoTestApp(UiFramework):
         """
         info_btn_frame = self.create_frame(parent=frame)  # Frame
         self.connect_btn = self.create_button2(frame=info_btn_frame, text=self.gui.CONN_MSG,            # Connect Button
-                                               cmd1=self.connect_ts.connect, cmd2=self.update_ip_table, side=LEFT)
+                                               cmd1=lambda: self.connect_ts.connect(), cmd2=self.update_ip_table,
+                                               side=LEFT)
         self.get_versions_btn = self.create_button2(frame=info_btn_frame, text=self.gui.FW_MSG,         # Get FW Button
-                                                    cmd1=self.get_fw.get_fw_versions, cmd2=self.update_fw_table)
+                                                    cmd1=lambda: self.get_fw.get_fw_versions(),
+                                                    cmd2=self.update_fw_table)
         info_frame = self.create_frame(parent=frame, fill=None, pady=0)  # Frame
         self.ip_table = self.create_ip_table(info_frame, self.inst_info)                                # IP Table
         self.fw_ver_table = self.create_fw_table(info_frame, self.inst_info)                            # FW Ver Table
@@ -116,8 +120,8 @@ class AutoTestApp(UiFramework):
         # Create the list of test variables using the Enum members, excluding any None entries
         self.test_vars = [tv for tc in self.tests if (tv := self.create_test_var(tc)) is not None]
 
-        for var, text, _ in self.test_vars:                             # Test Selection using test_vars Tuples list
-            self.create_checkbutton(frame=ts_frame, text=text, variable=var)
+        # Test Selection using test_vars Tuples list (only the rows in view are widgets)
+        self.test_list = VirtualChecklist(ts_frame, self.test_vars)
 
         """
         -------------------------------------------------------------------------------
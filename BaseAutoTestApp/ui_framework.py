@@ -15,29 +15,194 @@ import ttkbootstrap as tb
 from tkinter.scrolledtext import ScrolledText
 from collections import deque
 import threading
-import time
-from autotest_framework import AutoTestFramework, Printing
-from constants import GuiElements, TestCases, Flags, InstrumentInfo
-from test_suites.connect import Connect, FwVersions
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from autotest_framework import (AutoTestFramework, Printing, TestSuiteBatchGeneration, TestScheduler,
+                                CancellationToken, LogCatalog, ResultStore, SuiteRegistry)
+from constants import GuiElements, Paths, TestCases, Flags, InstrumentInfo, InstrumentPool
+
+
+class UiEventBus:
+    """
+    Event Bus Class used to hand UI updates from worker threads over to the Tk main loop
+    Class in Charge of:
+        - Queueing status lines & UI calls posted from any thread (Tk widgets are only touched on the main thread)
+        - Draining the queue on a root.after timer, coalescing consecutive status lines into 1 insert
+    """
+    def __init__(self, root, write_status, poll_ms=None, drain_max=None):
+        self.root = root                                                        # Local Variables
+        self.write_status = write_status                                        # Main thread status writer
+        self.poll_ms = poll_ms or GuiElements.UI_POLL_MS
+        self.drain_max = drain_max or GuiElements.UI_DRAIN_MAX
+        self.events = queue.SimpleQueue()
+        self.after_id = None
+
+    def start(self):                                                            # Start draining on the main loop
+        self.after_id = self.root.after(self.poll_ms, self.drain)
+
+    def stop(self):                                                             # Stop draining
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+    def post_status(self, message):                                             # Queue a status line (any thread)
+        self.events.put(("status", message))
+
+    def post_call(self, func, *args):                                           # Queue a UI call (any thread)
+        self.events.put(("call", (func, args)))
+
+    def flush_status(self, lines):                                              # Write queued lines at once
+        if lines:
+            self.write_status("\n".join(lines) + "\n")
+
+    def drain(self):
+        """ Handles up to drain_max queued events in post order, then re-arms the timer """
+        lines = []
+        try:
+            for _ in range(self.drain_max):
+                try:
+                    kind, payload = self.events.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "status":
+                    lines.append(payload)
+                    continue
+                self.flush_status(lines)                                        # Keep lines before the call
+                lines = []
+                func, args = payload
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"UI event {getattr(func, '__name__', func)} error: {e}")
+            self.flush_status(lines)
+        finally:
+            self.after_id = self.root.after(self.poll_ms, self.drain)
+
+
+class StatusConsole:
+    """
+    Status Console Class used to keep the status ScrolledText bounded over long runs
+    Class in Charge of:
+        - Keeping the last max_lines status lines (ring buffer) & only those in the widget
+        - Spilling every status line to the log file on disk
+    Insert cost & memory stay flat no matter how long the run is.
+    """
+    def __init__(self, widget, max_lines=None, log_file=None):
+        self.widget = widget                                                    # Local Variables
+        self.max_lines = max_lines or GuiElements.STATUS_MAX_LINES
+        self.log_file = log_file or Paths.STATUS_LOG.value
+        self.lines = deque(maxlen=self.max_lines)                               # Ring buffer of shown lines
+        self.rendered = 0                                                       # Lines currently in widget
+        self.log = None
+
+    def spill(self, text):                                                      # Append to log file on disk
+        try:
+            if self.log is None:
+                self.log = open(self.log_file, "a", encoding="utf-8")
+            self.log.write(text)
+            self.log.flush()
+        except OSError as e:
+            print(f"Status log error: {e}")
+
+    def write(self, text):
+        """ Writes status text (1 or more \n terminated lines) & trims the widget to max_lines """
+        self.spill(text)
+        new_lines = text.splitlines()
+        self.lines.extend(new_lines)
+        if len(new_lines) >= self.max_lines:                                    # Whole window replaced
+            self.widget.delete("1.0", tk.END)
+            self.widget.insert(tk.END, "\n".join(self.lines) + "\n")
+            self.rendered = len(self.lines)
+        else:
+            self.widget.insert(tk.END, text)
+            self.rendered += len(new_lines)
+            excess = self.rendered - self.max_lines
+            if excess > 0:                                                      # Drop oldest lines
+                self.widget.delete("1.0", f"{excess + 1}.0")
+                self.rendered = self.max_lines
+        self.widget.see(tk.END)
+
+    def close(self):                                                            # Close log file
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+
+class VirtualChecklist:
+    """
+    Virtual Checklist Class used to show a long list of checkbuttons w/ a fixed pool of widgets
+    Class in Charge of:
+        - Building only `rows` checkbuttons (the visible window), whatever the number of items
+        - Pointing the pool at the items in view (text & variable) when scrolled (scrollbar or mouse wheel)
+    """
+    def __init__(self, frame, items, rows=None):
+        self.items = items                                                      # Local Variables ((var, text, ...))
+        self.rows = min(rows or GuiElements.TEST_LIST_ROWS, len(items))
+        self.offset = 0                                                         # Index of 1st item in view
+
+        list_frame = tb.Frame(frame)                                            # Frames
+        list_frame.pack(fill=tk.X)
+        self.scrollbar = tb.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.on_scroll)
+        if len(items) > self.rows:
+            self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        rows_frame = tb.Frame(list_frame)
+        rows_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.checkbuttons = [UiFramework.create_checkbutton(frame=rows_frame) for _ in range(self.rows)]
+        for widget in [rows_frame, *self.checkbuttons]:
+            widget.bind("<MouseWheel>", self.on_wheel)                          # Windows
+            widget.bind("<Button-4>", lambda event: self.scroll_to(self.offset - 1))     # X11
+            widget.bind("<Button-5>", lambda event: self.scroll_to(self.offset + 1))
+        self.render()
+
+    def render(self):                                                           # Point pool at items in view
+        for row, checkbutton in enumerate(self.checkbuttons):
+            var, text = self.items[self.offset + row][:2]
+            checkbutton.config(text=text, variable=var)
+        if self.items:
+            self.scrollbar.set(self.offset / len(self.items), (self.offset + self.rows) / len(self.items))
+
+    def scroll_to(self, offset):
+        offset = max(0, min(offset, len(self.items) - self.rows))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+
+    def on_scroll(self, action, amount, unit=None):                             # Scrollbar command
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.items)))
+        elif action == "scroll":
+            self.scroll_to(self.offset + int(amount) * (self.rows if unit == "pages" else 1))
+
+    def on_wheel(self, event):                                                  # 120 delta per wheel notch
+        self.scroll_to(self.offset - int(event.delta / 120))
 
 
 class UiFramework:
     def __init__(self, root):
         try:
-            self.stop_event = threading.Event()                         # Init stop event for threading
+            self.stop_event = CancellationToken()                       # Init stop event (cancels waits/children)
             self.gui = GuiElements                                      # Init Constants Class
             self.tests = TestCases
             self.flags = Flags
             self.inst_info = InstrumentInfo
             self.frame = AutoTestFramework(self.stop_event)             # Init Test Framework
             self.printing = Printing(self.stop_event)
-            self.connect_ts = Connect(self.stop_event)                  # Init Test Suites
-            self.get_fw = FwVersions(self.stop_event)
+            self.scheduler = TestScheduler(self.stop_event, InstrumentPool.ENDPOINTS)
+            self.suite_registry = SuiteRegistry(self.stop_event)        # Test Suites found in test_suites
         except Exception as e:
             print(f"UiFramework Initialization error: {e}")
             raise                                               # Raise exception to signal initialization failure
         self.root = root
+        self.ui_events = UiEventBus(self.root, self.write_status_text)          # Worker -> main loop UI updates
+        self.ui_events.start()
+        self.ui_pool = ThreadPoolExecutor(max_workers=self.gui.UI_WORKERS,       # Button commands pool
+                                          thread_name_prefix="ui-cmd")
         self.frames = {}                                                        # Init GUI Element variables
+        self.pages = {}                                                         # Page name: builder (1st show)
+        self.suites = {}                                                        # Suite name: instance (1st use)
+        self.suites_lock = threading.Lock()
         self.main_nav_btn = None
         self.basic_nav_btn = None
         self.scripted_nav_btn = None
@@ -51,15 +216,49 @@ class UiFramework:
         self.select_all_btn = None
         self.select_all_cmd = False
         self.test_vars = None
+        self.test_list = None
         self.selected_tests = deque()                                           # Run selected tests in Left Pop order
+        self.selected_cases = []                                                # TestCases of selected tests
+        self.run_results = ResultStore()                                        # Results of the last run
         self.debug_btn = None
         self.jira_btn = None
         self.debug_var = tk.BooleanVar(value=self.flags.DEBUG_MODE)
         self.jira_var = tk.BooleanVar(value=self.flags.JIRA_POSTING)
         self.status_text = None
+        self.status_console = None
         self.run_btn = None
         self.running = False
 
+    """
+    -------------------------------------------------------------------------------
+    Test Suites - Imported & built on first use (keeps App start-up fast)
+    -------------------------------------------------------------------------------
+    """
+    @cached_property
+    def batch_gen(self):
+        return TestSuiteBatchGeneration(self.stop_event)
+
+    def get_suite(self, name):
+        """
+        Returns the Test Suite matching name from test_suites, built on first use
+        :param name: TestCases name or suite class name (Ex: connect, FwVersions)
+        """
+        with self.suites_lock:
+            if name not in self.suites:
+                suite_class = self.suite_registry.get_class(name)
+                if suite_class is None:
+                    raise LookupError(f"No Test Suite found in {self.suite_registry.suite_dir} for {name}")
+                self.suites[name] = suite_class(self.stop_event)
+            return self.suites[name]
+
+    @property
+    def connect_ts(self):
+        return self.get_suite("Connect")
+
+    @property
+    def get_fw(self):
+        return self.get_suite("FwVersions")
+
     """
     -------------------------------------------------------------------------------
     GUI Elements
@@ -91,15 +290,14 @@ class UiFramework:
         button.pack(side=side, padx=padx, pady=pady)
         return button
 
-    @staticmethod
-    def create_button2(frame=None, text=None, cmd1=None, cmd2=None, padx=0, pady=0, side=None):
-        """Special Button creation w/ Text & 2 commands"""
+    def create_button2(self, frame=None, text=None, cmd1=None, cmd2=None, padx=0, pady=0, side=None):
+        """Special Button creation w/ Text & 2 commands (cmd1 on worker pool, then cmd2 on main thread)"""
 
         button = tb.Button(
             frame,
-            text=text,
-            command=lambda: (cmd1(), cmd2())                    # Run cmd1 and cmd2 sequentially
+            text=text
         )
+        button.config(command=lambda: self.run_async(button, cmd1, cmd2))
         button.pack(side=side, padx=padx, pady=pady)
         return button
 
@@ -187,6 +385,8 @@ class UiFramework:
     -------------------------------------------------------------------------------
     """
     def update_fw_table(self):                                              # Update table w/ new firmware versions
+        if self.fw_ver_table is None:                                       # Basic page not built yet
+            return
         self.fw_ver_table.item(self.fw_ver_table.get_children()[0],
                                values=(self.inst_info.main, self.inst_info.camera,
                                        self.inst_info.led, self.inst_info.powermonitor))
@@ -197,31 +397,32 @@ class UiFramework:
                                 f"\n - PowerMonitor: {self.inst_info.powermonitor}")
 
     def update_ip_table(self):                                              # Update table w/ IP Address
+        if self.ip_table is None:                                           # Basic page not built yet
+            return
         self.ip_table.item(self.ip_table.get_children()[0], values=self.inst_info.ip)
         self.update_status_text(f"Instrument IP Address: {self.inst_info.ip}")
 
     def toggle_test_selection(self):                                        # Select All Label & Functionality Toggle
         if self.select_all_cmd:
             # Deselect all
-            for var, _, _ in self.test_vars:
+            for var, _, _, _ in self.test_vars:
                 var.set(0)
             self.select_all_btn.config(text="Select All")
         else:
             # Select all
-            for var, _, _ in self.test_vars:
+            for var, _, _, _ in self.test_vars:
                 var.set(1)
             self.select_all_btn.config(text="Deselect All")
         self.select_all_cmd = not self.select_all_cmd
 
     def create_test_var(self, test_case):
         """Creates a test variable tuple for a given test case Enum member if the first value is an integer."""
-        if isinstance(test_case.value[0], float) and not test_case.value[0].is_integer():
+        if not test_case.is_runnable():
             return None                                 # Exclude cases where the first value is a non-integer float
 
-        test_name = test_case.name                                  # Get the name of the Enum member
+        test_name = test_case.name                                  # Get the name of the Enum member (suite name)
         test_display_name = test_case.value[1]                      # Access the display name from the Enum
-        run_func = getattr(self, f"{test_name}_ts").run
-        return IntVar(), f"{test_case.value[0]} : {test_display_name}", run_func
+        return IntVar(), f"{test_case.value[0]} : {test_display_name}", test_name, test_case
 
     def toggle_debug_mode(self):                                            # Update DEBUG_MODE w/ checkbox state
         self.flags.DEBUG_MODE = self.debug_var.get()
@@ -230,24 +431,60 @@ class UiFramework:
         self.flags.JIRA_POSTING = self.jira_var.get()
 
     def update_status_text(self, message):                                  # Updates Status Messages in GUI
-        self.status_text.insert(tb.END, message + "\n")
-        self.status_text.see(tb.END)
+        self.ui_events.post_status(message)                                 # Safe from any thread
+
+    def write_status_text(self, text):                                      # Main thread only (UiEventBus)
+        if self.status_console is None:
+            self.status_console = StatusConsole(self.status_text)
+        self.status_console.write(text)
+
+    def run_async(self, button, cmd, done_cmd=None):
+        """
+        Runs cmd on the UI worker pool while button shows it is busy, then done_cmd on the main thread
+        :param button: Button disabled (label + BUSY_MSG) until cmd is done
+        :param cmd: Blocking command (Ex: instrument round trip)
+        :param done_cmd: UI update run on the main thread once cmd succeeded (Ex: update_ip_table)
+        """
+        text = button.cget("text")
+        button.config(state=tk.DISABLED, text=text + self.gui.BUSY_MSG)
+        future = self.ui_pool.submit(cmd)
+        future.add_done_callback(lambda done: self.ui_events.post_call(self.async_done, button, text, done, done_cmd))
+
+    def async_done(self, button, text, future, done_cmd):                   # Main thread end of run_async
+        button.config(state=tk.NORMAL, text=text)
+        error = future.exception()
+        if error is not None:
+            self.update_status_text(f"{text} failed: {error}")
+        elif done_cmd is not None:
+            done_cmd()
 
     def run_btn_label_update(self, button):                                 # Update Start/Stop Run Button Label
-        button.config(text="Stop" if self.running else "Run")
+        self.ui_events.post_call(button.config, {"text": "Stop" if self.running else "Run"})
 
     def run_tests(self):                                                    # Run Selected Tests
+        self.run_results = ResultStore()                                # Fresh results for every run
         try:
+            self.batch_gen.run(self.selected_cases, self.run_results)   # Generate all selected .tst files once
+            if len(self.scheduler.endpoints) > 1:                       # Spread tests across instrument pool
+                suite_classes = [type(test_func.__self__) for test_func in self.selected_tests]
+                self.selected_tests.clear()
+                self.update_status_text(f"Running {len(suite_classes)} Test Suite(s) "
+                                        f"on {len(self.scheduler.endpoints)} instruments")
+                runs = self.scheduler.run(suite_classes, self.run_results)
+                self.update_status_text(self.scheduler.format_report(runs))
             while self.selected_tests and not self.stop_event.is_set():  # Confirm threading stop_event isn't set
                 test_func = self.selected_tests.popleft()                # Execute selected test starting Left
+                self.scheduler.bind_instrument(test_func.__self__, self.inst_info, self.run_results)
                 self.update_status_text(f"Running Test Suite: {test_func.__self__.__class__.__name__}")
                 result = test_func()
-                if not result:
+                if self.stop_event.is_set():
+                    self.update_status_text("\tTest Run Cancelled!")
+                    break
+                elif not result:
                     self.update_status_text("\tTest Run Failed!")
                     break
                 else:
                     self.update_status_text("\tTest Run Successfully!")
-                time.sleep(1)                                            # stop_event checked every 1s
         except Exception as e:
             self.update_status_text(f"Error running tests: {e}")
         finally:
@@ -255,20 +492,27 @@ class UiFramework:
             self.run_btn_label_update(self.run_btn)                     # Update run_button
             self.printing.tests_exec_print(1)                           # Print completion of Auto-Test
             self.update_status_text("\nAll Test Suites Completed.")
-            results = str(self.printing.print_results())                # Print out results (Terminal & Status Box)
+            results = str(self.printing.print_results(self.selected_cases, self.run_results))  # Terminal & Status
             self.update_status_text(f"{results}")
+            LogCatalog(self.stop_event).archive_if_due()               # Log maintenance between runs
 
     def run_button_cmd(self):                                               # Run Button Click Handling
         if self.running:                                # Clicked when test running
-            self.stop_event.set()                       # Signal threading stop event
+            self.stop_event.set()                       # Signal stop (waits return, Qt child killed)
             self.running = False                        # Reset running flag
             self.run_btn_label_update(self.run_btn)     # Update run_button
         else:
-            for var, _, test_func in self.test_vars:                # Add selected test to the Right of deque
+            self.stop_event.clear()                         # Before building suites (their cancel hooks see a new run)
+            self.selected_cases = []
+            for var, _, suite_name, test_case in self.test_vars:    # Add selected test to the Right of deque
                 if var.get() == 1:
-                    self.selected_tests.append(test_func)
+                    try:
+                        self.selected_tests.append(self.get_suite(suite_name).run)   # Suite built when selected
+                    except (LookupError, ImportError) as e:
+                        self.update_status_text(f"Skipping {test_case.value[1]}: {e}")
+                        continue
+                    self.selected_cases.append(test_case)
             if self.selected_tests:                                 # Run all Selected Tests
-                self.stop_event.clear()                             # Clear threading stop event
                 self.running = True                                 # Set running flag
                 self.run_btn_label_update(self.run_btn)             # Update run_button
                 self.printing.tests_exec_print(0)                   # Print Start of Auto-Test
@@ -279,3 +523,6 @@ class UiFramework:
 
     def run(self):                                                          # Start Tkinter main loop
         self.root.mainloop()
+        self.ui_pool.shutdown(wait=False, cancel_futures=True)
+        if self.status_console is not None:
+            self.status_console.close()